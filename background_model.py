@@ -0,0 +1,222 @@
+import abc
+import collections
+import glob
+import os
+import secrets
+import threading
+import time
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: exited workers' files are still read, just never taken over
+    fcntl = None
+
+class BackgroundModel(abc.ABC):
+    """
+    A model fed through a queue by requests and snapshotted per worker process
+    
+    Requests only append to a pending queue; a thread started in each worker
+    process on its first record folds the queue in every FLUSH_SECONDS and
+    writes the worker's own .npz snapshot file to directory every
+    snapshot_interval seconds. Subclasses implement _fold, _snapshot_arrays
+    and _adopt.
+    
+    Snapshot files are named by pid and a random token, so a restart that
+    reuses a pid never mistakes an earlier run's file for its own. Each
+    worker holds a lock on a .lock file of the same name while it runs, and
+    when its thread starts it merges the snapshots whose lock is free (their
+    process has exited) into its own data and deletes them, so there is
+    about one file per live worker. A process that never records, such as a
+    server master that preloads the app, owns no file and adopts nothing.
+    """
+    
+    FLUSH_SECONDS = 1.0
+    # Records queued beyond this between flushes are dropped and counted
+    MAX_PENDING = 100000
+    # Snapshot files are named <PREFIX>-<pid>-<token>.npz
+    PREFIX = "snapshot"
+    
+    def __init__(self, directory: Optional[str] = None, snapshot_interval: float = 300.0):
+        """Initialize the queue; without a directory nothing is snapshotted"""
+        self.directory = directory
+        self.snapshot_interval = snapshot_interval
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._token: Optional[str] = None
+        self._lock_fd: Optional[int] = None
+        self._dirty = False
+        self._snapshotted_at = time.monotonic()
+        self.recorded = 0
+        self.dropped = 0
+        self.snapshots = 0
+        self.errors = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def _enqueue(self, item: Any):
+        """Append a record to the pending queue, starting this process's flush thread if needed"""
+        if len(self._pending) >= self.MAX_PENDING:
+            self.dropped += 1
+            return
+        self._pending.append(item)
+        self.recorded += 1
+        # Threads and file locks do not survive a fork, so each worker starts its own
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._start()
+    
+    def _start(self):
+        """Take a snapshot name and its lock for this process and start the flush thread"""
+        if self._lock_fd is not None:
+            # Inherited from the parent, whose lock stays held through its own copy
+            os.close(self._lock_fd)
+            self._lock_fd = None
+        self._pid = os.getpid()
+        self._token = f"{self._pid}-{secrets.token_hex(4)}"
+        if self.directory and fcntl is not None:
+            try:
+                path = self._lock_path(self.snapshot_path)
+                temp_path = f"{path}.tmp"
+                fd = os.open(temp_path, os.O_CREAT | os.O_RDWR, 0o644)
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                # Appears already locked, so no other worker takes this process for exited
+                os.replace(temp_path, path)
+                self._lock_fd = fd
+            except OSError:
+                self.errors += 1
+        threading.Thread(target=self._run, daemon=True).start()
+    
+    def _run(self):
+        """Take over exited workers' snapshots, then flush periodically and snapshot when due"""
+        try:
+            self.adopt_exited()
+        except Exception:
+            self.errors += 1
+        while True:
+            time.sleep(self.FLUSH_SECONDS)
+            try:
+                self.flush()
+                if self.directory and time.monotonic() - self._snapshotted_at >= self.snapshot_interval:
+                    self._snapshot_due()
+                    self._snapshotted_at = time.monotonic()
+            except Exception:
+                self.errors += 1
+    
+    def _snapshot_due(self):
+        """Periodic work of the flush thread, run every snapshot_interval seconds"""
+        if self._dirty:
+            self.snapshot()
+    
+    def flush(self):
+        """Fold the pending records into the model"""
+        with self._lock:
+            items = []
+            while self._pending:
+                items.append(self._pending.popleft())
+            self._fold(items)
+    
+    @abc.abstractmethod
+    def _fold(self, items: List[Any]):
+        """Add queued records to the model, called with the lock held; sets _dirty if anything changed"""
+    
+    @abc.abstractmethod
+    def _snapshot_arrays(self) -> Dict[str, np.ndarray]:
+        """Arrays of this worker's own data to save, called with the lock held"""
+    
+    @abc.abstractmethod
+    def _adopt(self, path: str):
+        """Add an exited worker's snapshot file into this worker's own data, called with the lock held"""
+    
+    @property
+    def snapshot_path(self) -> Optional[str]:
+        """Snapshot file of this process, or None until it records something"""
+        if not self.directory or self._pid != os.getpid():
+            return None
+        return os.path.join(self.directory, f"{self.PREFIX}-{self._token}.npz")
+    
+    @staticmethod
+    def _lock_path(path: str) -> str:
+        """Lock file held by the process that owns a snapshot file"""
+        return path[:-len(".npz")] + ".lock"
+    
+    def snapshot(self) -> bool:
+        """Write this worker's data to its snapshot file; False if this process has recorded nothing"""
+        self.flush()
+        path = self.snapshot_path
+        if path is None:
+            return False
+        with self._lock:
+            arrays = self._snapshot_arrays()
+            self._dirty = False
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        # Written aside and renamed, so readers never see a partial file
+        with open(temp_path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(temp_path, path)
+        self.snapshots += 1
+        return True
+    
+    def other_files(self) -> List[str]:
+        """Snapshot files of every other worker, past or present"""
+        own = self.snapshot_path
+        return [path for path in glob.glob(os.path.join(self.directory, f"{self.PREFIX}-*.npz")) if path != own]
+    
+    def adopt_exited(self) -> int:
+        """Merge the snapshots of exited workers into this worker's data and delete them, returning how many"""
+        if self.snapshot_path is None or fcntl is None:
+            return 0
+        claimed = []
+        for path in self.other_files():
+            if not self._exited(self._lock_path(path)):
+                continue
+            claim_path = f"{path}.{self._token}.claim"
+            try:
+                # Only one worker can win the rename
+                os.rename(path, claim_path)
+            except OSError:
+                continue
+            try:
+                with self._lock:
+                    self._adopt(claim_path)
+            except (OSError, ValueError, KeyError):
+                self.errors += 1
+                os.replace(claim_path, path)
+                continue
+            claimed.append(claim_path)
+        
+        if claimed:
+            with self._lock:
+                self._dirty = True
+            # Saved before the claims go, so the counts are never missing from disk
+            self.snapshot()
+            for claim_path in claimed:
+                os.remove(claim_path)
+        # Locks of workers that exited before their first snapshot
+        for lock_path in glob.glob(os.path.join(self.directory, f"{self.PREFIX}-*.lock")):
+            if not os.path.exists(lock_path[:-len(".lock")] + ".npz") and self._exited(lock_path):
+                try:
+                    os.remove(lock_path)
+                except FileNotFoundError:
+                    pass
+        return len(claimed)
+    
+    @staticmethod
+    def _exited(lock_path: str) -> bool:
+        """Whether the process owning a lock file has exited (files from before locking count as exited)"""
+        try:
+            fd = os.open(lock_path, os.O_RDWR)
+        except FileNotFoundError:
+            return True
+        except OSError:
+            return False
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        finally:
+            os.close(fd)
+        return True
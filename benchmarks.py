@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Skill Recommender
+
+    python benchmarks.py pdf            # sequential vs parallel PDF page extraction
+    python benchmarks.py docx           # streaming XML vs python-docx DOCX extraction
+    python benchmarks.py taxonomy       # taxonomy memory and extraction latency at 1k-100k skills
+    python benchmarks.py startup        # import-time report and cold start to the first request
+    python benchmarks.py sections       # NER over relevant resume sections vs the whole resume
+    python benchmarks.py all
+
+Each benchmark builds its own synthetic inputs, so no fixtures are needed.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Callable, List
+
+RESUME_LINES = [
+    "Senior Software Engineer with 6 years of python and 4 years of docker",
+    "Built microservices with FastAPI, PostgreSQL, Redis and Kubernetes on AWS",
+    "Led machine learning projects using PyTorch, scikit-learn and pandas",
+    "Experience with React, TypeScript, GraphQL and CI/CD pipelines in Jenkins",
+]
+
+def timed(func: Callable, repeat: int = 3) -> float:
+    """Best wall-clock time of several runs, in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def make_pdf(page_count: int, lines_per_page: int = 40) -> bytes:
+    """Build a simple text-only PDF with the given number of pages"""
+    objects: List[bytes] = []
+    page_ids = [4 + 2 * i for i in range(page_count)]
+    
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    
+    for page in range(page_count):
+        lines = [f"Page {page + 1}: {RESUME_LINES[(page + i) % len(RESUME_LINES)]}" for i in range(lines_per_page)]
+        stream = "BT /F1 9 Tf 40 800 Td 11 TL " + " ".join(f"({line}) '" for line in lines) + " ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_ids[page] + 1} 0 R >>".encode()
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream".encode())
+    
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    output += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    return bytes(output)
+
+def bench_pdf(args):
+    """Sequential vs parallel per-page PDF extraction, and early stopping"""
+    from text_extraction import extract_text_from_pdf
+    
+    workers = args.workers or os.cpu_count() or 1
+    print(f"PDF page extraction ({workers} workers)")
+    print(f"{'pages':>6} {'sequential ms':>14} {'parallel ms':>12} {'speedup':>8} {'first 20k chars ms':>19}")
+    
+    # Warm the process pool so its start-up cost is not charged to the first run
+    extract_text_from_pdf(make_pdf(2), parallel_threshold=1, max_workers=workers)
+    
+    for page_count in (10, 100, 500):
+        content = make_pdf(page_count)
+        sequential = timed(lambda: extract_text_from_pdf(content, parallel_threshold=10 ** 9))
+        parallel = timed(lambda: extract_text_from_pdf(content, parallel_threshold=1, max_workers=workers))
+        early = timed(lambda: extract_text_from_pdf(content, max_chars=20000, max_workers=workers))
+        print(f"{page_count:>6} {sequential:>14.1f} {parallel:>12.1f} {sequential / parallel:>7.2f}x {early:>19.1f}")
+
+def make_docx(paragraph_count: int, table_rows: int = 0) -> bytes:
+    """Build a DOCX with the given number of paragraphs and a skills table"""
+    import io
+    from docx import Document
+    
+    document = Document()
+    for i in range(paragraph_count):
+        document.add_paragraph(RESUME_LINES[i % len(RESUME_LINES)])
+    if table_rows:
+        table = document.add_table(rows=table_rows, cols=3)
+        for row in range(table_rows):
+            for col in range(3):
+                table.cell(row, col).text = RESUME_LINES[(row + col) % len(RESUME_LINES)]
+    
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+def bench_docx(args):
+    """Streaming document.xml extraction vs the python-docx object model"""
+    import io
+    import tracemalloc
+    from docx import Document
+    from text_extraction import extract_text_from_docx_xml
+    
+    def python_docx(content: bytes) -> str:
+        doc = Document(io.BytesIO(content))
+        parts = [paragraph.text + "\n" for paragraph in doc.paragraphs]
+        for table in doc.tables:
+            for row in table.rows:
+                parts.extend(cell.text + "\n" for cell in row.cells)
+        return "".join(parts)
+    
+    def peak_kb(func: Callable) -> float:
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak / 1024
+    
+    print("DOCX text extraction")
+    print(f"{'paragraphs':>10} {'table rows':>10} {'python-docx ms':>15} {'streaming ms':>13} {'speedup':>8} "
+          f"{'python-docx KB':>15} {'streaming KB':>13}")
+    for paragraph_count, table_rows in ((50, 10), (500, 100), (5000, 500)):
+        content = make_docx(paragraph_count, table_rows)
+        full = timed(lambda: python_docx(content))
+        streaming = timed(lambda: extract_text_from_docx_xml(content))
+        full_kb = peak_kb(lambda: python_docx(content))
+        streaming_kb = peak_kb(lambda: extract_text_from_docx_xml(content))
+        print(f"{paragraph_count:>10} {table_rows:>10} {full:>15.1f} {streaming:>13.1f} {full / streaming:>7.2f}x "
+              f"{full_kb:>15.0f} {streaming_kb:>13.0f}")
+
+def make_taxonomy(path: str, skill_count: int, aliases_per_skill: int = 4):
+    """Write a synthetic taxonomy JSON file with multi-word skills, synonyms and categories"""
+    import json
+    import random
+    
+    rng = random.Random(skill_count)
+    syllables = ["ka", "lo", "mi", "ter", "ra", "py", "dex", "no", "va", "zu", "qu", "sig", "net", "ops", "data"]
+    
+    def word() -> str:
+        return "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+    
+    categories = [{"id": f"c{i}", "name": f"category {i}", "parent": f"c{i // 10}" if i >= 10 else None}
+                  for i in range(max(10, skill_count // 100))]
+    skills = [
+        {
+            "id": f"s{i}",
+            "name": " ".join(word() for _ in range(rng.randint(1, 3))),
+            "aliases": [" ".join(word() for _ in range(rng.randint(1, 4))) for _ in range(aliases_per_skill)],
+            "category": rng.choice(categories)["id"],
+        }
+        for i in range(skill_count)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"categories": categories, "skills": skills}, f)
+
+def bench_taxonomy(args):
+    """Taxonomy load time, memory and extraction latency as the vocabulary grows"""
+    import gc
+    import tempfile
+    import tracemalloc
+    from skill_taxonomy import SkillTaxonomy
+    
+    text = "\n".join(RESUME_LINES * 25)
+    print(f"Skill taxonomy ({len(text)} character resume)")
+    print(f"{'skills':>7} {'aliases':>8} {'load ms':>8} {'memory MB':>10} {'extract ms':>11} {'linear scan ms':>15}")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for skill_count in (1_000, 10_000, 100_000):
+            path = os.path.join(tmp, f"taxonomy-{skill_count}.json")
+            make_taxonomy(path, skill_count)
+            
+            load_ms = timed(lambda: SkillTaxonomy.load(path), repeat=1)
+            
+            # Memory still held once loading is done, i.e. the taxonomy itself
+            gc.collect()
+            tracemalloc.start()
+            taxonomy = SkillTaxonomy.load(path)
+            memory_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+            tracemalloc.stop()
+            
+            text_lower = text.lower()
+            extract = timed(lambda: taxonomy.find_in_text(text_lower))
+            # What matching costs when every skill name is searched for in turn
+            linear = timed(lambda: [name for name in taxonomy.names if name in text_lower], repeat=1)
+            print(f"{skill_count:>7} {len(taxonomy.aliases):>8} {load_ms:>8.0f} {memory_mb:>10.1f} "
+                  f"{extract:>11.2f} {linear:>15.1f}")
+
+def make_resume(scale: int = 1) -> str:
+    """Build a sectioned resume whose body sections repeat scale times"""
+    def block(lines: List[str], count: int) -> str:
+        return "\n".join(lines[i % len(lines)] for i in range(count * scale))
+    
+    return "\n".join([
+        "Jane Smith",
+        "221B Baker Street, London, United Kingdom | jane.smith@example.com | +44 20 7946 0000",
+        "",
+        "SUMMARY",
+        block(RESUME_LINES[:2], 2),
+        "",
+        "EXPERIENCE",
+        block(RESUME_LINES, 16),
+        "",
+        "TECHNICAL SKILLS",
+        "Languages: Python, TypeScript, SQL, Go",
+        "Tools: Docker, Kubernetes, Terraform, Jenkins",
+        "",
+        "PROJECTS",
+        block(RESUME_LINES[2:], 4),
+        "",
+        "EDUCATION",
+        block([
+            "MSc Computer Science, University of Edinburgh, Scotland, 2014 - 2015",
+            "BSc Mathematics, University College London, England, 2011 - 2014",
+            "Exchange semester at ETH Zurich, Switzerland, and Sorbonne University, Paris, France",
+        ], 6),
+        "",
+        "PUBLICATIONS",
+        block([
+            "Smith J., Chen L. Scalable Feature Stores. Proceedings of VLDB, Sydney, Australia, 2021",
+            "Smith J. et al. Streaming Joins at Google and Microsoft. ACM SIGMOD, Portland, Oregon, 2020",
+        ], 12),
+        "",
+        "REFERENCES",
+        block([
+            "Dr. Alan Turing, Head of Research, Bletchley Analytics Ltd, Milton Keynes, United Kingdom",
+            "Grace Hopper, Engineering Director, Navy Systems Inc, Arlington, Virginia, USA",
+        ], 4),
+        "",
+        "INTERESTS",
+        "Marathon running in Berlin and Boston, chess, volunteering at Code Club UK",
+    ])
+
+def ner_pipeline():
+    """SpaCy's small English model, or a blank pipeline with an untrained NER component of the same cost"""
+    import spacy
+    try:
+        return spacy.load("en_core_web_sm"), "en_core_web_sm"
+    except OSError:
+        nlp = spacy.blank("en")
+        ner = nlp.add_pipe("ner")
+        for label in ("ORG", "PRODUCT", "GPE"):
+            ner.add_label(label)
+        nlp.initialize()
+        return nlp, "blank pipeline with untrained NER (en_core_web_sm not installed)"
+
+def bench_sections(args):
+    """Section-aware NER vs NER over the whole resume"""
+    import resume_sections
+    from skill_extractor import SkillExtractor
+    
+    extractor = SkillExtractor()
+    extractor.nlp, pipeline = ner_pipeline()
+    everything = (resume_sections.ALL_SECTIONS,)
+    
+    print(f"Section-aware NER ({pipeline})")
+    print(f"{'chars':>7} {'segment ms':>11} {'NER chars':>10} {'whole ms':>9} {'sections ms':>12} {'saved':>6} "
+          f"{'same skills':>12}")
+    for scale in (1, 4, 16):
+        text = make_resume(scale)
+        segment = timed(lambda: resume_sections.segment(text))
+        ner_chars = sum(end - start for start, end in resume_sections.select_spans(text, extractor.ner_sections))
+        whole = timed(lambda: extractor.extract_skills(text, ner_sections=everything))
+        sections = timed(lambda: extractor.extract_skills(text))
+        same = extractor.extract_skills(text, ner_sections=everything) == extractor.extract_skills(text)
+        print(f"{len(text):>7} {segment:>11.2f} {ner_chars / len(text):>9.0%} {whole:>9.1f} {sections:>12.1f} "
+              f"{1 - sections / whole:>5.0%} {str(same):>12}")
+
+# Dependencies that should only be imported on first use, not by `import main`
+LAZY_MODULES = ("spacy", "PyPDF2", "docx", "pyarrow", "charset_normalizer", "requests", "bs4")
+
+COLD_START_SNIPPET = """
+import time
+start = time.perf_counter()
+import main
+from fastapi.testclient import TestClient
+TestClient(main.app).get("/health")
+print(time.perf_counter() - start)
+"""
+
+def import_times(statement: str) -> List[tuple]:
+    """Run a statement under `python -X importtime`; returns (cumulative us, self us, depth, module) rows"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header line
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((int(cumulative_us), int(self_us), depth, name.strip()))
+    return rows
+
+def bench_startup(args):
+    """Import-time report for the API and cold start to the first served request"""
+    rows = import_times("import main")
+    # importtime lists a module after everything it imports, so main's imports directly precede it
+    main_row = next(i for i, row in enumerate(rows) if row[3] == "main" and row[2] == 0)
+    first = main_row
+    while first > 0 and rows[first - 1][2] > 0:
+        first -= 1
+    total = rows[main_row][0]
+    imported = {row[3].split(".")[0] for row in rows[first:main_row]}
+    
+    print(f"Import time of main: {total / 1000:.0f} ms (python -X importtime)")
+    print(f"{'cumulative ms':>14} {'self ms':>8}  module")
+    direct = sorted((row for row in rows[first:main_row] if row[2] == 1), reverse=True)
+    for cumulative_us, self_us, _, name in direct[:15]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>8.1f}  {name}")
+    
+    eager = [name for name in LAZY_MODULES if name in imported]
+    print(f"Lazy dependencies imported eagerly: {', '.join(eager) if eager else 'none'}")
+    
+    cold_starts = []
+    for _ in range(3):
+        result = subprocess.run([sys.executable, "-c", COLD_START_SNIPPET],
+                                cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+        cold_starts.append(float(result.stdout.strip().splitlines()[-1]))
+    print(f"Cold start to first /health response: {min(cold_starts) * 1000:.0f} ms (best of 3)")
+    
+    # The cost moved off the start-up path, paid by the first extraction (or warm_up)
+    from skill_extractor import SkillExtractor
+    extractor = SkillExtractor()
+    start = time.perf_counter()
+    extractor.warm_up()
+    print(f"SpaCy load on first use: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+BENCHMARKS = {
+    "pdf": bench_pdf,
+    "docx": bench_docx,
+    "taxonomy": bench_taxonomy,
+    "startup": bench_startup,
+    "sections": bench_sections,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Skill Recommender benchmarks")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS) + ["all"])
+    parser.add_argument("--workers", type=int, default=0, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+    
+    selected = BENCHMARKS.values() if args.benchmark == "all" else [BENCHMARKS[args.benchmark]]
+    for bench in selected:
+        bench(args)
+        print()
+
+if __name__ == "__main__":
+    main()
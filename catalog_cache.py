@@ -0,0 +1,67 @@
+import hashlib
+from typing import Any, Callable, Dict, Tuple
+from fastapi import Request
+from fastapi.responses import Response
+from serialization import JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPES, PreEncodedPayload, wants_msgpack
+
+# Catalog data only changes on reload, so clients and the CDN may reuse it for a while
+DEFAULT_CACHE_CONTROL = "public, max-age=300"
+
+class CatalogCache:
+    """
+    Pre-encoded catalog responses with content-hash ETags
+    
+    Entries are keyed by name and tagged with the data version they were built
+    from. When the underlying data is reloaded its version changes, so the next
+    request rebuilds the payload and gets a new ETag automatically.
+    """
+    
+    def __init__(self, cache_control: str = DEFAULT_CACHE_CONTROL):
+        """Initialize an empty cache"""
+        self.cache_control = cache_control
+        self._entries: Dict[str, Tuple[str, PreEncodedPayload]] = {}
+    
+    def respond(self, request: Request, name: str, data_version: str, build: Callable[[], Any]) -> Response:
+        """
+        Serve a catalog payload, answering 304 when the client's ETag is current
+        """
+        entry = self._entries.get(name)
+        if entry is None or entry[0] != data_version:
+            entry = (data_version, PreEncodedPayload(build()))
+            self._entries[name] = entry
+        payload = entry[1]
+        
+        media_type = MSGPACK_MEDIA_TYPES[0] if wants_msgpack(request) else JSON_MEDIA_TYPE
+        etag = self._etag(name, data_version, media_type)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept"
+        }
+        
+        if self._matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        
+        return Response(content=payload.encoded(media_type), media_type=media_type, headers=headers)
+    
+    @staticmethod
+    def _etag(name: str, data_version: str, media_type: str) -> str:
+        """Derive a strong ETag from the data version, endpoint and representation"""
+        digest = hashlib.sha256(f"{name}:{data_version}:{media_type}".encode("utf-8")).hexdigest()[:20]
+        return f'"{digest}"'
+    
+    @staticmethod
+    def _matches(if_none_match: str, etag: str) -> bool:
+        """Check an If-None-Match header against the current ETag"""
+        if not if_none_match:
+            return False
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate == "*":
+                return True
+            # Weak comparison, as required for If-None-Match
+            if candidate.startswith("W/"):
+                candidate = candidate[2:]
+            if candidate == etag:
+                return True
+        return False
@@ -0,0 +1,142 @@
+import math
+from typing import Any, Dict, List, Optional
+from roadmap_model import LEVEL_ORDER
+
+class LearningPlanner:
+    """
+    Chooses and orders the roadmap levels to study within a time budget
+    
+    Every missing skill of the target role is an item whose cost is the time
+    needed to study its roadmap up to the target level and whose value is the
+    match percentage the skill adds to the role. A 0/1 knapsack over the
+    budget picks the set of skills with the largest total gain; the chosen
+    skills are then scheduled by gain per week, so the plan front-loads the
+    cheapest improvements. Level durations come pre-parsed from the
+    RoadmapGenerator, so planning does no string parsing.
+    """
+    
+    # Knapsack resolution: durations are rounded up to quarter weeks
+    STEPS_PER_WEEK = 4
+    
+    # Upper bound on the budget, which keeps the knapsack table small
+    MAX_BUDGET_WEEKS = 520
+    
+    def __init__(self, skill_matcher, roadmap_generator):
+        """Initialize the planner over a skill matcher and roadmap generator"""
+        self.skill_matcher = skill_matcher
+        self.roadmap_generator = roadmap_generator
+    
+    def _skill_gains(self, target_role: str, scoring: str) -> Dict[str, float]:
+        """Match percentage each role skill adds when learned"""
+        matcher = self.skill_matcher
+        row = matcher.skill_gain_matrix(scoring)[matcher.role_index[target_role]]
+        return {skill: float(row[index]) for skill, index in matcher.skill_index.items() if row[index] > 0}
+    
+    def plan(self, user_skills: List[str], target_role: str, budget_weeks: float,
+             target_level: str = "intermediate", scoring: str = "standard",
+             skill_years: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Build a learning plan that maximizes match percentage gain within budget_weeks
+        
+        Each chosen skill is studied from the beginner level through target_level,
+        with every level timed at the middle of its duration range.
+        """
+        if target_level not in LEVEL_ORDER:
+            raise ValueError(f"target_level must be one of {', '.join(LEVEL_ORDER)}")
+        if scoring not in ("standard", "weighted"):
+            raise ValueError("scoring must be 'standard' or 'weighted'")
+        if not 0 < budget_weeks <= self.MAX_BUDGET_WEEKS:
+            raise ValueError(f"budget_weeks must be between 0 and {self.MAX_BUDGET_WEEKS}")
+        
+        if scoring == "weighted":
+            match = self.skill_matcher.match_skills_weighted(user_skills, target_role, skill_years)
+        else:
+            match = self.skill_matcher.match_skills(user_skills, target_role)
+        gains = self._skill_gains(target_role, scoring)
+        last_level = LEVEL_ORDER.index(target_level)
+        
+        # One knapsack item per missing skill
+        items = []
+        for gap_type in ("required", "preferred"):
+            for skill in sorted(match["missing_skills"][gap_type]):
+                roadmap_skill, levels = self.roadmap_generator.get_level_weeks(skill)
+                levels = [level for level in levels
+                          if level[0] not in LEVEL_ORDER or LEVEL_ORDER.index(level[0]) <= last_level]
+                weeks = sum((low + high) / 2 for _, _, low, high in levels)
+                items.append({
+                    "skill": skill,
+                    "gap_type": gap_type,
+                    "roadmap": roadmap_skill,
+                    "levels": levels,
+                    "weeks": weeks,
+                    "cost": math.ceil(weeks * self.STEPS_PER_WEEK),
+                    "match_gain": gains.get(skill, 0.0)
+                })
+        
+        chosen = self._knapsack(items, int(budget_weeks * self.STEPS_PER_WEEK))
+        selected = sorted(
+            (items[i] for i in chosen),
+            key=lambda item: (-item["match_gain"] / max(item["weeks"], 1e-9), item["gap_type"] != "required", item["skill"])
+        )
+        
+        plan = []
+        elapsed = 0.0
+        for item in selected:
+            for level, duration, low, high in item["levels"]:
+                weeks = (low + high) / 2
+                plan.append({
+                    "order": len(plan) + 1,
+                    "skill": item["skill"],
+                    "roadmap": item["roadmap"],
+                    "level": level,
+                    "duration": duration,
+                    "start_week": round(elapsed, 2),
+                    "end_week": round(elapsed + weeks, 2)
+                })
+                elapsed += weeks
+        
+        def summary(item: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "skill": item["skill"],
+                "gap_type": item["gap_type"],
+                "weeks": round(item["weeks"], 2),
+                "match_gain": round(item["match_gain"], 2)
+            }
+        
+        total_gain = sum(item["match_gain"] for item in selected)
+        return {
+            "target_role": target_role,
+            "title": match["target_role"],
+            "budget_weeks": budget_weeks,
+            "target_level": target_level,
+            "scoring": scoring,
+            "current_match_percentage": match["overall_match_percentage"],
+            "projected_match_percentage": round(min(100.0, match["overall_match_percentage"] + total_gain), 2),
+            "planned_weeks": round(elapsed, 2),
+            "skills": [summary(item) for item in selected],
+            "plan": plan,
+            "deferred": [summary(item) for i, item in enumerate(items) if i not in chosen]
+        }
+    
+    def _knapsack(self, items: List[Dict[str, Any]], capacity: int) -> set:
+        """Indexes of the items with the largest total gain whose costs fit in capacity, taking the least time on ties"""
+        best = [0.0] * (capacity + 1)
+        taken = []
+        for item in items:
+            cost, gain = item["cost"], item["match_gain"]
+            row = bytearray(capacity + 1)
+            if gain > 0:
+                for c in range(capacity, cost - 1, -1):
+                    if best[c - cost] + gain > best[c]:
+                        best[c] = best[c - cost] + gain
+                        row[c] = 1
+            taken.append(row)
+        
+        # The smallest capacity that reaches the best gain gives the shortest plan
+        c = next(c for c in range(capacity + 1) if best[c] >= best[capacity] - 1e-9)
+        chosen = set()
+        for i in range(len(items) - 1, -1, -1):
+            if taken[i][c]:
+                chosen.add(i)
+                c -= items[i]["cost"]
+        return chosen
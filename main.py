@@ -1,21 +1,31 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
-import uvicorn
+import hashlib
 import json
+import math
 import os
+import sys
+import tempfile
 from typing import List, Dict, Optional
-import PyPDF2
-import io
 from pydantic import BaseModel
-import spacy
-import re
-from skill_extractor import SkillExtractor
+from skill_extractor import SkillExtractor, Deadline, EXTRACTION_MODES
 from skill_matcher import SkillMatcher
 from roadmap_generator import RoadmapGenerator
+from learning_planner import LearningPlanner
+from skill_suggest import SkillSuggester
+import text_extraction
+import resume_sections
+from serialization import FastJSONResponse, negotiated_response
+from catalog_cache import CatalogCache
+from request_coalescing import SingleFlight
+from shared_cache import SharedCache
+from skill_analytics import SkillAnalytics, SkillStream, WEEK_PATTERN
+from skill_cooccurrence import SkillCooccurrence
+from starlette.concurrency import run_in_threadpool
 
-app = FastAPI(title="Skill Recommender API", version="1.0.0")
+app = FastAPI(title="Skill Recommender API", version="1.0.0", default_response_class=FastJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -30,10 +40,112 @@ app.add_middleware(
 if os.path.exists("frontend"):
     app.mount("/static", StaticFiles(directory="frontend"), name="static")
 
-# Initialize components
+# Initialize components; the SpaCy model loads on first use, not at import
 skill_extractor = SkillExtractor()
-skill_matcher = SkillMatcher()
-roadmap_generator = RoadmapGenerator()
+skill_matcher = SkillMatcher(nlp_loader=skill_extractor.warm_up)
+roadmap_generator = RoadmapGenerator(
+    nlp_loader=skill_extractor.warm_up, skill_vocabulary=lambda: skill_matcher.skill_index.keys()
+)
+learning_planner = LearningPlanner(skill_matcher, roadmap_generator)
+
+# Autocomplete over skill names and aliases, ranked by role use and skills seen in uploaded resumes
+skill_suggester = SkillSuggester.from_sources(skill_extractor, skill_matcher)
+
+# Static catalog payloads, encoded once per data version and served with ETags
+catalog_cache = CatalogCache()
+
+# Extracted resume text keyed by content hash; set SKILL_TEXT_CACHE_DIR to share it on disk
+text_cache = text_extraction.TextCache(cache_dir=os.environ.get("SKILL_TEXT_CACHE_DIR"))
+
+# Optional early stop for long PDFs, after PDF_MAX_CHARS characters or PDF_TIME_BUDGET seconds
+pdf_options = {}
+if os.environ.get("PDF_MAX_CHARS"):
+    pdf_options["max_chars"] = int(os.environ["PDF_MAX_CHARS"])
+if os.environ.get("PDF_TIME_BUDGET"):
+    pdf_options["time_budget"] = float(os.environ["PDF_TIME_BUDGET"])
+
+# Identical concurrent requests share one computation; counters are served at /metrics
+extraction_flight = SingleFlight("extract_skills")
+match_flight = SingleFlight("match_skills")
+roadmap_flight = SingleFlight("generate_roadmap")
+
+# Extraction, match and roadmap results shared by all workers on this host (SQLite in WAL mode).
+# SKILL_RESULT_CACHE_PATH moves the database file or, set to "off", disables the cache.
+result_cache_path = os.environ.get(
+    "SKILL_RESULT_CACHE_PATH", os.path.join(tempfile.gettempdir(), "skill_recommender_results.sqlite3")
+)
+result_cache = None
+if result_cache_path.lower() != "off":
+    result_cache = SharedCache(
+        result_cache_path,
+        max_bytes=int(os.environ.get("SKILL_RESULT_CACHE_MB", "256")) * 1024 * 1024,
+        default_ttl=float(os.environ.get("SKILL_RESULT_CACHE_TTL", "3600"))
+    )
+
+def source_digest(module_names: List[str]) -> str:
+    """Hash of the source files of the given loaded modules"""
+    digest = hashlib.sha256()
+    for name in module_names:
+        with open(sys.modules[name].__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+# Prefixed to every shared cache key, so a deploy that changes how results are computed
+# never reads entries written by the previous code
+CODE_VERSION = source_digest([
+    "skill_extractor", "skill_automaton", "skill_taxonomy", "resume_sections", "text_extraction",
+    "skill_matcher", "skill_embeddings", "role_graph", "roadmap_generator", "roadmap_model", "serialization"
+])
+
+# Weekly counts of extracted and missing skills in fixed-size sketches, snapshotted per worker to
+# SKILL_ANALYTICS_DIR; set it to "off" to stop collecting. Served at /analytics.
+analytics_dir = os.environ.get(
+    "SKILL_ANALYTICS_DIR", os.path.join(tempfile.gettempdir(), "skill_recommender_analytics")
+)
+analytics = None
+if analytics_dir.lower() != "off":
+    analytics = SkillAnalytics(
+        analytics_dir,
+        retention_weeks=int(os.environ.get("SKILL_ANALYTICS_RETENTION_WEEKS", "12")),
+        snapshot_interval=float(os.environ.get("SKILL_ANALYTICS_SNAPSHOT_SECONDS", "300"))
+    )
+
+# Which skills appear together in uploaded resumes, learned as they arrive and saved per worker to
+# SKILL_COOCCURRENCE_DIR ("off" disables it). Pairs seen fewer than SKILL_COOCCURRENCE_MIN_COUNT
+# times are not recommended.
+cooccurrence_dir = os.environ.get(
+    "SKILL_COOCCURRENCE_DIR", os.path.join(tempfile.gettempdir(), "skill_recommender_cooccurrence")
+)
+cooccurrence = None
+if cooccurrence_dir.lower() != "off":
+    cooccurrence = SkillCooccurrence(
+        cooccurrence_dir, min_count=int(os.environ.get("SKILL_COOCCURRENCE_MIN_COUNT", "2"))
+    )
+
+def analytics_user(request: Request) -> Optional[str]:
+    """Who sent a request, for distinct-user counts: the X-User-Id header, else the client address"""
+    user = request.headers.get("x-user-id")
+    if user:
+        return user
+    return request.client.host if request.client else None
+
+async def cached_call(flight: SingleFlight, key: tuple, func, *args, cache_key: Optional[tuple] = None,
+                      cache_if=None, **kwargs):
+    """
+    Result of func(*args, **kwargs) from the shared cache, computed on a miss
+    
+    The flight coalesces identical requests within this worker; the shared
+    cache serves results already computed by any worker. Keys must include the
+    data version of every input, and cached results come back as plain JSON
+    types (tuples become lists). cache_key, if given, replaces key in the
+    shared cache, and results cache_if rejects are not stored.
+    """
+    if result_cache is None:
+        return await flight.run(key, func, *args, **kwargs)
+    return await flight.run(
+        key, result_cache.get_or_compute, flight.name, (CODE_VERSION,) + (cache_key if cache_key is not None else key),
+        lambda: func(*args, **kwargs), cache_if=cache_if
+    )
 
 class SkillRecommendation(BaseModel):
     skill: str
@@ -87,93 +199,419 @@ async def health_check():
     return {"status": "healthy"}
 
 @app.post("/upload-resume")
-async def upload_resume(file: UploadFile = File(...)):
+async def upload_resume(
+    request: Request,
+    file: UploadFile = File(...),
+    detailed: bool = Form(False),
+    ner_sections: Optional[str] = Form(None),
+    mode: str = Form("balanced"),
+    deadline_ms: Optional[float] = Form(None)
+):
     """
     Upload and extract skills from resume (PDF or text)
+    
+    Set detailed=true to also get per-skill spans, counts, detection methods
+    and years of experience. ner_sections is a comma-separated list of resume
+    sections SpaCy NER reads (default: summary,skills,experience,projects;
+    "all" for the whole resume); keyword matching always reads everything.
+    
+    mode is fast (keyword automaton only), balanced (keywords, patterns and
+    NER) or thorough (NER over the whole resume plus fuzzy matching). With
+    deadline_ms, methods still pending when the budget runs out are skipped
+    and the response is flagged partial, as it is when PDF_TIME_BUDGET cut
+    the text short.
     """
+    if mode not in EXTRACTION_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of {', '.join(EXTRACTION_MODES)}")
+    if deadline_ms is not None and not (math.isfinite(deadline_ms) and deadline_ms > 0):
+        raise HTTPException(status_code=400, detail="deadline_ms must be a positive number")
+    deadline = Deadline(deadline_ms)
+    try:
+        sections = resume_sections.parse_sections(ner_sections)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
-        # Check file type
-        if not file.filename.lower().endswith(('.pdf', '.txt', '.docx')):
-            raise HTTPException(status_code=400, detail="Only PDF, TXT, and DOCX files are supported")
-        
         # Read file content
         content = await file.read()
         
-        # Extract text based on file type
-        if file.filename.lower().endswith('.pdf'):
-            text = extract_text_from_pdf(content)
-        elif file.filename.lower().endswith('.txt'):
-            text = content.decode('utf-8')
-        else:  # docx
-            text = extract_text_from_docx(content)
+        # Check file type from its magic bytes, falling back to the extension
+        file_format = text_extraction.detect_format(file.filename, content)
+        if file_format is None:
+            raise HTTPException(status_code=400, detail="Only PDF, TXT, and DOCX files are supported")
         
-        # Extract skills from text
-        skills = skill_extractor.extract_skills(text)
+        # Identical uploads in flight at the same time (e.g. a shared template) are extracted once.
+        # Complete results do not depend on the deadline, so it only keys the flight; partial
+        # results are never stored.
+        cache_key = (
+            skill_extractor.data_version, text_extraction.TextCache.content_key(content), file_format, detailed,
+            tuple(sorted(sections)) if sections is not None else None, mode
+        )
+        text_length, skills, skill_details, partial = await cached_call(
+            extraction_flight, cache_key + (deadline_ms,), extract_resume,
+            file.filename, content, detailed, sections, mode, deadline,
+            cache_key=cache_key, cache_if=lambda result: not result[3]
+        )
+        skill_suggester.record(skills)
+        if analytics is not None:
+            analytics.record_extraction(skills, analytics_user(request))
+        if cooccurrence is not None:
+            cooccurrence.record(skills)
         
-        return {
+        response = {
             "filename": file.filename,
+            "format": file_format,
             "extracted_skills": skills,
-            "text_length": len(text)
+            "text_length": text_length,
+            "mode": mode,
+            "partial": partial
         }
+        if detailed:
+            response["skill_details"] = skill_details
+            # Ready to pass as skill_years to /match-skills with scoring=weighted
+            response["skill_years"] = {
+                detail["skill"]: detail["years_experience"] for detail in skill_details
+                if detail["years_experience"] is not None
+            }
+        
+        return negotiated_response(request, response)
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
 
+def extract_resume(filename: str, content: bytes, detailed: bool, ner_sections: Optional[frozenset] = None,
+                   mode: str = "balanced", deadline: Optional[Deadline] = None):
+    """Extract text and skills from resume content, returning (text length, skills, skill details, partial)"""
+    deadline = deadline or Deadline()
+    # Extract text, reusing cached text for files we have already parsed
+    try:
+        text, text_partial = text_cache.get_or_extract(filename, content, **pdf_options)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # Extract skills from text
+    if detailed:
+        skill_details = skill_extractor.extract_skills(
+            text, detailed=True, ner_sections=ner_sections, mode=mode, deadline=deadline
+        )
+        return len(text), [detail["skill"] for detail in skill_details], skill_details, deadline.partial or text_partial
+    skills = skill_extractor.extract_skills(text, ner_sections=ner_sections, mode=mode, deadline=deadline)
+    return len(text), skills, None, deadline.partial or text_partial
+
 @app.get("/job-roles")
-async def get_job_roles():
+async def get_job_roles(request: Request):
     """
     Get available job roles
     """
-    return skill_matcher.get_available_job_roles()
+    return catalog_cache.respond(
+        request, "job-roles", skill_matcher.data_version, skill_matcher.get_available_job_roles
+    )
+
+@app.get("/roadmap-skills")
+async def get_roadmap_skills(request: Request):
+    """
+    Get skills that have a curated learning roadmap
+    """
+    return catalog_cache.respond(
+        request, "roadmap-skills", roadmap_generator.data_version, roadmap_generator.get_available_roadmaps
+    )
+
+@app.get("/resources/{skill:path}")
+async def get_skill_resources(request: Request, skill: str):
+    """
+    Get curated learning resources for a skill; the name may contain "/" (ci/cd)
+    """
+    skill_lower = skill.lower().strip()
+    if skill_lower not in roadmap_generator.resources:
+        return negotiated_response(request, [])
+    return catalog_cache.respond(
+        request, f"resources:{skill_lower}", roadmap_generator.data_version,
+        lambda: roadmap_generator.get_skill_resources(skill_lower)
+    )
+
+@app.get("/skills/suggest")
+async def suggest_skills(request: Request, q: str = "", limit: int = 10):
+    """
+    Suggest skills for a partly typed skill name, most popular first
+    
+    Matches the start of any word of a skill name or alias, so "learn" finds
+    "machine learning". At most 20 suggestions are returned.
+    """
+    return negotiated_response(request, {"query": q, "suggestions": skill_suggester.suggest(q, limit)})
+
+@app.get("/skills/{skill:path}/roles")
+async def get_skill_roles(request: Request, skill: str):
+    """
+    Get the job roles that require or prefer a skill
+    """
+    skill_lower = skill.lower().strip()
+    if skill_lower not in skill_matcher.skill_roles:
+        return negotiated_response(request, {"skill": skill_lower, "roles": []})
+    return catalog_cache.respond(
+        request, f"skill-roles:{skill_lower}", skill_matcher.data_version,
+        lambda: {"skill": skill_lower, "roles": skill_matcher.get_roles_for_skill(skill_lower)}
+    )
+
+@app.get("/skills/{skill:path}/resources")
+async def get_skill_coverage(request: Request, skill: str):
+    """
+    Get the learning resources that cover a skill, listed under it or naming it
+    """
+    skill_lower = skill.lower().strip()
+    if skill_lower not in roadmap_generator.skill_resources:
+        return negotiated_response(request, {"skill": skill_lower, "resources": []})
+    # Mentions depend on the role vocabulary too, so both versions tag the entry
+    return catalog_cache.respond(
+        request, f"skill-resources:{skill_lower}", f"{roadmap_generator.data_version}:{skill_matcher.data_version}",
+        lambda: {"skill": skill_lower, "resources": roadmap_generator.get_resources_covering(skill_lower)}
+    )
+
+@app.get("/metrics")
+async def metrics():
+    """
+    Request coalescing and cache counters for this worker process
+    
+    result_cache entries and bytes cover the store shared by all workers.
+    """
+    return {
+        "pid": os.getpid(),
+        "coalescing": {
+            flight.name: flight.metrics() for flight in (extraction_flight, match_flight, roadmap_flight)
+        },
+        "text_cache": {"hits": text_cache.hits, "misses": text_cache.misses},
+        "result_cache": result_cache.stats() if result_cache is not None else None,
+        "analytics": analytics.stats() if analytics is not None else None,
+        "cooccurrence": cooccurrence.stats() if cooccurrence is not None else None
+    }
+
+@app.get("/analytics")
+async def get_analytics(
+    request: Request,
+    week: Optional[str] = None,
+    role: Optional[str] = None,
+    top_k: int = 10,
+    skill: Optional[str] = None
+):
+    """
+    Most common extracted skills and missing skills per target role for a week
+    
+    week is an ISO week such as 2026-W42 (default: the current one); role
+    limits the missing skills to one role id; skill adds that skill's count.
+    Counts are sketch estimates and may run slightly high. Other workers are
+    read from their snapshots, so their most recent events may be missing.
+    """
+    if analytics is None:
+        raise HTTPException(status_code=404, detail="Analytics are disabled")
+    if week is not None and not WEEK_PATTERN.fullmatch(week):
+        raise HTTPException(status_code=400, detail="week must look like 2026-W42")
+    if not 1 <= top_k <= SkillStream.CANDIDATES:
+        raise HTTPException(status_code=400, detail=f"top_k must be between 1 and {SkillStream.CANDIDATES}")
+    
+    try:
+        report = await run_in_threadpool(
+            analytics.report, week, role, top_k, skill.lower().strip() if skill else None
+        )
+        return negotiated_response(request, report)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error building analytics: {str(e)}")
+
+@app.on_event("shutdown")
+def save_analytics():
+    """Snapshot this worker's analytics so a restart loses nothing"""
+    if analytics is not None and analytics.directory:
+        analytics.snapshot()
+
+@app.on_event("shutdown")
+def save_cooccurrence():
+    """Snapshot the skill pairs this worker learned so a restart loses nothing"""
+    if cooccurrence is not None and cooccurrence.directory:
+        cooccurrence.snapshot()
+
+@app.post("/admin/reload-data")
+async def reload_data():
+    """
+    Reload job roles, roadmaps and resources from disk
+    
+    Catalog ETags change automatically when the reloaded data differs.
+    """
+    global skill_suggester
+    try:
+        skill_matcher.reload()
+        roadmap_generator.reload()
+        # Role skills may have changed; resume counts carry over
+        skill_suggester = SkillSuggester.from_sources(
+            skill_extractor, skill_matcher, skill_suggester.resume_count_map()
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error reloading data: {str(e)}")
+    
+    return {
+        "job_roles_version": skill_matcher.data_version,
+        "roadmaps_version": roadmap_generator.data_version
+    }
 
 @app.post("/match-skills")
 async def match_skills(
+    request: Request,
     user_skills: List[str] = Form(...),
-    target_role: str = Form(...)
+    target_role: str = Form(...),
+    scoring: str = Form("standard"),
+    skill_years: Optional[str] = Form(None),
+    semantic: bool = Form(False)
 ):
     """
     Match user skills against target job role requirements
+    
+    scoring="weighted" uses per-skill role weights and minimum years; pass
+    skill_years as a JSON object such as {"python": 5} to feed experience in.
+    semantic=true maps unknown skills to the closest known skill first.
     """
+    if scoring not in ("standard", "weighted"):
+        raise HTTPException(status_code=400, detail="scoring must be 'standard' or 'weighted'")
+    
+    years = None
+    if skill_years:
+        try:
+            years = {str(skill): float(value) for skill, value in json.loads(skill_years).items()}
+        except (ValueError, TypeError, AttributeError):
+            raise HTTPException(status_code=400, detail="skill_years must be a JSON object of skill -> years")
+        if not all(math.isfinite(value) and value >= 0 for value in years.values()):
+            raise HTTPException(status_code=400, detail="skill_years values must be non-negative numbers")
+    
+    # Matching ignores case, order and duplicates of the user's skills, so the key does too
+    key = (
+        skill_matcher.data_version, scoring, target_role, semantic,
+        tuple(sorted({skill.lower().strip() for skill in user_skills})),
+        tuple(sorted(years.items())) if years else None
+    )
+    
     try:
-        match_result = skill_matcher.match_skills(user_skills, target_role)
-        return match_result
+        if scoring == "weighted":
+            match_result = await cached_call(
+                match_flight, key, skill_matcher.match_skills_weighted, user_skills, target_role, years, semantic=semantic
+            )
+        else:
+            match_result = await cached_call(
+                match_flight, key, skill_matcher.match_skills, user_skills, target_role, semantic=semantic
+            )
+        if analytics is not None:
+            missing = match_result["missing_skills"]
+            analytics.record_match(target_role, missing["required"] + missing["preferred"], analytics_user(request))
+        return negotiated_response(request, match_result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error matching skills: {str(e)}")
 
-@app.post("/generate-roadmap")
-async def generate_roadmap(skill: str = Form(...)):
+@app.post("/role-transitions")
+async def role_transitions(
+    request: Request,
+    user_skills: List[str] = Form(...),
+    top_k: int = Form(3),
+    semantic: bool = Form(False)
+):
     """
-    Generate learning roadmap for a specific skill
+    Get the roles closest to the user's skills and the cheapest next roles
+    
+    Answered from the role similarity graph precomputed when job roles load.
     """
+    if top_k < 1:
+        raise HTTPException(status_code=400, detail="top_k must be at least 1")
+    
     try:
-        roadmap = roadmap_generator.generate_roadmap(skill)
-        return roadmap
+        result = skill_matcher.get_role_transitions(user_skills, top_k, semantic=semantic)
+        return negotiated_response(request, result)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating roadmap: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error computing role transitions: {str(e)}")
+
+@app.post("/skill-gains")
+async def skill_gains(
+    request: Request,
+    user_skills: List[str] = Form(...),
+    top_k: int = Form(10),
+    scoring: str = Form("standard"),
+    semantic: bool = Form(False)
+):
+    """
+    Rank the missing skills that would raise the user's match the most across all roles
+    
+    Each skill lists its total gain over every role and the roles it helps
+    most, computed in one pass over the role x skill gain matrix.
+    """
+    if top_k < 1:
+        raise HTTPException(status_code=400, detail="top_k must be at least 1")
+    if scoring not in ("standard", "weighted"):
+        raise HTTPException(status_code=400, detail="scoring must be 'standard' or 'weighted'")
+    
+    try:
+        result = skill_matcher.marginal_gains(user_skills, top_k, scoring, semantic=semantic)
+        return negotiated_response(request, result)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error computing skill gains: {str(e)}")
 
-def extract_text_from_pdf(content: bytes) -> str:
-    """Extract text from PDF content"""
+@app.post("/skills/also-know")
+async def also_know(
+    request: Request,
+    user_skills: List[str] = Form(...),
+    top_k: int = Form(10)
+):
+    """
+    People with your skills also know: skills that often appear alongside the user's in processed resumes
+    
+    Learned from every uploaded resume rather than from the role lists, so
+    it picks up new skills and combinations as resumes come in.
+    """
+    if cooccurrence is None:
+        raise HTTPException(status_code=404, detail="Skill co-occurrence is disabled")
+    if top_k < 1:
+        raise HTTPException(status_code=400, detail="top_k must be at least 1")
+    
     try:
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        return negotiated_response(request, cooccurrence.recommend(user_skills, top_k))
     except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error reading PDF: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error recommending skills: {str(e)}")
 
-def extract_text_from_docx(content: bytes) -> str:
-    """Extract text from DOCX content"""
+@app.post("/learning-plan")
+async def learning_plan(
+    request: Request,
+    user_skills: List[str] = Form(...),
+    target_role: str = Form(...),
+    budget_weeks: float = Form(...),
+    target_level: str = Form("intermediate"),
+    scoring: str = Form("standard")
+):
+    """
+    Plan which missing skills to study within a time budget
+    
+    Picks the roadmap levels that raise the role match percentage the most
+    within budget_weeks and orders them by gain per week.
+    """
+    if target_role not in skill_matcher.job_roles:
+        raise HTTPException(status_code=404, detail=f"Unknown job role: {target_role}")
+    
     try:
-        from docx import Document
-        doc = Document(io.BytesIO(content))
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        plan = learning_planner.plan(user_skills, target_role, budget_weeks, target_level, scoring)
+        return negotiated_response(request, plan)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error reading DOCX: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error building learning plan: {str(e)}")
+
+@app.post("/generate-roadmap")
+async def generate_roadmap(request: Request, skill: str = Form(...), semantic: bool = Form(False)):
+    """
+    Generate learning roadmap for a specific skill
+    """
+    try:
+        # Semantic lookups also depend on the embedding index they resolve against
+        index_version = (await run_in_threadpool(roadmap_generator.get_semantic_index)).version if semantic else None
+        key = (roadmap_generator.data_version, skill, semantic, index_version)
+        roadmap = await cached_call(roadmap_flight, key, roadmap_generator.generate_roadmap, skill, semantic=semantic)
+        return negotiated_response(request, roadmap)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating roadmap: {str(e)}")
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
 
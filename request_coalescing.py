@@ -0,0 +1,58 @@
+import asyncio
+from typing import Any, Callable, Dict, Hashable
+from starlette.concurrency import run_in_threadpool
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls into a single computation
+    
+    The first caller for a key starts the work in the thread pool; callers
+    that arrive with the same key while it is running await the same result
+    (or exception) instead of repeating the work. Keys must capture every
+    input that affects the result. Coalesced callers share the result object,
+    so it must not be mutated.
+    
+    Coalescing is per process: each worker keeps its own in-flight table.
+    """
+    
+    def __init__(self, name: str):
+        """Initialize an empty in-flight table"""
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+    
+    async def run(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run func(*args, **kwargs) in the thread pool, or join the identical call already running"""
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(run_in_threadpool(func, *args, **kwargs))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        
+        # Shielded so a caller that disconnects does not cancel the work others wait for
+        return await asyncio.shield(task)
+    
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        """Drop a finished call from the in-flight table"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Counters describing how often coalescing fired"""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "in_flight": len(self._in_flight),
+            "coalesced_ratio": round(self.coalesced / self.calls, 4) if self.calls else 0.0
+        }
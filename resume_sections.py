@@ -0,0 +1,123 @@
+import re
+from typing import Collection, Dict, List, Optional, Tuple
+
+# Header phrases for each section, after lowercasing and dropping punctuation
+SECTION_HEADERS: Dict[str, Tuple[str, ...]] = {
+    "summary": ("summary", "professional summary", "profile", "professional profile", "objective",
+                "career objective", "about", "about me", "overview"),
+    "skills": ("skills", "technical skills", "key skills", "core skills", "skills and tools", "core competencies",
+               "competencies", "technologies", "tools and technologies", "tech stack", "technical expertise",
+               "expertise", "skills and expertise", "programming skills"),
+    "experience": ("experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "career history", "relevant experience"),
+    "projects": ("projects", "personal projects", "key projects", "selected projects", "academic projects",
+                 "side projects", "open source", "open source contributions"),
+    "education": ("education", "academic background", "education and training", "qualifications",
+                  "academic qualifications"),
+    "certifications": ("certifications", "certificates", "licenses and certifications", "courses",
+                       "training"),
+    "awards": ("awards", "honors", "honours", "achievements", "awards and honors"),
+    "publications": ("publications", "papers", "research"),
+    "interests": ("interests", "hobbies", "hobbies and interests", "activities", "volunteering",
+                  "volunteer experience"),
+    "references": ("references", "referees"),
+    "contact": ("contact", "contact information", "contact details", "personal details",
+                "personal information"),
+}
+
+# Sections where skills appear in running text and NER can add to keyword matching
+DEFAULT_NER_SECTIONS = frozenset({"summary", "skills", "experience", "projects"})
+
+# Pass as a section name to run NER over the whole text
+ALL_SECTIONS = "all"
+
+HEADER_INDEX = {phrase: section for section, phrases in SECTION_HEADERS.items() for phrase in phrases}
+
+# Header lines are short; anything longer is body text
+MAX_HEADER_LENGTH = 48
+
+_LINE_PATTERN = re.compile(r"[^\n]*\n?")
+_DECORATION = re.compile(r"[^a-z&/ ]+")
+
+class Section:
+    """A resume section as a character range of the text"""
+    
+    __slots__ = ("name", "start", "end")
+    
+    def __init__(self, name: str, start: int, end: int):
+        """Initialize the section; start and end are offsets into the segmented text"""
+        self.name = name
+        self.start = start
+        self.end = end
+
+def classify_header(line: str) -> Optional[str]:
+    """Section name for a header line such as "TECHNICAL SKILLS:", or None if the line is not a header"""
+    stripped = line.strip()
+    if not stripped or len(stripped) > MAX_HEADER_LENGTH:
+        return None
+    phrase = _DECORATION.sub(" ", stripped.lower()).replace("&", " and ").replace("/", " and ")
+    return HEADER_INDEX.get(" ".join(phrase.split()))
+
+def segment(text: str) -> List[Section]:
+    """
+    Split text into sections at header lines such as "TECHNICAL SKILLS" or "## Projects"
+    
+    Text before the first header is the "preamble" (usually the name and
+    contact details). A header may stand on its own line or lead a line ("Skills: Python, SQL"),
+    in which case the rest of the line belongs to the section. Consecutive
+    sections cover the whole text.
+    """
+    sections = [Section("preamble", 0, len(text))]
+    for match in _LINE_PATTERN.finditer(text):
+        line = match.group()
+        if not line:
+            break
+        name = classify_header(line)
+        if name is None and ":" in line:
+            prefix = line.split(":", 1)[0]
+            name = classify_header(prefix) if len(prefix.strip()) <= MAX_HEADER_LENGTH else None
+        if name is None:
+            continue
+        
+        previous = sections[-1]
+        previous.end = match.start()
+        if previous.start == previous.end and previous.name == "preamble":
+            sections.pop()
+        sections.append(Section(name, match.start(), len(text)))
+    return sections
+
+def parse_sections(value: Optional[str]) -> Optional[frozenset]:
+    """Parse a comma-separated list of section names ("skills,experience" or "all"); None for empty input"""
+    if value is None or not value.strip():
+        return None
+    names = frozenset(name.strip().lower() for name in value.split(",") if name.strip())
+    unknown = names - set(SECTION_HEADERS) - {"preamble", ALL_SECTIONS}
+    if unknown:
+        raise ValueError(
+            f"Unknown resume sections: {', '.join(sorted(unknown))}. "
+            f"Use {ALL_SECTIONS} or any of: preamble, {', '.join(SECTION_HEADERS)}"
+        )
+    return names
+
+def select_spans(text: str, sections: Collection[str]) -> List[Tuple[int, int]]:
+    """
+    (start, end) ranges of text that belong to the given sections, merged where adjacent
+    
+    Text without any recognized header is returned whole, since there is no
+    structure to go by.
+    """
+    if ALL_SECTIONS in sections:
+        return [(0, len(text))] if text else []
+    parts = segment(text)
+    if len(parts) == 1 and parts[0].name == "preamble":
+        return [(0, len(text))] if text else []
+    
+    spans: List[Tuple[int, int]] = []
+    for section in parts:
+        if section.name not in sections or section.start == section.end:
+            continue
+        if spans and spans[-1][1] == section.start:
+            spans[-1] = (spans[-1][0], section.end)
+        else:
+            spans.append((section.start, section.end))
+    return spans
@@ -1,14 +1,103 @@
 import json
 import os
-from typing import List, Dict, Any
-import requests
-from bs4 import BeautifulSoup
+import hashlib
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
+from skill_embeddings import SkillEmbeddingIndex
+from skill_automaton import SkillAutomaton
+from roadmap_model import DurationRange, Resource, Roadmap, RoadmapLevel, order_level_weeks
 
 class RoadmapGenerator:
-    def __init__(self):
+    # Minimum cosine similarity for semantic lookup to pick a roadmap
+    SEMANTIC_THRESHOLD = 0.5
+    
+    def __init__(self, nlp=None, nlp_loader: Optional[Callable[[], Any]] = None,
+                 skill_vocabulary: Optional[Callable[[], Iterable[str]]] = None):
         """Initialize the roadmap generator with skill roadmaps data"""
-        self.roadmaps = self._load_roadmaps()
-        self.resources = self._load_resources()
+        # SpaCy pipeline whose static vectors (if any) feed semantic lookup; with
+        # nlp_loader it is only loaded when the semantic index is first built
+        self.nlp = nlp
+        self.nlp_loader = nlp_loader
+        # Extra skills (e.g. every role skill) to look for in resource titles and descriptions
+        self.skill_vocabulary = skill_vocabulary
+        self._load_catalog()
+        self._build_indexes()
+    
+    def reload(self):
+        """Reload roadmaps and resources from disk and rebuild derived data"""
+        self._load_catalog()
+        self._build_indexes()
+    
+    def _load_catalog(self):
+        """Load roadmaps and resources and convert them to the compact roadmap model"""
+        roadmaps = self._load_roadmaps()
+        resources = self._load_resources()
+        
+        # Content hash of the loaded data, changes whenever roadmaps or resources change
+        canonical = json.dumps([roadmaps, resources], sort_keys=True, separators=(",", ":"))
+        self.data_version = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+        
+        # Durations and learning objectives are parsed here once; requests only read them
+        self.roadmaps: Dict[str, Roadmap] = {
+            skill: Roadmap(skill, roadmap_data, self._generate_learning_objectives, self._calculate_total_duration)
+            for skill, roadmap_data in roadmaps.items()
+        }
+        self.resources: Dict[str, Tuple[Resource, ...]] = {
+            skill: tuple(Resource(item) for item in items) for skill, items in resources.items()
+        }
+    
+    def _build_indexes(self):
+        """Build structures derived from the loaded roadmaps and resources"""
+        # Built on first semantic lookup, over the current roadmap skills
+        self._semantic_index = None
+        
+        # Level durations of the generic roadmap, for skills without their own
+        self.generic_level_weeks = order_level_weeks(
+            RoadmapLevel(level["level"], level, self._generate_learning_objectives)
+            for level in self._generate_generic_roadmap("")["levels"]
+        )
+        
+        self._build_skill_resource_index()
+    
+    def _build_skill_resource_index(self):
+        """
+        Map each skill to the resources that cover it, as (listed under, resource) pairs
+        
+        A resource covers the skill it is listed under and every known skill
+        its title or description names as a whole word ("Docker and Kubernetes"
+        also covers kubernetes). Listed resources come first.
+        """
+        vocabulary = set(self.resources) | set(self.roadmaps)
+        if self.skill_vocabulary is not None:
+            vocabulary.update(skill.lower() for skill in self.skill_vocabulary())
+        automaton = SkillAutomaton.from_skills(vocabulary)
+        
+        listed: Dict[str, List[Tuple[str, Resource]]] = {}
+        mentioned: Dict[str, List[Tuple[str, Resource]]] = {}
+        for listed_under, resources in self.resources.items():
+            for resource in resources:
+                listed.setdefault(listed_under, []).append((listed_under, resource))
+                text = resource.search_text
+                covered = {
+                    skill for start, end, skill in automaton.find_all(text)
+                    if (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
+                }
+                for skill in sorted(covered - {listed_under}):
+                    mentioned.setdefault(skill, []).append((listed_under, resource))
+        
+        self.skill_resources: Dict[str, Tuple[Tuple[str, Resource], ...]] = {
+            skill: tuple(listed.get(skill, ())) + tuple(mentioned.get(skill, ()))
+            for skill in set(listed) | set(mentioned)
+        }
+    
+    def get_level_weeks(self, skill: str) -> Tuple[Optional[str], Tuple[Tuple[str, str, float, float], ...]]:
+        """Roadmap skill used for a skill (None for the generic roadmap) and its parsed level durations"""
+        skill_lower = skill.lower().strip()
+        if skill_lower not in self.roadmaps:
+            similar_skills = self._find_similar_skill(skill_lower)
+            if not similar_skills:
+                return None, self.generic_level_weeks
+            skill_lower = similar_skills[0]
+        return skill_lower, self.roadmaps[skill_lower].level_weeks
     
     def _load_roadmaps(self) -> Dict[str, Any]:
         """Load skill roadmaps from JSON file or return default roadmaps"""
@@ -378,16 +467,19 @@ class RoadmapGenerator:
         except Exception:
             return default_resources
     
-    def generate_roadmap(self, skill: str) -> Dict[str, Any]:
+    def generate_roadmap(self, skill: str, semantic: bool = False) -> Dict[str, Any]:
         """
         Generate a learning roadmap for a specific skill
+        
+        With semantic=True, a skill without a roadmap falls back to the most
+        similar roadmap skill by embedding similarity before going generic.
         """
         skill_lower = skill.lower().strip()
         
         # Check if roadmap exists for the skill
         if skill_lower not in self.roadmaps:
             # Try to find similar skills
-            similar_skills = self._find_similar_skill(skill_lower)
+            similar_skills = self._find_similar_skill(skill_lower, semantic)
             if similar_skills:
                 skill_lower = similar_skills[0]
             else:
@@ -395,39 +487,40 @@ class RoadmapGenerator:
                 return self._generate_generic_roadmap(skill)
         
         roadmap_data = self.roadmaps[skill_lower]
-        resources = self.resources.get(skill_lower, [])
         
-        # Structure the roadmap
+        # Structure the roadmap from the precomputed model
         roadmap = {
             "skill": skill,
-            "title": roadmap_data["title"],
-            "description": roadmap_data["description"],
-            "levels": [],
-            "resources": resources,
-            "estimated_total_duration": self._calculate_total_duration(roadmap_data["levels"]),
+            "title": roadmap_data.title,
+            "description": roadmap_data.description,
+            "levels": [level.to_dict() for level in roadmap_data.levels],
+            "resources": [resource.to_dict() for resource in self.resources.get(skill_lower, ())],
+            "estimated_total_duration": roadmap_data.estimated_total_duration,
             "difficulty_progression": ["beginner", "intermediate", "advanced"]
         }
         
-        # Add levels with topics
-        for level, level_data in roadmap_data["levels"].items():
-            roadmap["levels"].append({
-                "level": level,
-                "difficulty": level_data["difficulty"],
-                "duration": level_data["duration"],
-                "topics": level_data["topics"],
-                "learning_objectives": self._generate_learning_objectives(level_data["topics"])
-            })
-        
         return roadmap
     
-    def _find_similar_skill(self, skill: str) -> List[str]:
+    def _find_similar_skill(self, skill: str, semantic: bool = False) -> List[str]:
         """Find similar skills in the available roadmaps"""
         similar_skills = []
         for available_skill in self.roadmaps.keys():
             if skill in available_skill or available_skill in skill:
                 similar_skills.append(available_skill)
+        
+        if not similar_skills and semantic:
+            matches = self.get_semantic_index().query([skill], k=1, min_score=self.SEMANTIC_THRESHOLD)[0]
+            similar_skills = [match for match, _ in matches]
         return similar_skills
     
+    def get_semantic_index(self) -> SkillEmbeddingIndex:
+        """Get the embedding index over roadmap skills, building it on first use"""
+        if self._semantic_index is None:
+            if self.nlp is None and self.nlp_loader is not None:
+                self.nlp = self.nlp_loader()
+            self._semantic_index = SkillEmbeddingIndex(self.roadmaps.keys(), nlp=self.nlp)
+        return self._semantic_index
+    
     def _generate_generic_roadmap(self, skill: str) -> Dict[str, Any]:
         """Generate a generic roadmap for unknown skills"""
         return {
@@ -501,19 +594,13 @@ class RoadmapGenerator:
             "difficulty_progression": ["beginner", "intermediate", "advanced"]
         }
     
-    def _calculate_total_duration(self, levels: Dict[str, Any]) -> str:
+    def _calculate_total_duration(self, durations: Iterable[DurationRange]) -> str:
         """Calculate total duration for all levels"""
         total_weeks = 0
-        for level_data in levels.values():
-            duration = level_data["duration"]
-            # Extract weeks from duration string (e.g., "4-6 weeks" -> 5)
-            if "weeks" in duration:
-                parts = duration.split("-")
-                if len(parts) == 2:
-                    start, end = int(parts[0]), int(parts[1].split()[0])
-                    total_weeks += (start + end) // 2
-                else:
-                    total_weeks += int(parts[0].split()[0])
+        for duration in durations:
+            # Whole weeks in the middle of each range (e.g., "4-6 weeks" -> 5)
+            if duration.min_weeks is not None:
+                total_weeks += int(duration.min_weeks + duration.max_weeks) // 2
         
         if total_weeks <= 12:
             return f"{total_weeks} weeks"
@@ -529,10 +616,32 @@ class RoadmapGenerator:
             objectives.append(objective)
         return objectives
     
+    def get_available_roadmaps(self) -> List[Dict[str, str]]:
+        """Get list of skills that have a curated roadmap"""
+        return [
+            {
+                "skill": skill,
+                "title": roadmap_data.title,
+                "description": roadmap_data.description
+            }
+            for skill, roadmap_data in self.roadmaps.items()
+        ]
+    
     def get_skill_resources(self, skill: str) -> List[Dict[str, str]]:
         """Get learning resources for a specific skill"""
         skill_lower = skill.lower().strip()
-        return self.resources.get(skill_lower, [])
+        return [resource.to_dict() for resource in self.resources.get(skill_lower, ())]
+    
+    def get_resources_covering(self, skill: str) -> List[Dict[str, Any]]:
+        """Resources that cover a skill, whether listed under it or naming it, from the reverse index"""
+        skill_lower = skill.lower().strip()
+        results = []
+        for listed_under, resource in self.skill_resources.get(skill_lower, ()):
+            item = resource.to_dict()
+            item["listed_under"] = listed_under
+            item["match"] = "listed" if listed_under == skill_lower else "mentioned"
+            results.append(item)
+        return results
     
     def search_resources(self, query: str) -> List[Dict[str, str]]:
         """Search for learning resources based on query"""
@@ -543,11 +652,10 @@ class RoadmapGenerator:
             if query_lower in skill:
                 results.extend(resources)
             else:
-                for resource in resources:
-                    if (query_lower in resource["title"].lower() or 
-                        query_lower in resource["description"].lower()):
-                        results.append(resource)
+                results.extend(resource for resource in resources if query_lower in resource.search_text)
+            if len(results) >= 10:
+                break
         
-        return results[:10]  # Limit to 10 results
+        return [resource.to_dict() for resource in results[:10]]  # Limit to 10 results
 
 
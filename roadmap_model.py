@@ -0,0 +1,120 @@
+import re
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Roadmap levels from first to last
+LEVEL_ORDER = ["beginner", "intermediate", "advanced"]
+
+# "4-6 weeks", "3 weeks", "2 months", "1 to 2 months"
+DURATION_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*(?:(?:-|to)\s*(\d+(?:\.\d+)?))?\s*(day|week|month)s?', re.IGNORECASE)
+WEEKS_PER_UNIT = {"day": 1 / 7, "week": 1.0, "month": 52 / 12}
+
+# Keys a resource always renders first, in this order
+RESOURCE_FIELDS = ("title", "type", "url", "description", "duration", "rating")
+
+def parse_duration_weeks(duration: str) -> Optional[Tuple[float, float]]:
+    """Parse a duration such as "4-6 weeks" into (min_weeks, max_weeks), or None if it has no length"""
+    match = DURATION_PATTERN.search(duration or "")
+    if not match:
+        return None
+    scale = WEEKS_PER_UNIT[match.group(3).lower()]
+    low = float(match.group(1)) * scale
+    high = float(match.group(2)) * scale if match.group(2) else low
+    return low, max(low, high)
+
+def _intern(value: Any) -> Any:
+    """Intern short repeated strings such as level names and resource types"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+class DurationRange:
+    """A duration as written ("4-6 weeks") with its length in weeks, if it has one"""
+    
+    __slots__ = ("text", "min_weeks", "max_weeks")
+    
+    def __init__(self, text: str):
+        """Initialize the range by parsing its text once"""
+        self.text = text
+        weeks = parse_duration_weeks(text) if isinstance(text, str) else None
+        self.min_weeks, self.max_weeks = weeks if weeks is not None else (None, None)
+
+class Resource:
+    """A learning resource with a parsed duration"""
+    
+    __slots__ = ("title", "type", "url", "description", "duration", "rating", "search_text", "extra")
+    
+    def __init__(self, data: Dict[str, Any]):
+        """Initialize the resource from its JSON object"""
+        self.title = data.get("title", "")
+        self.type = _intern(data.get("type"))
+        self.url = data.get("url")
+        self.description = data.get("description", "")
+        self.duration = DurationRange(data["duration"]) if "duration" in data else None
+        self.rating = data.get("rating")
+        # Lowercased once for search_resources; NUL keeps queries from spanning both fields
+        self.search_text = f"{self.title}\0{self.description}".lower()
+        # Any other keys from the source data, kept so responses do not lose them
+        self.extra = tuple((key, value) for key, value in data.items() if key not in RESOURCE_FIELDS) or None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the resource as in the source data"""
+        result = {"title": self.title}
+        if self.type is not None:
+            result["type"] = self.type
+        if self.url is not None:
+            result["url"] = self.url
+        result["description"] = self.description
+        if self.duration is not None:
+            result["duration"] = self.duration.text
+        if self.rating is not None:
+            result["rating"] = self.rating
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+class RoadmapLevel:
+    """One level of a roadmap, with its topics and learning objectives"""
+    
+    __slots__ = ("level", "difficulty", "duration", "topics", "learning_objectives")
+    
+    def __init__(self, level: str, data: Dict[str, Any], objectives: Callable[[List[str]], List[str]]):
+        """Initialize the level from its JSON object, deriving learning objectives once"""
+        self.level = _intern(level)
+        self.difficulty = _intern(data.get("difficulty"))
+        self.duration = DurationRange(data.get("duration", ""))
+        self.topics = tuple(data.get("topics", []))
+        self.learning_objectives = tuple(objectives(list(self.topics)))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the level as returned by generate_roadmap"""
+        return {
+            "level": self.level,
+            "difficulty": self.difficulty,
+            "duration": self.duration.text,
+            "topics": list(self.topics),
+            "learning_objectives": list(self.learning_objectives)
+        }
+
+class Roadmap:
+    """A skill roadmap: levels in source order plus their precomputed total duration"""
+    
+    __slots__ = ("skill", "title", "description", "levels", "level_weeks", "estimated_total_duration")
+    
+    def __init__(self, skill: str, data: Dict[str, Any], objectives: Callable[[List[str]], List[str]],
+                 total_duration: Callable[[Iterable[DurationRange]], str]):
+        """Initialize the roadmap from its JSON object"""
+        self.skill = skill
+        self.title = data["title"]
+        self.description = data["description"]
+        self.levels = tuple(RoadmapLevel(level, level_data, objectives) for level, level_data in data["levels"].items())
+        # Levels with a known length as (level, duration, min_weeks, max_weeks), for the learning planner
+        self.level_weeks = order_level_weeks(self.levels)
+        self.estimated_total_duration = total_duration(level.duration for level in self.levels)
+
+def order_level_weeks(levels: Iterable[RoadmapLevel]) -> Tuple[Tuple[str, str, float, float], ...]:
+    """Levels with a known length as (level, duration, min_weeks, max_weeks), sorted by LEVEL_ORDER"""
+    order = {level: i for i, level in enumerate(LEVEL_ORDER)}
+    parsed = [
+        (level.level, level.duration.text, level.duration.min_weeks, level.duration.max_weeks)
+        for level in levels if level.duration.min_weeks is not None
+    ]
+    return tuple(sorted(parsed, key=lambda item: order.get(item[0], len(order))))
@@ -0,0 +1,127 @@
+from typing import Any, Dict, Iterable, List
+import numpy as np
+
+class RoleGraph:
+    """
+    Precomputed role-to-role similarity graph
+    
+    Roles are compared by Jaccard similarity of their required+preferred skill
+    sets, computed for every pair at once from a role x skill incidence matrix.
+    Each role keeps its most similar neighbours as transition edges, annotated
+    with the required skills of the target role that the source role does not
+    cover. Queries only score the user against each role once and then read
+    the edges of the nearest role, so they never run a full match per role.
+    """
+    
+    def __init__(self, job_roles: Dict[str, Any], max_neighbors: int = 5):
+        """Initialize the graph from job role definitions"""
+        self.role_ids = list(job_roles.keys())
+        self.titles = {role_id: role_data["title"] for role_id, role_data in job_roles.items()}
+        self.required = {role_id: frozenset(role_data["required_skills"]) for role_id, role_data in job_roles.items()}
+        self.skills = {
+            role_id: frozenset(role_data["required_skills"]) | frozenset(role_data["preferred_skills"])
+            for role_id, role_data in job_roles.items()
+        }
+        
+        vocabulary = sorted(set().union(*self.skills.values())) if self.skills else []
+        self.skill_index = {skill: i for i, skill in enumerate(vocabulary)}
+        
+        incidence = np.zeros((len(self.role_ids), len(vocabulary)), dtype=np.float32)
+        for row, role_id in enumerate(self.role_ids):
+            for skill in self.skills[role_id]:
+                incidence[row, self.skill_index[skill]] = 1.0
+        self.incidence = incidence
+        self.role_sizes = incidence.sum(axis=1)
+        
+        # |A & B| for every pair in one product, then |A | B| = |A| + |B| - |A & B|
+        intersection = incidence @ incidence.T
+        union = self.role_sizes[:, None] + self.role_sizes[None, :] - intersection
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.similarity = np.where(union > 0, intersection / union, 0.0)
+        
+        self.edges = {role_id: self._build_edges(row, max_neighbors) for row, role_id in enumerate(self.role_ids)}
+    
+    def _build_edges(self, row: int, max_neighbors: int) -> List[Dict[str, Any]]:
+        """Most similar roles to one role, cheapest transition (fewest new required skills) first"""
+        source = self.role_ids[row]
+        candidates = [
+            (float(self.similarity[row, other]), self.role_ids[other])
+            for other in range(len(self.role_ids))
+            if other != row and self.similarity[row, other] > 0
+        ]
+        candidates.sort(key=lambda item: (-item[0], item[1]))
+        
+        edges = []
+        for similarity, target in candidates[:max_neighbors]:
+            gap = sorted(self.required[target] - self.skills[source])
+            edges.append({
+                "role": target,
+                "title": self.titles[target],
+                "similarity": round(similarity, 4),
+                "gap_size": len(gap),
+                "gap": gap
+            })
+        edges.sort(key=lambda edge: (edge["gap_size"], -edge["similarity"]))
+        return edges
+    
+    def nearest_roles(self, user_skills: Iterable[str], k: int = 3) -> List[Dict[str, Any]]:
+        """Roles closest to a set of user skills, by Jaccard similarity"""
+        user_set = {skill.lower().strip() for skill in user_skills if skill and skill.strip()}
+        if not self.role_ids or not user_set:
+            return []
+        
+        present = np.zeros(len(self.skill_index), dtype=np.float32)
+        for skill in user_set:
+            index = self.skill_index.get(skill)
+            if index is not None:
+                present[index] = 1.0
+        
+        intersection = self.incidence @ present
+        union = self.role_sizes + len(user_set) - intersection
+        scores = np.where(union > 0, intersection / np.maximum(union, 1), 0.0)
+        
+        ranked = sorted(range(len(self.role_ids)), key=lambda row: (-scores[row], self.role_ids[row]))
+        return [
+            {
+                "role": self.role_ids[row],
+                "title": self.titles[self.role_ids[row]],
+                "similarity": round(float(scores[row]), 4),
+                "missing_required": sorted(self.required[self.role_ids[row]] - user_set)
+            }
+            for row in ranked[:k]
+        ]
+    
+    def transitions(self, user_skills: Iterable[str], k: int = 3) -> Dict[str, Any]:
+        """
+        Nearest roles for a user and the cheapest next roles from them
+        
+        Each transition lists the target role's required skills the user still
+        lacks, fewest first. A target reachable from several nearest roles is
+        listed once, from its most similar source.
+        """
+        user_set = {skill.lower().strip() for skill in user_skills if skill and skill.strip()}
+        nearest = self.nearest_roles(user_set, k)
+        current = nearest[0]["role"] if nearest else None
+        
+        best: Dict[str, Dict[str, Any]] = {}
+        for role in nearest:
+            for edge in self.edges[role["role"]]:
+                previous = best.get(edge["role"])
+                if edge["role"] == current or (previous and previous["role_similarity"] >= edge["similarity"]):
+                    continue
+                missing = sorted(self.required[edge["role"]] - user_set)
+                best[edge["role"]] = {
+                    "from": role["role"],
+                    "to": edge["role"],
+                    "title": edge["title"],
+                    "role_similarity": edge["similarity"],
+                    "missing_required": missing,
+                    "gap_size": len(missing)
+                }
+        transitions = sorted(best.values(), key=lambda item: (item["gap_size"], -item["role_similarity"], item["to"]))
+        
+        return {
+            "current_role": current,
+            "nearest_roles": nearest,
+            "transitions": transitions
+        }
@@ -0,0 +1,85 @@
+import json
+from typing import Any, Dict, Optional
+from fastapi import Request
+from fastapi.responses import Response
+
+# orjson and msgpack are optional: without orjson we fall back to the standard
+# json module, and without msgpack every client gets JSON.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+def dumps_json(content: Any) -> bytes:
+    """Serialize content straight to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def dumps_msgpack(content: Any) -> bytes:
+    """Serialize content to MessagePack bytes"""
+    return msgpack.packb(content, use_bin_type=True)
+
+def wants_msgpack(request: Request) -> bool:
+    """Check whether the client asked for MessagePack and we can produce it"""
+    if msgpack is None:
+        return False
+    accept = request.headers.get("accept", "")
+    return any(media_type in accept for media_type in MSGPACK_MEDIA_TYPES)
+
+class FastJSONResponse(Response):
+    """
+    JSON response serialized directly with orjson
+    
+    Only content passed in through negotiated_response skips FastAPI's
+    jsonable_encoder; handlers that return plain dicts (/health, /metrics,
+    error responses) still go through it and always answer in JSON.
+    """
+    media_type = JSON_MEDIA_TYPE
+    
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+class MsgPackResponse(Response):
+    """MessagePack response for machine clients"""
+    media_type = MSGPACK_MEDIA_TYPES[0]
+    
+    def render(self, content: Any) -> bytes:
+        return dumps_msgpack(content)
+
+def negotiated_response(request: Request, content: Any, status_code: int = 200,
+                        headers: Optional[Dict[str, str]] = None) -> Response:
+    """Serialize content as MessagePack or JSON depending on the Accept header"""
+    response_class = MsgPackResponse if wants_msgpack(request) else FastJSONResponse
+    response = response_class(content=content, status_code=status_code, headers=headers)
+    response.headers["Vary"] = "Accept"
+    return response
+
+class PreEncodedPayload:
+    """
+    A static payload encoded once and served as raw bytes
+    
+    Each encoding is produced on first use and reused for every later response,
+    so cached catalog endpoints skip serialization entirely.
+    """
+    
+    def __init__(self, content: Any):
+        """Initialize with the payload to serve"""
+        self.content = content
+        self._encoded: Dict[str, bytes] = {}
+    
+    def encoded(self, media_type: str) -> bytes:
+        """Get the payload bytes for a media type, encoding it on first use"""
+        body = self._encoded.get(media_type)
+        if body is None:
+            body = dumps_json(self.content) if media_type == JSON_MEDIA_TYPE else dumps_msgpack(self.content)
+            self._encoded[media_type] = body
+        return body
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+from serialization import dumps_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class SharedCache:
+    """
+    Result cache shared by every worker process on a host, stored in SQLite
+    
+    The database runs in WAL mode, so readers in all workers proceed while
+    one writes. Values are stored as JSON under a hash of (namespace, key);
+    each entry has an expiry time, and once the stored values exceed
+    max_bytes the least recently used entries are evicted. Access times are
+    refreshed at most once per touch_interval seconds, so hits rarely write.
+    
+    SQLite errors (locked too long, read-only disk) are treated as cache
+    misses and values that cannot be serialized are not stored, so the
+    cache can never fail a request.
+    """
+    
+    # Writes between eviction passes
+    EVICT_EVERY = 64
+    
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, default_ttl: float = 3600.0,
+                 touch_interval: float = 60.0):
+        """Initialize the cache, creating the database file if needed"""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, namespace TEXT NOT NULL, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+        connection.execute("CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires_at)")
+        # Pre-forked workers must not inherit an open connection, so each opens its own
+        connection.close()
+        self._local.connection = None
+    
+    def _connection(self) -> sqlite3.Connection:
+        """SQLite connection for the current thread and process (connections cannot cross either)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # WAL makes NORMAL safe against corruption; a crash can only lose the last writes
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+    
+    @staticmethod
+    def make_key(namespace: str, key: Hashable) -> str:
+        """Stable text key for a namespace and a key built from JSON-compatible values"""
+        canonical = json.dumps([namespace, key], sort_keys=True, separators=(",", ":"), default=str)
+        return f"{namespace}:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+    
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """Cached value for a key, or None if missing or expired"""
+        cache_key = self.make_key(namespace, key)
+        now = time.time()
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT value, expires_at, accessed_at FROM entries WHERE key = ?", (cache_key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+            if now - row[2] > self.touch_interval:
+                connection.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, cache_key))
+        except sqlite3.Error:
+            self.errors += 1
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return orjson.loads(row[0]) if orjson is not None else json.loads(row[0])
+    
+    def set(self, namespace: str, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store a JSON-serializable value for ttl seconds (default_ttl by default); other values are skipped"""
+        now = time.time()
+        try:
+            # orjson.JSONEncodeError is a TypeError; the json fallback may also raise ValueError
+            payload = dumps_json(value)
+            self._connection().execute(
+                "INSERT OR REPLACE INTO entries (key, namespace, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.make_key(namespace, key), namespace, payload, len(payload),
+                 now + (ttl if ttl is not None else self.default_ttl), now)
+            )
+        except (sqlite3.Error, TypeError, ValueError):
+            self.errors += 1
+            return
+        
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % self.EVICT_EVERY == 0
+        if evict:
+            self.evict()
+    
+    def get_or_compute(self, namespace: str, key: Hashable, compute: Callable[[], Any], ttl: Optional[float] = None,
+                       cache_if: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Cached value for a key, computing it on a miss and storing it unless cache_if rejects it"""
+        value = self.get(namespace, key)
+        if value is None:
+            value = compute()
+            if cache_if is None or cache_if(value):
+                self.set(namespace, key, value, ttl)
+        return value
+    
+    def evict(self):
+        """Delete expired entries, then least recently used ones until under max_bytes"""
+        try:
+            connection = self._connection()
+            connection.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+            total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                # Walk entries oldest first and drop them until the excess is covered
+                excess = total - self.max_bytes
+                doomed = []
+                for key, size in connection.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+                    doomed.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                connection.executemany("DELETE FROM entries WHERE key = ?", doomed)
+        except sqlite3.Error:
+            self.errors += 1
+    
+    def clear(self):
+        """Delete every entry"""
+        try:
+            self._connection().execute("DELETE FROM entries")
+        except sqlite3.Error:
+            self.errors += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of this process and the size of the shared store"""
+        entries, size = 0, 0
+        try:
+            entries, size = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        except sqlite3.Error:
+            self.errors += 1
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes
+        }
@@ -0,0 +1,354 @@
+import collections
+import datetime
+import functools
+import hashlib
+import json
+import math
+import os
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from background_model import BackgroundModel
+
+# Week labels as produced by week_of
+WEEK_PATTERN = re.compile(r"\d{4}-W\d{2}")
+
+def week_of(timestamp: float) -> str:
+    """ISO week of a Unix timestamp, such as "2026-W42\""""
+    year, week, _ = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).isocalendar()
+    return f"{year}-W{week:02d}"
+
+def _hash(value: str) -> Tuple[int, int]:
+    """Two independent 64-bit hashes of a string"""
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+
+@functools.lru_cache(maxsize=65536)
+def _columns(key: str, width: int, depth: int) -> np.ndarray:
+    """Column of a key in each row of a count-min table (double hashing); skill names repeat, so cached"""
+    h1, h2 = _hash(key)
+    return np.array([(h1 + row * h2) % width for row in range(depth)])
+
+class CountMinSketch:
+    """
+    Approximate counts of string keys in a fixed depth x width table
+    
+    Estimates never undercount; they overcount by at most about
+    e / width of the total count, with probability 1 - e^-depth.
+    """
+    
+    def __init__(self, width: int = 1024, depth: int = 4, table: Optional[np.ndarray] = None):
+        """Initialize an empty sketch, or one over an existing table"""
+        self.table = table if table is not None else np.zeros((depth, width), dtype=np.int64)
+        self.depth, self.width = self.table.shape
+        self._rows = np.arange(self.depth)
+    
+    def add(self, key: str, count: int = 1) -> int:
+        """Count a key, returning its new estimate"""
+        columns = _columns(key, self.width, self.depth)
+        self.table[self._rows, columns] += count
+        return int(self.table[self._rows, columns].min())
+    
+    def estimate(self, key: str) -> int:
+        """Estimated count of a key"""
+        return int(self.table[self._rows, _columns(key, self.width, self.depth)].min())
+    
+    def merge(self, other: "CountMinSketch"):
+        """Add the counts of a sketch with the same shape"""
+        self.table += other.table
+
+class HyperLogLog:
+    """Approximate number of distinct strings, within about 1.04 / sqrt(2^precision)"""
+    
+    def __init__(self, precision: int = 12, registers: Optional[np.ndarray] = None):
+        """Initialize an empty counter, or one over existing registers"""
+        self.registers = registers if registers is not None else np.zeros(1 << precision, dtype=np.uint8)
+        self.precision = int(math.log2(len(self.registers)))
+    
+    def add(self, value: str):
+        """Count a value"""
+        h, _ = _hash(value)
+        bits = 64 - self.precision
+        index = h >> bits
+        rank = bits - (h & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+    
+    def count(self) -> int:
+        """Estimated number of distinct values"""
+        m = len(self.registers)
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / float(np.sum(np.ldexp(1.0, -self.registers.astype(np.int32))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        # Linear counting is more accurate while many registers are still empty
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+    
+    def merge(self, other: "HyperLogLog"):
+        """Count the values of a counter with the same precision"""
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+class SkillStream:
+    """
+    Skill counts, heavy hitters and distinct users for one event stream in one week
+    
+    Counts live in a count-min sketch; the skills with the highest estimates
+    are tracked as heavy-hitter candidates, so the top skills can be listed
+    without storing every skill seen.
+    """
+    
+    # Heavy-hitter candidates kept per stream
+    CANDIDATES = 64
+    
+    def __init__(self, width: int = 1024, depth: int = 4, precision: int = 12):
+        """Initialize an empty stream"""
+        self.events = 0
+        self.counts = CountMinSketch(width, depth)
+        self.users = HyperLogLog(precision)
+        self.candidates: Dict[str, int] = {}
+        self._floor = 0
+    
+    def add(self, events: List[Tuple[Tuple[str, ...], Optional[str]]]):
+        """Record a batch of events, each the skills it carried and the user who sent it"""
+        self.events += len(events)
+        skill_counts = collections.Counter()
+        for skills, user in events:
+            skill_counts.update(skills)
+            if user:
+                self.users.add(user)
+        # One sketch update per distinct skill in the batch
+        for skill, count in skill_counts.items():
+            self._offer(skill, self.counts.add(skill, count))
+    
+    def _offer(self, skill: str, estimate: int):
+        """Keep the skill as a candidate if its estimate beats the weakest one"""
+        if skill in self.candidates or len(self.candidates) < self.CANDIDATES:
+            self.candidates[skill] = estimate
+        elif estimate > self._floor:
+            weakest = min(self.candidates, key=self.candidates.get)
+            del self.candidates[weakest]
+            self.candidates[skill] = estimate
+        else:
+            return
+        if len(self.candidates) == self.CANDIDATES:
+            self._floor = min(self.candidates.values())
+    
+    def merge(self, other: "SkillStream"):
+        """Add another worker's or snapshot's stream for the same week"""
+        self.events += other.events
+        self.counts.merge(other.counts)
+        self.users.merge(other.users)
+        skills = set(self.candidates) | set(other.candidates)
+        estimates = sorted(((self.counts.estimate(skill), skill) for skill in skills), reverse=True)
+        self.candidates = {skill: count for count, skill in estimates[:self.CANDIDATES]}
+        self._floor = min(self.candidates.values()) if len(self.candidates) == self.CANDIDATES else 0
+    
+    def summary(self, top_k: int = 10, skill: Optional[str] = None) -> Dict[str, Any]:
+        """Event count, distinct users and the top_k skills, plus the count of one skill if given"""
+        top = sorted(self.candidates.items(), key=lambda item: (-item[1], item[0]))[:top_k]
+        summary = {
+            "events": self.events,
+            "distinct_users": self.users.count(),
+            "top_skills": [{"skill": name, "count": count} for name, count in top]
+        }
+        if skill is not None:
+            summary["skill"] = {"skill": skill, "count": self.counts.estimate(skill)}
+        return summary
+
+class SkillAnalytics(BackgroundModel):
+    """
+    Streaming counts of extracted and missing skills, in bounded memory
+    
+    Requests only append their results to a pending queue; a background
+    thread folds the queue into per-week streams every FLUSH_SECONDS and
+    writes a snapshot to directory every snapshot_interval seconds. There is
+    one "extracted" stream and one "missing:<role>" stream per target role,
+    each a fixed-size sketch, and weeks older than retention_weeks are
+    dropped, so memory does not grow with traffic.
+    
+    Each worker process writes its own snapshot file and takes over those
+    of exited workers (see BackgroundModel). Reports merge the live streams
+    of this worker with every other snapshot in directory, since the
+    sketches add up.
+    """
+    
+    PREFIX = "analytics"
+    EXTRACTED = "extracted"
+    MISSING_PREFIX = "missing:"
+    
+    def __init__(self, directory: Optional[str] = None, retention_weeks: int = 12, snapshot_interval: float = 300.0,
+                 width: int = 1024, depth: int = 4, precision: int = 12):
+        """Initialize empty analytics; without a directory nothing is snapshotted"""
+        super().__init__(directory, snapshot_interval)
+        self.retention_weeks = retention_weeks
+        self.sketch_shape = (width, depth, precision)
+        self.streams: Dict[Tuple[str, str], SkillStream] = {}
+        self._loaded: Dict[str, Tuple[float, Dict[Tuple[str, str], SkillStream]]] = {}
+    
+    def record_extraction(self, skills: Iterable[str], user: Optional[str] = None):
+        """Queue the skills extracted from one resume"""
+        self._record(self.EXTRACTED, skills, user)
+    
+    def record_match(self, role: str, missing_skills: Iterable[str], user: Optional[str] = None):
+        """Queue the skills one match found missing for a target role"""
+        self._record(self.MISSING_PREFIX + role, missing_skills, user)
+    
+    def _record(self, name: str, skills: Iterable[str], user: Optional[str]):
+        """Queue one event for a stream"""
+        self._enqueue((time.time(), name, tuple(skills), user))
+    
+    def _fold(self, items: List[Tuple[float, str, Tuple[str, ...], Optional[str]]]):
+        """Fold queued events into the weekly streams and drop weeks past retention"""
+        batches = collections.defaultdict(list)
+        for timestamp, name, skills, user in items:
+            batches[(week_of(timestamp), name)].append((skills, user))
+        for key, events in batches.items():
+            stream = self.streams.get(key)
+            if stream is None:
+                stream = self.streams[key] = SkillStream(*self.sketch_shape)
+            stream.add(events)
+            self._dirty = True
+        oldest = self._oldest_week()
+        for key in [key for key in self.streams if key[0] < oldest]:
+            del self.streams[key]
+    
+    def _oldest_week(self) -> str:
+        """Earliest week still retained"""
+        return week_of(time.time() - (self.retention_weeks - 1) * 7 * 86400)
+    
+    def _snapshot_arrays(self) -> Dict[str, np.ndarray]:
+        """Sketch tables and registers of every stream, with a JSON manifest"""
+        arrays = {}
+        manifest = []
+        for i, ((week, name), stream) in enumerate(self.streams.items()):
+            arrays[f"counts_{i}"] = stream.counts.table.copy()
+            arrays[f"users_{i}"] = stream.users.registers.copy()
+            manifest.append({"week": week, "name": name, "events": stream.events,
+                             "candidates": list(stream.candidates)})
+        arrays["manifest"] = np.frombuffer(json.dumps(manifest).encode("utf-8"), dtype=np.uint8)
+        return arrays
+    
+    def snapshot(self) -> bool:
+        """Write this worker's streams to its snapshot file, and delete snapshots past retention"""
+        if not super().snapshot():
+            return False
+        oldest = self._oldest_week()
+        for other in self.other_files():
+            try:
+                if all(week < oldest for week, _ in self._read_snapshot(other)):
+                    os.remove(other)
+                    self._loaded.pop(other, None)
+            except (OSError, ValueError, KeyError):
+                self.errors += 1
+        return True
+    
+    def _load_snapshot(self, path: str) -> Dict[Tuple[str, str], SkillStream]:
+        """Streams stored in a snapshot file"""
+        streams = {}
+        with np.load(path, allow_pickle=False) as data:
+            manifest = json.loads(data["manifest"].tobytes().decode("utf-8"))
+            for i, entry in enumerate(manifest):
+                stream = SkillStream(*self.sketch_shape)
+                stream.events = entry["events"]
+                stream.counts = CountMinSketch(table=data[f"counts_{i}"])
+                stream.users = HyperLogLog(registers=data[f"users_{i}"])
+                stream.candidates = {skill: stream.counts.estimate(skill) for skill in entry["candidates"]}
+                streams[(entry["week"], entry["name"])] = stream
+        return streams
+    
+    def _read_snapshot(self, path: str) -> Dict[Tuple[str, str], SkillStream]:
+        """Streams stored in another worker's snapshot file, cached until the file changes"""
+        mtime = os.path.getmtime(path)
+        cached = self._loaded.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        streams = self._load_snapshot(path)
+        self._loaded[path] = (mtime, streams)
+        return streams
+    
+    def _adopt(self, path: str):
+        """Merge the retained weeks of an exited worker's snapshot into this worker's streams"""
+        oldest = self._oldest_week()
+        for key, stream in self._load_snapshot(path).items():
+            if key[0] < oldest:
+                continue
+            if key not in self.streams:
+                self.streams[key] = SkillStream(*self.sketch_shape)
+            self.streams[key].merge(stream)
+    
+    def _other_snapshots(self) -> List[Dict[Tuple[str, str], SkillStream]]:
+        """Streams of every other worker's snapshot, dropping cached files that are gone"""
+        if not self.directory:
+            return []
+        paths = self.other_files()
+        for path in set(self._loaded) - set(paths):
+            self._loaded.pop(path, None)
+        snapshots = []
+        for path in paths:
+            try:
+                snapshots.append(self._read_snapshot(path))
+            except (OSError, ValueError, KeyError):
+                # Removed or replaced while we read it; skip it this time
+                self.errors += 1
+        return snapshots
+    
+    def _merged(self, week: str) -> Dict[str, SkillStream]:
+        """This worker's streams for a week, merged with every other worker's snapshot"""
+        sources = self._other_snapshots()
+        merged: Dict[str, SkillStream] = {}
+        with self._lock:
+            sources.append(self.streams)
+            for streams in sources:
+                for (stream_week, name), stream in streams.items():
+                    if stream_week != week:
+                        continue
+                    if name not in merged:
+                        merged[name] = SkillStream(*self.sketch_shape)
+                    merged[name].merge(stream)
+        return merged
+    
+    def weeks(self) -> List[str]:
+        """Weeks with data in this worker or any snapshot, newest first"""
+        weeks = {week for week, _ in self.streams}
+        for streams in self._other_snapshots():
+            weeks.update(week for week, _ in streams)
+        oldest = self._oldest_week()
+        return sorted((week for week in weeks if week >= oldest), reverse=True)
+    
+    def report(self, week: Optional[str] = None, role: Optional[str] = None, top_k: int = 10,
+               skill: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Top extracted skills and top missing skills per role for a week (default: the current one)
+        
+        Counts are estimates that may run slightly high; distinct users are
+        estimated to within a few percent. role limits the missing skills to
+        one role, and skill adds that skill's count to every stream.
+        """
+        self.flush()
+        week = week or week_of(time.time())
+        streams = self._merged(week)
+        extracted = streams.get(self.EXTRACTED) or SkillStream(*self.sketch_shape)
+        missing = {}
+        for name, stream in sorted(streams.items()):
+            if name.startswith(self.MISSING_PREFIX):
+                stream_role = name[len(self.MISSING_PREFIX):]
+                if role is None or stream_role == role:
+                    missing[stream_role] = stream.summary(top_k, skill)
+        return {
+            "week": week,
+            "weeks": self.weeks(),
+            "extracted": extracted.summary(top_k, skill),
+            "missing_by_role": missing
+        }
+    
+    def stats(self) -> Dict[str, Any]:
+        """Counters for this worker process"""
+        return {
+            "recorded": self.recorded,
+            "dropped": self.dropped,
+            "pending": len(self._pending),
+            "streams": len(self.streams),
+            "snapshots": self.snapshots,
+            "errors": self.errors
+        }
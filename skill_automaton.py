@@ -0,0 +1,73 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+class SkillAutomaton:
+    """
+    Aho-Corasick automaton over skill keyword variants
+    
+    Finds every occurrence of every keyword in a single left-to-right scan of
+    the text, so the cost depends on the text length rather than on the number
+    of keywords. Matching is plain substring matching, the same semantics as
+    the `keyword in text` checks used by the compact extraction path.
+    """
+    
+    def __init__(self, keywords: Dict[str, str]):
+        """Build the automaton from a mapping of keyword variant -> canonical skill"""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, int]]] = [[]]
+        
+        for variant, skill in keywords.items():
+            if variant:
+                self._add(variant, skill)
+        self._build_failure_links()
+    
+    @classmethod
+    def from_skills(cls, skills: Iterable[str]) -> "SkillAutomaton":
+        """Build an automaton matching the same spelling variants as keyword extraction"""
+        keywords = {}
+        for skill in skills:
+            for variant in (skill, skill.replace(' ', ''), skill.replace(' ', '-'), skill.replace(' ', '_')):
+                keywords.setdefault(variant, skill)
+        return cls(keywords)
+    
+    def _add(self, variant: str, skill: str):
+        """Insert a keyword variant into the trie"""
+        state = 0
+        for char in variant:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((skill, len(variant)))
+    
+    def _build_failure_links(self):
+        """Compute failure links breadth-first and merge outputs along them"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+    
+    def find_all(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, skill) for every keyword occurrence in text"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for skill, length in output[state]:
+                yield index + 1 - length, index + 1, skill
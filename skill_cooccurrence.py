@@ -0,0 +1,290 @@
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from background_model import BackgroundModel
+
+class SkillCooccurrence(BackgroundModel):
+    """
+    How often skills appear together in processed resumes, learned as resumes arrive
+    
+    Pair counts form a sparse symmetric skill x skill matrix, stored once as
+    its upper triangle: a sorted array of pair keys (first id << 32 | second
+    id) with two aligned count arrays, one for the resumes this worker
+    processed and one for the other workers' snapshots. For each skill the
+    TOP_NEIGHBORS most frequent companions are kept ranked, with the share
+    of resumes listing the skill that also list them, so a recommendation
+    only reads those short lists. Requests only queue their skills; the
+    flush thread adds the queue in every FLUSH_SECONDS and re-ranks the
+    skills it touched.
+    
+    Each worker process saves the counts it learned itself to its own .npz
+    file in directory (see BackgroundModel) and re-reads the files of the
+    other workers, including those of earlier runs, when they change.
+    """
+    
+    PREFIX = "cooccurrence"
+    # Ranked companions kept per skill
+    TOP_NEIGHBORS = 64
+    # Skills beyond this many in one resume are ignored, bounding the pairs a resume adds
+    MAX_SKILLS_PER_RESUME = 100
+    
+    def __init__(self, directory: Optional[str] = None, min_count: int = 2, snapshot_interval: float = 300.0):
+        """Initialize the model, reading the snapshots in directory if given"""
+        super().__init__(directory, snapshot_interval)
+        self.min_count = min_count
+        self.skills: List[str] = []
+        self.skill_ids: Dict[str, int] = {}
+        self._keys = np.zeros(0, dtype=np.int64)
+        self._own = np.zeros(0, dtype=np.int32)
+        self._base = np.zeros(0, dtype=np.int32)
+        self._own_totals = np.zeros(0, dtype=np.int64)
+        self._base_totals = np.zeros(0, dtype=np.int64)
+        self._own_resumes = 0
+        self._base_resumes = 0
+        self._neighbors: Dict[int, Tuple[List[int], List[float]]] = {}
+        self._base_files: Optional[Dict[str, float]] = {}
+        if directory:
+            self.refresh_base()
+    
+    @property
+    def resumes(self) -> int:
+        """Resumes counted by this worker and the snapshots it read"""
+        return self._own_resumes + self._base_resumes
+    
+    def _skill_id(self, skill: str) -> int:
+        """Id of a skill, assigning the next one to a new skill"""
+        skill_id = self.skill_ids.get(skill)
+        if skill_id is None:
+            skill_id = self.skill_ids[skill] = len(self.skills)
+            self.skills.append(skill)
+        return skill_id
+    
+    def _grow_totals(self):
+        """Extend the per-skill totals to every skill assigned an id"""
+        missing = len(self.skills) - len(self._own_totals)
+        if missing > 0:
+            self._own_totals = np.concatenate([self._own_totals, np.zeros(missing, dtype=np.int64)])
+            self._base_totals = np.concatenate([self._base_totals, np.zeros(missing, dtype=np.int64)])
+    
+    @staticmethod
+    def _pair_keys(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """Upper-triangle keys of skill id pairs, whichever order the ids come in"""
+        first, second = first.astype(np.int64), second.astype(np.int64)
+        return (np.minimum(first, second) << 32) | np.maximum(first, second)
+    
+    def record(self, skills: Iterable[str]):
+        """Queue the skills found in one processed resume"""
+        self._enqueue(tuple(skills))
+    
+    def _fold(self, items: List[Tuple[str, ...]]):
+        """Count the pairs of every queued resume and re-rank the skills they touched"""
+        if not items:
+            return
+        keys = []
+        resume_ids = []
+        for skills in items:
+            names = sorted(set(skills))[:self.MAX_SKILLS_PER_RESUME]
+            ids = np.array([self._skill_id(name) for name in names], dtype=np.int64)
+            first, second = np.triu_indices(len(ids), 1)
+            keys.append(self._pair_keys(ids[first], ids[second]))
+            resume_ids.append(ids)
+        self._own_resumes += len(items)
+        self._grow_totals()
+        ids = np.concatenate(resume_ids)
+        self._own_totals += np.bincount(ids, minlength=len(self._own_totals))
+        self._add_pairs(*np.unique(np.concatenate(keys), return_counts=True), own=True)
+        self._dirty = True
+        self._rank(np.unique(ids))
+    
+    def _add_pairs(self, keys: np.ndarray, counts: np.ndarray, own: bool):
+        """Add counts for sorted, distinct pair keys to this worker's counts or the base"""
+        position = np.searchsorted(self._keys, keys)
+        found = position < len(self._keys)
+        found[found] = self._keys[position[found]] == keys[found]
+        target = self._own if own else self._base
+        target[position[found]] += counts[found].astype(np.int32)
+        new = ~found
+        if new.any():
+            at = position[new]
+            added = counts[new].astype(np.int32)
+            zeros = np.zeros(len(at), dtype=np.int32)
+            self._keys = np.insert(self._keys, at, keys[new])
+            self._own = np.insert(self._own, at, added if own else zeros)
+            self._base = np.insert(self._base, at, zeros if own else added)
+    
+    def _rank(self, ids: np.ndarray):
+        """Rebuild the ranked companions of the given skills from the pair store"""
+        first, second = self._keys >> 32, self._keys & 0xFFFFFFFF
+        touched = np.zeros(len(self.skills), dtype=bool)
+        touched[ids] = True
+        # Each pair is stored once, so a skill's companions come from both ends
+        as_first, as_second = np.flatnonzero(touched[first]), np.flatnonzero(touched[second])
+        picked = np.concatenate([as_first, as_second])
+        count = self._own[picked].astype(np.int64) + self._base[picked]
+        skill = np.concatenate([first[as_first], second[as_second]])
+        other = np.concatenate([second[as_first], first[as_second]])
+        keep = count >= self.min_count
+        skill, other, count = skill[keep], other[keep], count[keep]
+        order = np.argsort(skill, kind="stable")
+        skill, other, count = skill[order], other[order], count[order]
+        
+        totals = self._own_totals + self._base_totals
+        starts = np.flatnonzero(np.r_[True, skill[1:] != skill[:-1]]) if len(skill) else np.zeros(0, dtype=np.int64)
+        ranked = set()
+        for start, end in zip(starts.tolist(), np.r_[starts[1:], len(skill)].tolist()):
+            i = int(skill[start])
+            if not totals[i]:
+                continue
+            row_count, row_other = count[start:end], other[start:end]
+            top = np.arange(end - start)
+            if end - start > self.TOP_NEIGHBORS:
+                # Every companion tied with the last one kept, so ties break by id as in a full sort
+                threshold = np.partition(row_count, end - start - self.TOP_NEIGHBORS)[end - start - self.TOP_NEIGHBORS]
+                top = np.flatnonzero(row_count >= threshold)
+            top = top[np.lexsort((row_other[top], -row_count[top]))][:self.TOP_NEIGHBORS]
+            # Replaced whole, so queries running meanwhile see the old list or the new one
+            self._neighbors[i] = (row_other[top].tolist(), (row_count[top] / totals[i]).tolist())
+            ranked.add(i)
+        for i in ids.tolist():
+            if i not in ranked:
+                self._neighbors.pop(i, None)
+    
+    def recommend(self, skills: Iterable[str], top_k: int = 10) -> Dict[str, Any]:
+        """
+        Skills that people with the given skills also have, most likely first
+        
+        A candidate's score is the share of resumes with each given skill
+        that also list the candidate, averaged over the given skills. Each
+        recommendation's because field lists the given skills the candidate
+        was seen with. Skills never seen in a resume are reported as unknown.
+        """
+        given = {skill.lower().strip() for skill in skills if skill.strip()}
+        known = [self.skill_ids[skill] for skill in sorted(given) if skill in self.skill_ids]
+        unknown = sorted(skill for skill in given if skill not in self.skill_ids)
+        given_ids = set(known)
+        
+        scores: Dict[int, float] = {}
+        because: Dict[int, List[str]] = {}
+        for i in known:
+            neighbors = self._neighbors.get(i)
+            if neighbors is None:
+                continue
+            for j, share in zip(*neighbors):
+                if j in given_ids:
+                    continue
+                scores[j] = scores.get(j, 0.0) + share
+                because.setdefault(j, []).append(self.skills[i])
+        
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self.skills[item[0]]))[:top_k]
+        return {
+            "resumes": self.resumes,
+            "unknown_skills": unknown,
+            "recommendations": [
+                {"skill": self.skills[j], "score": round(score / len(known), 4), "because": because[j]}
+                for j, score in ranked
+            ]
+        }
+    
+    def _snapshot_arrays(self) -> Dict[str, np.ndarray]:
+        """Skill names, totals and upper-triangle pair counts this worker learned"""
+        learned = self._own > 0
+        keys = self._keys[learned]
+        return {
+            "skills": np.frombuffer(json.dumps(self.skills).encode("utf-8"), dtype=np.uint8),
+            "totals": self._own_totals.copy(),
+            "rows": (keys >> 32).astype(np.int32),
+            "cols": (keys & 0xFFFFFFFF).astype(np.int32),
+            "counts": self._own[learned],
+            "resumes": np.array(self._own_resumes, dtype=np.int64)
+        }
+    
+    def _read_counts(self, path: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
+        """Pair keys and counts, skill ids and totals, and resume count of a snapshot file, in this model's ids"""
+        with np.load(path, allow_pickle=False) as data:
+            ids = np.array(
+                [self._skill_id(skill) for skill in json.loads(data["skills"].tobytes().decode("utf-8"))],
+                dtype=np.int64
+            )
+            keys = self._pair_keys(ids[data["rows"]], ids[data["cols"]])
+            unique_keys, inverse = np.unique(keys, return_inverse=True)
+            counts = np.bincount(inverse, weights=data["counts"], minlength=len(unique_keys)).astype(np.int64)
+            return unique_keys, counts, ids, data["totals"][:len(ids)].astype(np.int64), int(data["resumes"])
+    
+    def _adopt(self, path: str):
+        """Add an exited worker's counts to this worker's own"""
+        keys, counts, ids, totals, resumes = self._read_counts(path)
+        self._grow_totals()
+        np.add.at(self._own_totals, ids, totals)
+        self._add_pairs(keys, counts, own=True)
+        self._own_resumes += resumes
+    
+    def adopt_exited(self) -> int:
+        """Take over exited workers' snapshots, then re-read the base, which may still count them"""
+        adopted = super().adopt_exited()
+        if adopted:
+            self._base_files = None
+            self.refresh_base()
+        return adopted
+    
+    def _snapshot_due(self):
+        """Snapshot if anything was learned, and pick up other workers' counts"""
+        super()._snapshot_due()
+        self.refresh_base()
+    
+    def refresh_base(self):
+        """Re-read the other workers' snapshots if any changed, and re-rank every skill"""
+        files = {}
+        for path in self.other_files():
+            try:
+                files[path] = os.path.getmtime(path)
+            except OSError:
+                continue
+        if files == self._base_files:
+            return
+        
+        # Reading assigns ids to new skills, which flush does too
+        with self._lock:
+            keys, counts, totals = [], [], []
+            resumes = 0
+            for path in list(files):
+                try:
+                    file_keys, file_counts, ids, file_totals, file_resumes = self._read_counts(path)
+                except (OSError, ValueError, KeyError):
+                    # Replaced or removed while we read it; picked up on the next refresh
+                    self.errors += 1
+                    files.pop(path)
+                    continue
+                keys.append(file_keys)
+                counts.append(file_counts)
+                totals.append((ids, file_totals))
+                resumes += file_resumes
+            
+            # Pairs only the old base had are dropped, then the new base is added in
+            learned = self._own > 0
+            self._keys, self._own = self._keys[learned], self._own[learned]
+            self._base = np.zeros(len(self._keys), dtype=np.int32)
+            if keys:
+                unique_keys, inverse = np.unique(np.concatenate(keys), return_inverse=True)
+                summed = np.bincount(inverse, weights=np.concatenate(counts), minlength=len(unique_keys))
+                self._add_pairs(unique_keys, summed.astype(np.int64), own=False)
+            self._grow_totals()
+            self._base_totals = np.zeros(len(self.skills), dtype=np.int64)
+            for ids, file_totals in totals:
+                np.add.at(self._base_totals, ids, file_totals)
+            self._base_resumes = resumes
+            self._base_files = files
+            self._rank(np.arange(len(self.skills)))
+    
+    def stats(self) -> Dict[str, Any]:
+        """Model size and counters for this worker process"""
+        return {
+            "resumes": self.resumes,
+            "skills": int(np.count_nonzero(self._own_totals + self._base_totals)),
+            "pairs": len(self._keys),
+            "recorded": self.recorded,
+            "dropped": self.dropped,
+            "pending": len(self._pending),
+            "snapshots": self.snapshots,
+            "errors": self.errors
+        }
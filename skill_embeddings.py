@@ -0,0 +1,175 @@
+import hashlib
+import os
+import zlib
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+
+# Well-known abbreviations and nicknames that share no spelling with the skill they stand for
+SKILL_ABBREVIATIONS = {
+    "k8s": "kubernetes",
+    "js": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "golang": "go",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "sklearn": "scikit-learn",
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "nlu": "natural language processing",
+    "amazon web services": "aws",
+    "google cloud": "gcp",
+    "google cloud platform": "gcp",
+    "ms azure": "azure",
+    "nodejs": "node.js",
+    "node": "node.js",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "nextjs": "next.js",
+    "gha": "github actions",
+    "cicd": "ci/cd",
+    "ci cd": "ci/cd",
+    "oop": "object-oriented programming",
+    "rest": "rest api",
+    "restful api": "rest api",
+}
+
+class SkillEmbeddingIndex:
+    """
+    Local, CPU-only vector index over a skill vocabulary
+    
+    Every skill is embedded once into a unit-normalized vector. The vectors are
+    stored as the columns of a (dim x skills) NumPy matrix, saved to disk and
+    memory-mapped on later loads; the column layout keeps query products
+    contiguous. Unknown skills are resolved by batched cosine similarity (a
+    single matrix product) and top-k.
+    
+    Embeddings combine hashed character n-grams, which relate spelling variants
+    such as "PyTorch Lightning" and "pytorch", with SpaCy's static word vectors
+    when the loaded model ships them (e.g. en_core_web_md), which can relate
+    different words with similar meaning.
+    """
+    
+    NGRAM_DIM = 256
+    NGRAM_SIZE = 3
+    # Relative weight of the static word-vector part of an embedding
+    STATIC_WEIGHT = 0.5
+    
+    def __init__(self, skills: Iterable[str], nlp=None, cache_dir: str = ".skill_embeddings"):
+        """Initialize the index, loading the vocabulary matrix from disk or building it"""
+        self.skills = sorted(set(skills))
+        self.skill_ids = {skill: i for i, skill in enumerate(self.skills)}
+        
+        # Only use SpaCy when the model actually has static vectors
+        if nlp is not None and nlp.vocab.vectors.shape[0] > 0:
+            self.nlp = nlp
+            self.static_dim = nlp.vocab.vectors.shape[1]
+        else:
+            self.nlp = None
+            self.static_dim = 0
+        
+        self.dim = self.NGRAM_DIM + self.static_dim
+        model_name = self.nlp.meta.get("name", "") if self.nlp is not None else ""
+        # Changes with the vocabulary or the embedding configuration, so results keyed on it never go stale
+        key = "\n".join([model_name, str(self.dim), str(self.NGRAM_SIZE)] + self.skills)
+        self.version = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        self.matrix_t = self._load_or_build(cache_dir)
+    
+    def _cache_path(self, cache_dir: str) -> str:
+        """Path of the matrix file for this vocabulary and embedding configuration"""
+        return os.path.join(cache_dir, f"skills-{self.version}.T.npy")
+    
+    def _load_or_build(self, cache_dir: str) -> np.ndarray:
+        """Memory-map the cached matrix, building and saving it first if needed"""
+        path = self._cache_path(cache_dir)
+        try:
+            if not os.path.exists(path):
+                os.makedirs(cache_dir, exist_ok=True)
+                # Write to a temporary file first so concurrent workers never map a partial file
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    np.save(f, np.ascontiguousarray(self.embed(self.skills).T))
+                os.replace(tmp_path, path)
+            return np.load(path, mmap_mode="r")
+        except OSError:
+            # Read-only or missing cache directory: keep the matrix in memory
+            return np.ascontiguousarray(self.embed(self.skills).T)
+    
+    def _ngram_vector(self, text: str) -> np.ndarray:
+        """Hashed character n-gram features of a skill name"""
+        vector = np.zeros(self.NGRAM_DIM, dtype=np.float32)
+        for word in text.lower().split():
+            padded = f"<{word}>"
+            # Whole words count as a feature too, so short names still match exactly
+            features = [padded] + [padded[i:i + self.NGRAM_SIZE] for i in range(len(padded) - self.NGRAM_SIZE + 1)]
+            for feature in features:
+                vector[zlib.crc32(feature.encode("utf-8")) % self.NGRAM_DIM] += 1.0
+        return vector
+    
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts into unit-normalized rows"""
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            ngrams = self._ngram_vector(text)
+            norm = np.linalg.norm(ngrams)
+            if norm > 0:
+                matrix[row, :self.NGRAM_DIM] = ngrams / norm
+            
+            if self.nlp is not None:
+                doc = self.nlp.make_doc(text.lower())
+                if doc.has_vector:
+                    static = doc.vector
+                    norm = np.linalg.norm(static)
+                    if norm > 0:
+                        matrix[row, self.NGRAM_DIM:] = static / norm * self.STATIC_WEIGHT
+        
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+    
+    def query(self, texts: List[str], k: int = 5, min_score: float = 0.0) -> List[List[Tuple[str, float]]]:
+        """Top-k most similar vocabulary skills for each text, as (skill, cosine) pairs"""
+        if not texts or not self.skills:
+            return [[] for _ in texts]
+        
+        embedded = self.embed(texts)
+        if self.static_dim == 0:
+            # N-gram embeddings are sparse: only the matrix rows of the queries' features
+            # contribute, a few dozen of NGRAM_DIM, so the product reads a fraction of the matrix
+            dims = np.flatnonzero(embedded.any(axis=0))
+            scores = embedded[:, dims] @ self.matrix_t[dims]
+        else:
+            scores = embedded @ self.matrix_t
+        k = min(k, len(self.skills))
+        if k == 1:
+            top = scores.argmax(axis=1)[:, None]
+        else:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        
+        results = []
+        for row, candidates in enumerate(top):
+            ranked = candidates[np.argsort(-scores[row, candidates])]
+            results.append([
+                (self.skills[i], round(float(scores[row, i]), 4))
+                for i in ranked if scores[row, i] >= min_score
+            ])
+        return results
+    
+    def resolve(self, skills: List[str], threshold: float = 0.6) -> List[Optional[str]]:
+        """Map each skill to itself if known, else its abbreviation target, else its nearest vocabulary skill above threshold"""
+        resolved: List[Optional[str]] = [
+            skill if skill in self.skill_ids
+            else SKILL_ABBREVIATIONS[skill] if SKILL_ABBREVIATIONS.get(skill) in self.skill_ids
+            else None
+            for skill in skills
+        ]
+        unknown = [i for i, skill in enumerate(skills) if resolved[i] is None]
+        if unknown:
+            matches = self.query([skills[i] for i in unknown], k=1, min_score=threshold)
+            for i, match in zip(unknown, matches):
+                if match:
+                    resolved[i] = match[0][0]
+        return resolved
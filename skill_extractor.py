@@ -1,19 +1,70 @@
-import spacy
+import difflib
+import hashlib
 import re
-from typing import List, Set
+import threading
+import time
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 import json
 import os
+from skill_automaton import SkillAutomaton
+from skill_taxonomy import SkillTaxonomy
+import resume_sections
+
+# Patterns for "X years of Y", "experience with Y", etc. The first pattern also
+# captures the number of years, which detailed extraction reports per skill.
+# Captures stop at the end of the line and at punctuation other than the ones
+# skill names use; the skill is the longest known prefix of the capture.
+SKILL_PATTERNS = [
+    r'(\d+)\s*(?:years?|yrs?)\s*(?:of|in)\s*([a-zA-Z \t\+\#\./-]+)',
+    r'experience\s+(?:with|in)\s+([a-zA-Z \t\+\#\./-]+)',
+    r'proficient\s+in\s+([a-zA-Z \t\+\#\./-]+)',
+    r'skilled\s+in\s+([a-zA-Z \t\+\#\./-]+)',
+    r'expertise\s+in\s+([a-zA-Z \t\+\#\./-]+)',
+    r'knowledge\s+of\s+([a-zA-Z \t\+\#\./-]+)',
+    r'familiar\s+with\s+([a-zA-Z \t\+\#\./-]+)',
+]
+
+# Longest skill name, in words, looked for at the start of a pattern capture
+MAX_PATTERN_WORDS = 6
+
+# Extraction methods per mode, cheapest first. fast answers from the keyword
+# automaton alone; thorough adds NER over the whole resume and fuzzy matching.
+EXTRACTION_MODES = {
+    "fast": ("keyword",),
+    "balanced": ("keyword", "pattern", "ner"),
+    "thorough": ("keyword", "pattern", "ner", "fuzzy"),
+}
+
+# Fuzzy matching pairs words with keywords of at least this length, so short
+# names such as "go" or "scala" never match ordinary words
+FUZZY_MIN_LENGTH = 6
+FUZZY_CUTOFF = 0.9
+
+WORD_PATTERN = re.compile(r'[a-z0-9+#]+')
+
+class Deadline:
+    """Time budget for one extraction, recording whether any method was cut short"""
+    
+    __slots__ = ("expires_at", "partial")
+    
+    def __init__(self, budget_ms: Optional[float] = None):
+        """Initialize the budget, starting now; None means no limit"""
+        self.expires_at = time.perf_counter() + budget_ms / 1000 if budget_ms is not None else None
+        self.partial = False
+    
+    def expired(self) -> bool:
+        """True once the budget is spent, which marks the result partial"""
+        if self.expires_at is not None and time.perf_counter() >= self.expires_at:
+            self.partial = True
+        return self.partial
 
 class SkillExtractor:
-    def __init__(self):
-        """Initialize the skill extractor with SpaCy model and skill keywords"""
-        try:
-            # Load SpaCy model (you may need to download it first: python -m spacy download en_core_web_sm)
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            # If model not found, we'll use a fallback approach
-            self.nlp = None
-            print("Warning: SpaCy model not found. Using keyword-based extraction only.")
+    def __init__(self, taxonomy_path: Optional[str] = None, ner_sections: Optional[Collection[str]] = None):
+        """Initialize the skill extractor with skill keywords and optional taxonomy"""
+        # SpaCy is imported and its model loaded on first use of self.nlp (see warm_up)
+        self._nlp = None
+        self._nlp_loaded = False
+        self._nlp_lock = threading.Lock()
         
         # Common technical skills and programming languages
         self.technical_skills = {
@@ -62,6 +113,63 @@ class SkillExtractor:
         
         # Load skill keywords from JSON file
         self.skill_keywords = self._load_skill_keywords()
+        
+        # Large taxonomies (ESCO, O*NET) are matched through their alias table
+        # rather than scanned keyword by keyword
+        self.taxonomy = self._load_taxonomy(taxonomy_path)
+        
+        # Longest keyword decides how much text must be carried across chunk
+        # boundaries when extracting from a stream of chunks
+        self.max_keyword_length = max((len(skill) for skill in self.skill_keywords), default=0)
+        if self.taxonomy is not None:
+            self.max_keyword_length = max(self.max_keyword_length, self.taxonomy.max_alias_length)
+        
+        # Automaton used by detailed extraction and fast mode to find every keyword occurrence in one scan
+        self.keyword_automaton = SkillAutomaton.from_skills(self.skill_keywords)
+        
+        # Fuzzy matching candidates by (word count, length)
+        self.fuzzy_keywords: Dict[Tuple[int, int], List[str]] = {}
+        for skill in self.skill_keywords:
+            if len(skill) >= FUZZY_MIN_LENGTH:
+                self.fuzzy_keywords.setdefault((skill.count(' ') + 1, len(skill)), []).append(skill)
+        
+        # Resume sections NER runs over by default; keyword and pattern matching cover the whole text
+        self.ner_sections = frozenset(ner_sections) if ner_sections is not None else resume_sections.DEFAULT_NER_SECTIONS
+        
+        # Changes whenever the vocabulary changes, so cached extraction results can be keyed on it
+        taxonomy_digest = self.taxonomy.content_digest() if self.taxonomy is not None else None
+        canonical = json.dumps([sorted(self.skill_keywords), taxonomy_digest], separators=(",", ":"))
+        self.data_version = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+    
+    @property
+    def nlp(self):
+        """SpaCy pipeline, loaded on first access; None when SpaCy or its model is missing"""
+        if not self._nlp_loaded:
+            with self._nlp_lock:
+                if not self._nlp_loaded:
+                    self._nlp = self._load_nlp()
+                    self._nlp_loaded = True
+        return self._nlp
+    
+    @nlp.setter
+    def nlp(self, value):
+        self._nlp = value
+        self._nlp_loaded = True
+    
+    def _load_nlp(self):
+        """Import SpaCy and load the English model"""
+        try:
+            import spacy
+            # Load SpaCy model (you may need to download it first: python -m spacy download en_core_web_sm)
+            return spacy.load("en_core_web_sm")
+        except (ImportError, OSError):
+            # If model not found, we'll use a fallback approach
+            print("Warning: SpaCy model not found. Using keyword-based extraction only.")
+            return None
+    
+    def warm_up(self):
+        """Load the SpaCy model now rather than on the first extraction"""
+        return self.nlp
     
     def _load_skill_keywords(self) -> Set[str]:
         """Load skill keywords from JSON file or return default set"""
@@ -76,30 +184,251 @@ class SkillExtractor:
         except Exception:
             return self.technical_skills
     
-    def extract_skills(self, text: str) -> List[str]:
+    def _load_taxonomy(self, path: Optional[str] = None) -> Optional[SkillTaxonomy]:
+        """Load the skill taxonomy from path, SKILL_TAXONOMY_PATH or skill_taxonomy.json, if present"""
+        path = path or os.environ.get('SKILL_TAXONOMY_PATH') or 'skill_taxonomy.json'
+        if not os.path.exists(path):
+            return None
+        try:
+            return SkillTaxonomy.load(path)
+        except Exception as e:
+            print(f"Warning: Could not load skill taxonomy {path}: {e}")
+            return None
+    
+    def _taxonomy_skill(self, text: str) -> Optional[str]:
+        """Preferred taxonomy name for a label or synonym, if the taxonomy knows it"""
+        if self.taxonomy is None:
+            return None
+        skill_id = self.taxonomy.lookup(text)
+        return self.taxonomy.names[skill_id] if skill_id is not None else None
+    
+    def _known_skill(self, text: str) -> Optional[str]:
+        """Return text if it is a skill keyword, else its taxonomy name, else None"""
+        if text in self.skill_keywords:
+            return text
+        return self._taxonomy_skill(text)
+    
+    def _known_prefix(self, capture: str) -> Optional[Tuple[str, int, int]]:
+        """Longest known skill a pattern capture starts with ("python experience." -> python), with its offsets"""
+        words = list(re.finditer(r'\S+', capture))[:MAX_PATTERN_WORDS]
+        for count in range(len(words), 0, -1):
+            candidate = " ".join(word.group() for word in words[:count]).lower()
+            end = words[count - 1].end()
+            skill = self._known_skill(candidate)
+            if skill is None and candidate.endswith('.'):
+                # A sentence ending right after the skill
+                skill = self._known_skill(candidate.rstrip('.'))
+                end -= len(candidate) - len(candidate.rstrip('.'))
+            if skill is not None:
+                return skill, words[0].start(), end
+        return None
+    
+    def extract_skills(self, text: str, detailed: bool = False, ner_sections: Optional[Collection[str]] = None,
+                       mode: str = "balanced",
+                       deadline: Optional[Deadline] = None) -> Union[List[str], List[Dict[str, Any]]]:
         """
         Extract skills from text using SpaCy NER and keyword matching
+        
+        With detailed=True, returns per-skill spans, counts, methods and years
+        of experience instead of the compact sorted list of names. NER only
+        reads the resume sections in ner_sections (self.ner_sections by
+        default; include "all" for the whole text).
+        
+        mode picks the methods (see EXTRACTION_MODES). Methods run cheapest
+        first; once the deadline expires the remaining ones are skipped and
+        deadline.partial is set. Keyword matching always runs.
         """
-        skills = set()
+        methods, ner_sections = self._resolve_mode(mode, ner_sections)
+        deadline = deadline or Deadline()
+        if detailed:
+            return self.extract_skill_details(text, ner_sections, mode, deadline)
         
         # Convert text to lowercase for better matching
         text_lower = text.lower()
         
         # Method 1: Keyword-based extraction
-        skills.update(self._extract_keyword_skills(text_lower))
+        if mode == "fast":
+            skills = self._extract_automaton_skills(text_lower)
+        else:
+            skills = self._extract_keyword_skills(text_lower)
+        
+        # Method 2: Pattern-based extraction
+        if "pattern" in methods and not deadline.expired():
+            skills.update(self._extract_pattern_skills(text_lower))
         
-        # Method 2: SpaCy NER extraction (if available)
-        if self.nlp:
-            skills.update(self._extract_ner_skills(text))
+        # Method 3: SpaCy NER extraction (if available)
+        if "ner" in methods and not deadline.expired() and self.nlp:
+            skills.update(self._extract_ner_skills(text, ner_sections, deadline))
         
-        # Method 3: Pattern-based extraction
-        skills.update(self._extract_pattern_skills(text_lower))
+        # Method 4: Fuzzy matching of misspelled keywords
+        if "fuzzy" in methods and not deadline.expired():
+            skills.update(skill for _, _, skill in self._find_fuzzy_skills(text_lower, deadline))
         
         # Clean and normalize skills
         cleaned_skills = self._clean_skills(list(skills))
         
         return cleaned_skills
     
+    def extract_skills_batch(self, texts: List[str], batch_size: int = 64, n_process: int = 1,
+                             ner_sections: Optional[Collection[str]] = None, mode: str = "balanced") -> List[List[str]]:
+        """
+        Extract skills from many texts, running SpaCy NER over them with nlp.pipe
+        
+        Returns one sorted skill list per input text, the same as extract_skills.
+        """
+        methods, ner_sections = self._resolve_mode(mode, ner_sections)
+        results = []
+        for text in texts:
+            text_lower = text.lower()
+            if mode == "fast":
+                skills = self._extract_automaton_skills(text_lower)
+            else:
+                skills = self._extract_keyword_skills(text_lower)
+            if "pattern" in methods:
+                skills.update(self._extract_pattern_skills(text_lower))
+            if "fuzzy" in methods:
+                skills.update(skill for _, _, skill in self._find_fuzzy_skills(text_lower))
+            results.append(skills)
+        
+        if "ner" in methods and self.nlp:
+            # Split texts into NER pieces, keeping track of which text each piece came from
+            pieces = (
+                (piece, index) for index, text in enumerate(texts)
+                for _, piece in self._ner_pieces(text, ner_sections)
+            )
+            for doc, index in self.nlp.pipe(pieces, as_tuples=True, batch_size=batch_size, n_process=n_process):
+                results[index].update(self._match_entities(doc))
+        
+        return [self._clean_skills(list(skills)) for skills in results]
+    
+    def extract_skills_stream(self, chunks: Iterable[str], overlap: Optional[int] = None) -> Iterator[str]:
+        """
+        Extract skills incrementally from an iterator of text chunks (pages, paragraphs)
+        
+        The tail of each chunk is carried into the next one so that multi-word
+        skills split across a chunk boundary are still found. Each skill is
+        yielded once, as soon as it is first seen, so memory stays bounded by
+        the chunk size and the skill vocabulary rather than the document size.
+        """
+        if overlap is None:
+            # Enough room for the longest keyword plus a pattern prefix such as "10 years of "
+            overlap = self.max_keyword_length + 32
+        
+        seen = set()
+        carry = ""
+        
+        for chunk in chunks:
+            if not chunk:
+                continue
+            
+            window = carry + chunk
+            window_lower = window.lower()
+            
+            found = self._extract_keyword_skills(window_lower)
+            if self.nlp:
+                # Windows rarely contain their section header, so NER reads all of each one
+                found.update(self._extract_ner_skills(window, (resume_sections.ALL_SECTIONS,)))
+            found.update(self._extract_pattern_skills(window_lower))
+            
+            for skill in sorted(found):
+                normalized = self._normalize_skill(skill)
+                if normalized is None or normalized in seen:
+                    continue
+                seen.add(normalized)
+                yield normalized
+            
+            carry = window[-overlap:] if overlap > 0 else ""
+    
+    def extract_skill_details(self, text: str, ner_sections: Optional[Collection[str]] = None, mode: str = "balanced",
+                              deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
+        """
+        Extract skills with character spans, occurrence counts, detection methods
+        and captured years of experience, all in a single pass over the text
+        
+        Spans are offsets into the lowercased text, which match the original
+        text for ASCII input. mode and deadline work as in extract_skills.
+        """
+        methods, ner_sections = self._resolve_mode(mode, ner_sections)
+        deadline = deadline or Deadline()
+        details: Dict[str, Dict[str, Any]] = {}
+        
+        def record(skill: str, method: str, span: tuple, years: Optional[int] = None):
+            normalized = self._normalize_skill(skill)
+            if normalized is None:
+                return
+            entry = details.get(normalized)
+            if entry is None:
+                entry = details[normalized] = {"spans": set(), "methods": set(), "years": None}
+            entry["spans"].add(span)
+            entry["methods"].add(method)
+            if years is not None and (entry["years"] is None or years > entry["years"]):
+                entry["years"] = years
+        
+        text_lower = text.lower()
+        
+        # Method 1: Keyword occurrences via the automaton
+        for start, end, skill in self.keyword_automaton.find_all(text_lower):
+            record(skill, "keyword", (start, end))
+        if self.taxonomy is not None:
+            for start, end, skill_id in self.taxonomy.find_spans(text_lower):
+                record(self.taxonomy.names[skill_id], "keyword", (start, end))
+        
+        # Method 2: Pattern-based extraction, keeping the captured years
+        if "pattern" in methods and not deadline.expired():
+            for index, pattern in enumerate(SKILL_PATTERNS):
+                skill_group = 2 if index == 0 else 1
+                for match in re.finditer(pattern, text_lower, re.IGNORECASE):
+                    found = self._known_prefix(match.group(skill_group))
+                    if found is None:
+                        continue
+                    potential_skill, start, end = found
+                    offset = match.start(skill_group)
+                    years = int(match.group(1)) if skill_group == 2 else None
+                    record(potential_skill, "pattern", (offset + start, offset + end), years)
+        
+        # Method 3: SpaCy NER extraction (if available)
+        if "ner" in methods and not deadline.expired() and self.nlp:
+            pieces = self._ner_pieces(text, ner_sections)
+            for (offset, _), doc in zip(pieces, self.nlp.pipe(piece for _, piece in pieces)):
+                if deadline.expired():
+                    break
+                for ent in doc.ents:
+                    if ent.label_ in ['ORG', 'PRODUCT', 'GPE']:
+                        entity_text = ent.text.lower()
+                        span = (offset + ent.start_char, offset + ent.end_char)
+                        for skill in self.skill_keywords:
+                            if skill in entity_text or entity_text in skill:
+                                record(skill, "ner", span)
+                        taxonomy_skill = self._taxonomy_skill(entity_text)
+                        if taxonomy_skill:
+                            record(taxonomy_skill, "ner", span)
+        
+        # Method 4: Fuzzy matching of misspelled keywords
+        if "fuzzy" in methods and not deadline.expired():
+            for start, end, skill in self._find_fuzzy_skills(text_lower, deadline):
+                record(skill, "fuzzy", (start, end))
+        
+        return [
+            {
+                "skill": skill,
+                "count": len(entry["spans"]),
+                "spans": [list(span) for span in sorted(entry["spans"])],
+                "methods": sorted(entry["methods"]),
+                "years_experience": entry["years"]
+            }
+            for skill, entry in sorted(details.items())
+        ]
+    
+    def extract_skill_years(self, text: str) -> Dict[str, int]:
+        """Years of experience per skill from phrases such as "5 years of Python", as detailed extraction reports them"""
+        years: Dict[str, int] = {}
+        for match in re.finditer(SKILL_PATTERNS[0], text.lower(), re.IGNORECASE):
+            found = self._known_prefix(match.group(2))
+            normalized = self._normalize_skill(found[0]) if found else None
+            if normalized is not None:
+                years[normalized] = max(years.get(normalized, 0), int(match.group(1)))
+        return years
+    
     def _extract_keyword_skills(self, text: str) -> Set[str]:
         """Extract skills using keyword matching"""
         found_skills = set()
@@ -120,12 +449,85 @@ class SkillExtractor:
                     found_skills.add(skill)
                     break
         
+        if self.taxonomy is not None:
+            # One alias-table lookup per token n-gram, whatever the taxonomy size
+            found_skills.update(self.taxonomy.names[skill_id] for skill_id in self.taxonomy.find_in_text(text))
+        
         return found_skills
     
-    def _extract_ner_skills(self, text: str) -> Set[str]:
-        """Extract skills using SpaCy NER"""
+    def _extract_automaton_skills(self, text: str) -> Set[str]:
+        """Extract skills with the keyword automaton, one scan of the text"""
+        skills = {skill for _, _, skill in self.keyword_automaton.find_all(text)}
+        if self.taxonomy is not None:
+            skills.update(self.taxonomy.names[skill_id] for skill_id in self.taxonomy.find_in_text(text))
+        return skills
+    
+    def _resolve_mode(self, mode: str, ner_sections: Optional[Collection[str]]) -> Tuple[Tuple[str, ...], Optional[Collection[str]]]:
+        """Methods of an extraction mode and the sections NER reads in it"""
+        if mode not in EXTRACTION_MODES:
+            raise ValueError(f"mode must be one of {', '.join(EXTRACTION_MODES)}")
+        if mode == "thorough" and ner_sections is None:
+            ner_sections = (resume_sections.ALL_SECTIONS,)
+        return EXTRACTION_MODES[mode], ner_sections
+    
+    def _extract_ner_skills(self, text: str, ner_sections: Optional[Collection[str]] = None,
+                            deadline: Optional[Deadline] = None) -> Set[str]:
+        """Extract skills using SpaCy NER over the selected resume sections, stopping at the deadline"""
+        skills = set()
+        
+        for doc in self.nlp.pipe(piece for _, piece in self._ner_pieces(text, ner_sections)):
+            skills.update(self._match_entities(doc))
+            if deadline is not None and deadline.expired():
+                break
+        
+        return skills
+    
+    def _find_fuzzy_skills(self, text: str, deadline: Optional[Deadline] = None) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield (start, end, skill) for words and word pairs that closely resemble
+        a keyword without matching it exactly ("kubernets", "postgress sql")
+        """
+        words = [(match.start(), match.end()) for match in WORD_PATTERN.finditer(text)]
+        matcher = difflib.SequenceMatcher(autojunk=False)
+        resolved: Dict[str, Optional[str]] = {}
+        
+        for i, (start, end) in enumerate(words):
+            if i % 64 == 0 and deadline is not None and deadline.expired():
+                return
+            candidates = [(1, start, end)]
+            # Word pairs only across a single space, so they stay within one phrase
+            if i + 1 < len(words) and words[i + 1][0] == end + 1 and text[end] == ' ':
+                candidates.append((2, start, words[i + 1][1]))
+            
+            for word_count, span_start, span_end in candidates:
+                candidate = text[span_start:span_end]
+                if len(candidate) < FUZZY_MIN_LENGTH - 1 or candidate in self.skill_keywords:
+                    continue
+                if candidate not in resolved:
+                    resolved[candidate] = self._closest_keyword(matcher, candidate, word_count)
+                skill = resolved[candidate]
+                # "pythons" already contains "python", which keyword matching finds
+                if skill is not None and skill not in candidate:
+                    yield span_start, span_end, skill
+    
+    def _closest_keyword(self, matcher: difflib.SequenceMatcher, candidate: str, word_count: int) -> Optional[str]:
+        """Keyword with the same word count most similar to candidate, if above FUZZY_CUTOFF"""
+        matcher.set_seq2(candidate)
+        best, best_ratio = None, FUZZY_CUTOFF
+        # Lengths further apart than this cannot reach the cutoff
+        spread = int(len(candidate) * (1 - FUZZY_CUTOFF) / FUZZY_CUTOFF) + 1
+        for length in range(len(candidate) - spread, len(candidate) + spread + 1):
+            for skill in self.fuzzy_keywords.get((word_count, length), ()):
+                matcher.set_seq1(skill)
+                if matcher.real_quick_ratio() >= best_ratio and matcher.quick_ratio() >= best_ratio:
+                    ratio = matcher.ratio()
+                    if ratio >= best_ratio:
+                        best, best_ratio = skill, ratio
+        return best
+    
+    def _match_entities(self, doc) -> Set[str]:
+        """Match the entities of a processed SpaCy Doc against known skills"""
         skills = set()
-        doc = self.nlp(text)
         
         # Look for entities that might be skills
         for ent in doc.ents:
@@ -135,38 +537,46 @@ class SkillExtractor:
                 for skill in self.skill_keywords:
                     if skill in entity_text or entity_text in skill:
                         skills.add(skill)
+                taxonomy_skill = self._taxonomy_skill(entity_text)
+                if taxonomy_skill:
+                    skills.add(taxonomy_skill)
         
         return skills
     
+    def _ner_pieces(self, text: str, ner_sections: Optional[Collection[str]] = None) -> List[Tuple[int, str]]:
+        """(offset, text) pieces of the selected sections, each short enough for SpaCy"""
+        sections = ner_sections if ner_sections is not None else self.ner_sections
+        pieces = []
+        for start, end in resume_sections.select_spans(text, sections):
+            offset = start
+            for piece in self._split_for_nlp(text[start:end]):
+                pieces.append((offset, piece))
+                offset += len(piece)
+        return pieces
+    
+    def _split_for_nlp(self, text: str) -> Iterator[str]:
+        """Split text into pieces that fit within SpaCy's max_length"""
+        max_length = self.nlp.max_length
+        start = 0
+        while len(text) - start > max_length:
+            # Prefer to cut at whitespace so entities are not split
+            end = text.rfind(' ', start, start + max_length)
+            if end <= start:
+                end = start + max_length
+            yield text[start:end]
+            start = end
+        yield text[start:]
+    
     def _extract_pattern_skills(self, text: str) -> Set[str]:
         """Extract skills using regex patterns"""
         skills = set()
         
-        # Pattern for "X years of Y" or "experience with Y"
-        patterns = [
-            r'(\d+)\s*(?:years?|yrs?)\s*(?:of|in)\s*([a-zA-Z\s\+\#\.]+)',
-            r'experience\s+(?:with|in)\s+([a-zA-Z\s\+\#\.]+)',
-            r'proficient\s+in\s+([a-zA-Z\s\+\#\.]+)',
-            r'skilled\s+in\s+([a-zA-Z\s\+\#\.]+)',
-            r'expertise\s+in\s+([a-zA-Z\s\+\#\.]+)',
-            r'knowledge\s+of\s+([a-zA-Z\s\+\#\.]+)',
-            r'familiar\s+with\s+([a-zA-Z\s\+\#\.]+)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    # Handle groups in regex
-                    for group in match:
-                        if group.strip():
-                            potential_skill = group.strip().lower()
-                            if potential_skill in self.skill_keywords:
-                                skills.add(potential_skill)
-                else:
-                    potential_skill = match.strip().lower()
-                    if potential_skill in self.skill_keywords:
-                        skills.add(potential_skill)
+        for pattern in SKILL_PATTERNS:
+            for match in re.finditer(pattern, text, re.IGNORECASE):
+                # The skill is the last group; the first pattern also captures years
+                found = self._known_prefix(match.group(match.lastindex))
+                if found:
+                    skills.add(found[0])
         
         return skills
     
@@ -176,23 +586,32 @@ class SkillExtractor:
         seen = set()
         
         for skill in skills:
-            # Normalize skill name
-            normalized = skill.lower().strip()
-            
-            # Remove common prefixes/suffixes
-            normalized = re.sub(r'^(the\s+|a\s+|an\s+)', '', normalized)
-            normalized = re.sub(r'\s+(framework|library|tool|technology|language|platform)$', '', normalized)
-            
-            # Skip if already seen or too short
-            if normalized in seen or len(normalized) < 2:
-                continue
+            normalized = self._normalize_skill(skill)
             
-            # Skip if it's just a common word
-            common_words = {'the', 'and', 'or', 'with', 'in', 'on', 'at', 'to', 'for', 'of', 'by'}
-            if normalized in common_words:
+            # Skip if already seen or filtered out
+            if normalized is None or normalized in seen:
                 continue
             
             cleaned.append(normalized)
             seen.add(normalized)
         
         return sorted(cleaned)
+    
+    def _normalize_skill(self, skill: str) -> Optional[str]:
+        """Normalize a skill name, returning None if it should be dropped"""
+        normalized = skill.lower().strip()
+        
+        # Remove common prefixes/suffixes
+        normalized = re.sub(r'^(the\s+|a\s+|an\s+)', '', normalized)
+        normalized = re.sub(r'\s+(framework|library|tool|technology|language|platform)$', '', normalized)
+        
+        # Skip if too short
+        if len(normalized) < 2:
+            return None
+        
+        # Skip if it's just a common word
+        common_words = {'the', 'and', 'or', 'with', 'in', 'on', 'at', 'to', 'for', 'of', 'by'}
+        if normalized in common_words:
+            return None
+        
+        return normalized
@@ -1,12 +1,49 @@
 import json
 import os
-from typing import List, Dict, Any
+import hashlib
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from difflib import SequenceMatcher
+import numpy as np
+from skill_embeddings import SkillEmbeddingIndex
+from role_graph import RoleGraph
 
 class SkillMatcher:
-    def __init__(self):
+    # Share of the overall match contributed by required vs preferred skills
+    REQUIRED_WEIGHT = 0.7
+    PREFERRED_WEIGHT = 0.3
+    
+    # Minimum cosine similarity for semantic matching to map an unknown skill
+    SEMANTIC_THRESHOLD = 0.5
+    
+    def __init__(self, nlp=None, nlp_loader: Optional[Callable[[], Any]] = None):
         """Initialize the skill matcher with job role data"""
+        # SpaCy pipeline whose static vectors (if any) feed semantic matching; with
+        # nlp_loader it is only loaded when the semantic index is first built
+        self.nlp = nlp
+        self.nlp_loader = nlp_loader
+        self.job_roles = self._load_job_roles()
+        self._build_indexes()
+    
+    def reload(self):
+        """Reload job roles from disk and rebuild every precomputed structure"""
         self.job_roles = self._load_job_roles()
+        self._build_indexes()
+    
+    def _build_indexes(self):
+        """Build structures derived from the loaded job roles"""
+        self._build_weight_vectors()
+        
+        # Role-to-role similarity and transition edges
+        self.role_graph = RoleGraph(self.job_roles)
+        
+        self._build_skill_role_index()
+        
+        # Built on first semantic match, over the current skill vocabulary
+        self._semantic_index = None
+        
+        # Content hash of the loaded data, changes whenever the roles change
+        canonical = json.dumps(self.job_roles, sort_keys=True, separators=(",", ":"))
+        self.data_version = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
     
     def _load_job_roles(self) -> Dict[str, Any]:
         """Load job roles and their required skills from JSON file"""
@@ -130,19 +167,25 @@ class SkillMatcher:
             })
         return roles
     
-    def match_skills(self, user_skills: List[str], target_role: str) -> Dict[str, Any]:
+    def match_skills(self, user_skills: List[str], target_role: str, semantic: bool = False) -> Dict[str, Any]:
         """
         Match user skills against target job role requirements
+        
+        With semantic=True, user skills unknown to every role are first mapped
+        to their nearest vocabulary skill by embedding similarity.
         """
         if target_role not in self.job_roles:
             raise ValueError(f"Unknown job role: {target_role}")
         
+        resolved = self.resolve_skills(user_skills) if semantic else {}
+        
         role_data = self.job_roles[target_role]
         required_skills = set(role_data["required_skills"])
         preferred_skills = set(role_data["preferred_skills"])
         
         # Normalize user skills
         user_skills_normalized = [skill.lower().strip() for skill in user_skills]
+        user_skills_normalized = [resolved.get(skill, skill) for skill in user_skills_normalized]
         user_skills_set = set(user_skills_normalized)
         
         # Find matched skills
@@ -161,7 +204,7 @@ class SkillMatcher:
         preferred_match_percentage = (len(matched_preferred) / total_preferred) * 100 if total_preferred > 0 else 0
         
         # Overall match percentage (weighted: 70% required, 30% preferred)
-        overall_match_percentage = (required_match_percentage * 0.7) + (preferred_match_percentage * 0.3)
+        overall_match_percentage = (required_match_percentage * self.REQUIRED_WEIGHT) + (preferred_match_percentage * self.PREFERRED_WEIGHT)
         
         # Create skill gaps with descriptions
         skill_gaps = []
@@ -182,7 +225,7 @@ class SkillMatcher:
                 "description": f"Preferred skill for {role_data['title']} position"
             })
         
-        return {
+        result = {
             "target_role": role_data["title"],
             "role_description": role_data["description"],
             "matched_skills": {
@@ -201,6 +244,268 @@ class SkillMatcher:
             },
             "overall_match_percentage": round(overall_match_percentage, 2)
         }
+        if semantic:
+            result["resolved_skills"] = resolved
+        
+        return result
+    
+    def get_role_transitions(self, user_skills: List[str], top_k: int = 3, semantic: bool = False) -> Dict[str, Any]:
+        """Nearest roles for the user's skills and the cheapest transitions to other roles"""
+        user_skills = [skill.lower().strip() for skill in user_skills]
+        if semantic:
+            resolved = self.resolve_skills(user_skills)
+            user_skills = [resolved.get(skill, skill) for skill in user_skills]
+        return self.role_graph.transitions(user_skills, top_k)
+    
+    def get_semantic_index(self) -> SkillEmbeddingIndex:
+        """Get the embedding index over all role skills, building it on first use"""
+        if self._semantic_index is None:
+            if self.nlp is None and self.nlp_loader is not None:
+                self.nlp = self.nlp_loader()
+            self._semantic_index = SkillEmbeddingIndex(self.skill_index.keys(), nlp=self.nlp)
+        return self._semantic_index
+    
+    def resolve_skills(self, user_skills: List[str]) -> Dict[str, str]:
+        """Map user skills that no role lists onto the most similar role skill"""
+        normalized = [skill.lower().strip() for skill in user_skills]
+        unknown = [skill for skill in dict.fromkeys(normalized) if skill and skill not in self.skill_index]
+        if not unknown:
+            return {}
+        
+        resolved = self.get_semantic_index().resolve(unknown, threshold=self.SEMANTIC_THRESHOLD)
+        return {skill: match for skill, match in zip(unknown, resolved) if match is not None}
+    
+    def _build_weight_vectors(self):
+        """
+        Precompute a role x skill weight matrix and minimum-years matrix
+        
+        Each role row sums to the required/preferred shares, split across the
+        role's skills by their optional "skill_weights" entry (default 1).
+        Optional "min_years" entries give the experience needed for full credit.
+        """
+        vocabulary = set()
+        for role_data in self.job_roles.values():
+            vocabulary.update(role_data["required_skills"])
+            vocabulary.update(role_data["preferred_skills"])
+        
+        self.role_ids = list(self.job_roles.keys())
+        self.skill_index = {skill: i for i, skill in enumerate(sorted(vocabulary))}
+        self.role_index = {role_id: i for i, role_id in enumerate(self.role_ids)}
+        
+        weights = np.zeros((len(self.role_ids), len(self.skill_index)), dtype=np.float32)
+        min_years = np.zeros_like(weights)
+        # Percentage points each skill adds to a role's standard match
+        standard_gains = np.zeros(weights.shape, dtype=np.float64)
+        
+        for row, role_id in enumerate(self.role_ids):
+            role_data = self.job_roles[role_id]
+            skill_weights = role_data.get("skill_weights", {})
+            
+            for group, share in (("required_skills", self.REQUIRED_WEIGHT), ("preferred_skills", self.PREFERRED_WEIGHT)):
+                skills = role_data[group]
+                for skill in skills:
+                    standard_gains[row, self.skill_index[skill]] += share * 100 / len(skills)
+                raw_weights = [float(skill_weights.get(skill, 1.0)) for skill in skills]
+                total = sum(raw_weights)
+                if total <= 0:
+                    continue
+                for skill, weight in zip(skills, raw_weights):
+                    weights[row, self.skill_index[skill]] += share * weight / total
+            
+            for skill, years in role_data.get("min_years", {}).items():
+                if skill in self.skill_index:
+                    min_years[row, self.skill_index[skill]] = years
+        
+        self.role_weight_matrix = weights
+        self.role_min_years = min_years
+        self.has_min_years = bool(min_years.any())
+        self.standard_gain_matrix = standard_gains
+    
+    def _build_skill_role_index(self):
+        """Map each skill to the roles that list it, required before preferred, heaviest first"""
+        skill_roles: Dict[str, List[Dict[str, Any]]] = {}
+        for row, role_id in enumerate(self.role_ids):
+            role_data = self.job_roles[role_id]
+            for requirement, group in (("required", "required_skills"), ("preferred", "preferred_skills")):
+                for skill in dict.fromkeys(role_data[group]):
+                    skill_roles.setdefault(skill, []).append({
+                        "role": role_id,
+                        "title": role_data["title"],
+                        "requirement": requirement,
+                        "match_gain": round(float(self.standard_gain_matrix[row, self.skill_index[skill]]), 2)
+                    })
+        
+        self.skill_roles: Dict[str, Tuple[Dict[str, Any], ...]] = {
+            skill: tuple(sorted(roles, key=lambda item: (item["requirement"] != "required", -item["match_gain"], item["role"])))
+            for skill, roles in skill_roles.items()
+        }
+    
+    def get_roles_for_skill(self, skill: str) -> List[Dict[str, Any]]:
+        """Roles that require or prefer a skill, from the reverse index"""
+        return [dict(role) for role in self.skill_roles.get(skill.lower().strip(), ())]
+    
+    def skill_gain_matrix(self, scoring: str = "standard") -> np.ndarray:
+        """Role x skill matrix of the match percentage points each skill adds to each role"""
+        if scoring == "weighted":
+            return self.role_weight_matrix.astype(np.float64) * 100
+        return self.standard_gain_matrix
+    
+    def _user_skill_vectors(self, user_skills: List[str], skill_years: Optional[Dict[str, float]] = None):
+        """Build the user's skill presence and years vectors over the role vocabulary"""
+        present = np.zeros(len(self.skill_index), dtype=np.float32)
+        years = np.full(len(self.skill_index), np.nan, dtype=np.float32)
+        
+        for skill in user_skills:
+            index = self.skill_index.get(skill.lower().strip())
+            if index is not None:
+                present[index] = 1.0
+        
+        for skill, value in (skill_years or {}).items():
+            index = self.skill_index.get(skill.lower().strip())
+            if index is not None:
+                present[index] = 1.0
+                years[index] = value
+        
+        return present, years
+    
+    def _weighted_scores(self, present: np.ndarray, years: np.ndarray, rows=slice(None)) -> np.ndarray:
+        """
+        Score roles as a dot product of role weights with the user's credit
+        
+        A skill earns full credit when the user has it and either the role sets
+        no minimum years or the user's years are unknown; otherwise credit is
+        the fraction of the minimum years the user has, capped at 1.
+        """
+        weights = self.role_weight_matrix[rows]
+        if not self.has_min_years or np.isnan(years).all():
+            return weights @ present * 100
+        
+        min_years = self.role_min_years[rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.minimum(years / min_years, 1.0)
+        credit = np.where((min_years > 0) & ~np.isnan(years), ratio, 1.0) * present
+        return np.einsum("ij,ij->i", np.atleast_2d(weights), np.atleast_2d(credit)) * 100
+    
+    def marginal_gains(self, user_skills: List[str], top_k: int = 10, scoring: str = "standard",
+                       skill_years: Optional[Dict[str, float]] = None, semantic: bool = False,
+                       roles_per_skill: int = 3) -> Dict[str, Any]:
+        """
+        Rank the skills the user lacks by how much learning each one would raise their match, across all roles
+        
+        Gains for every missing skill and every role come from one slice of the
+        role x skill gain matrix; a skill's total gain is its sum over roles.
+        Weighted scoring assumes a learned skill earns full credit.
+        """
+        if scoring not in ("standard", "weighted"):
+            raise ValueError("scoring must be 'standard' or 'weighted'")
+        
+        user_skills = [skill.lower().strip() for skill in user_skills]
+        if semantic:
+            resolved = self.resolve_skills(user_skills + list((skill_years or {}).keys()))
+            user_skills = [resolved.get(skill, skill) for skill in user_skills]
+            if skill_years:
+                skill_years = {resolved.get(skill.lower().strip(), skill): years for skill, years in skill_years.items()}
+        present, years = self._user_skill_vectors(user_skills, skill_years)
+        
+        gain_matrix = self.skill_gain_matrix(scoring)
+        if scoring == "weighted":
+            current = self._weighted_scores(present, years)
+        else:
+            current = gain_matrix @ present
+        
+        # Role x missing-skill gains, and their totals per skill
+        missing = np.flatnonzero(present == 0)
+        gains = gain_matrix[:, missing]
+        totals = gains.sum(axis=0)
+        improved = (gains > 0).sum(axis=0)
+        skills = sorted(self.skill_index, key=self.skill_index.get)
+        ranked = sorted(
+            (column for column in range(len(missing)) if totals[column] > 0),
+            key=lambda column: (-totals[column], -improved[column], skills[missing[column]])
+        )[:top_k]
+        
+        def role_gain(row: int, gain: float) -> Dict[str, Any]:
+            role_id = self.role_ids[row]
+            return {
+                "role": role_id,
+                "title": self.job_roles[role_id]["title"],
+                "gain": round(gain, 2),
+                "current_match_percentage": round(float(current[row]), 2),
+                "projected_match_percentage": round(min(100.0, float(current[row]) + gain), 2)
+            }
+        
+        results = []
+        for column in ranked:
+            column_gains = gains[:, column]
+            rows = sorted(np.flatnonzero(column_gains > 0), key=lambda row: (-column_gains[row], self.role_ids[row]))
+            results.append({
+                "skill": skills[missing[column]],
+                "total_gain": round(float(totals[column]), 2),
+                "average_gain": round(float(totals[column]) / len(self.role_ids), 2),
+                "max_gain": round(float(column_gains.max()), 2),
+                "roles_improved": int(improved[column]),
+                "roles": [role_gain(row, float(column_gains[row])) for row in rows[:roles_per_skill]]
+            })
+        
+        return {
+            "scoring": scoring,
+            "role_count": len(self.role_ids),
+            "current_matches": sorted(
+                (
+                    {"role": role_id, "title": self.job_roles[role_id]["title"],
+                     "match_percentage": round(float(current[row]), 2)}
+                    for row, role_id in enumerate(self.role_ids)
+                ),
+                key=lambda item: -item["match_percentage"]
+            ),
+            "skills": results
+        }
+    
+    def score_roles_weighted(self, user_skills: List[str], skill_years: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """Weighted match percentage for every role, computed in one vectorized pass"""
+        present, years = self._user_skill_vectors(user_skills, skill_years)
+        scores = self._weighted_scores(present, years)
+        return {role_id: round(float(score), 2) for role_id, score in zip(self.role_ids, scores)}
+    
+    def match_skills_weighted(self, user_skills: List[str], target_role: str,
+                              skill_years: Optional[Dict[str, float]] = None,
+                              semantic: bool = False) -> Dict[str, Any]:
+        """
+        Match user skills against a role using per-skill weights and years of experience
+        """
+        resolved = {}
+        if semantic:
+            resolved = self.resolve_skills(list(user_skills) + list((skill_years or {}).keys()))
+            user_skills = [resolved.get(skill.lower().strip(), skill) for skill in user_skills]
+            if skill_years:
+                skill_years = {resolved.get(skill.lower().strip(), skill): years for skill, years in skill_years.items()}
+        
+        result = self.match_skills(list(user_skills) + list((skill_years or {}).keys()), target_role)
+        if semantic:
+            result["resolved_skills"] = resolved
+        
+        row = self.role_index[target_role]
+        present, years = self._user_skill_vectors(user_skills, skill_years)
+        weighted = float(self._weighted_scores(present, years, rows=slice(row, row + 1))[0])
+        
+        # Skills the user has but with less experience than the role asks for
+        experience_gaps = []
+        for skill, required_years in self.job_roles[target_role].get("min_years", {}).items():
+            index = self.skill_index.get(skill)
+            if index is None or not present[index] or np.isnan(years[index]):
+                continue
+            if years[index] < required_years:
+                experience_gaps.append({
+                    "skill": skill,
+                    "required_years": required_years,
+                    "user_years": float(years[index])
+                })
+        
+        result["scoring"] = "weighted"
+        result["experience_gaps"] = experience_gaps
+        result["match_percentages"]["weighted"] = round(weighted, 2)
+        result["overall_match_percentage"] = round(weighted, 2)
+        return result
     
     def get_skill_similarity(self, skill1: str, skill2: str) -> float:
         """Calculate similarity between two skills"""
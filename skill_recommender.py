@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Command-line tools for the Skill Recommender
+
+    python -m skill_recommender batch resumes/ --output scores.jsonl
+    python -m skill_recommender batch archive.tar.gz --output scores/ --format parquet
+
+The batch command scores an archive of resumes against every job role without
+going through the HTTP API. Text extraction runs in a process pool, skills are
+extracted in batches with nlp.pipe, and results are written as each batch
+completes. Processed documents are recorded in a checkpoint file, so an
+interrupted run picks up where it stopped when started again.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import tarfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from text_extraction import extract_text, is_supported_file
+
+def iter_documents(source: str) -> Iterator[Tuple[str, bytes]]:
+    """Yield (document id, raw bytes) for every supported file in a directory or tarball"""
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            # Sorted walk keeps the order stable between runs
+            dirs.sort()
+            for name in sorted(files):
+                if is_supported_file(name):
+                    path = os.path.join(root, name)
+                    with open(path, 'rb') as f:
+                        yield os.path.relpath(path, source), f.read()
+    elif tarfile.is_tarfile(source):
+        # Stream mode reads members sequentially without loading the index
+        with tarfile.open(source, 'r|*') as archive:
+            for member in archive:
+                if member.isfile() and is_supported_file(member.name):
+                    yield member.name, archive.extractfile(member).read()
+    else:
+        raise ValueError(f"{source} is neither a directory nor a tar archive")
+
+def extract_document(document: Tuple[str, bytes]) -> Tuple[str, Optional[str], Optional[str]]:
+    """Extract text from one document in a worker process, returning (id, text, error)"""
+    doc_id, content = document
+    try:
+        # Documents are already spread over worker processes, so pages are read in this one
+        text, _ = extract_text(doc_id, content, max_workers=1)
+        return doc_id, text, None
+    except Exception as e:
+        return doc_id, None, str(e)
+
+def iter_batches(documents: Iterator[Tuple[str, bytes]], size: int, skip: Set[str]) -> Iterator[List[Tuple[str, bytes]]]:
+    """Group documents into batches, skipping ids already in the checkpoint"""
+    batch = []
+    for doc_id, content in documents:
+        if doc_id in skip:
+            continue
+        batch.append((doc_id, content))
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+class Checkpoint:
+    """Append-only record of document ids whose results have been written"""
+    
+    def __init__(self, path: str):
+        """Open the checkpoint file, loading ids from a previous run"""
+        self.path = path
+        self.done: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.done = {line.rstrip('\n') for line in f if line.strip()}
+        self._file = open(path, 'a', encoding='utf-8')
+    
+    def add(self, doc_ids: List[str]):
+        """Record ids as done, durably, after their results are on disk"""
+        self._file.write(''.join(f"{doc_id}\n" for doc_id in doc_ids))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.done.update(doc_ids)
+    
+    def close(self):
+        self._file.close()
+
+class JsonlWriter:
+    """Append results as JSON lines"""
+    
+    def __init__(self, path: str, resume: bool = False):
+        # Without a checkpoint every document is scored again, so earlier output is replaced
+        self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+    
+    def write(self, records: List[Dict[str, Any]]):
+        self._file.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+    
+    def close(self):
+        self._file.close()
+
+class ParquetWriter:
+    """Write each batch as its own Parquet file inside an output directory"""
+    
+    def __init__(self, path: str, resume: bool = False):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SystemExit("Parquet output requires pyarrow: pip install pyarrow")
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        if not resume:
+            # Without a checkpoint every document is scored again, so earlier parts are replaced
+            for part in glob.glob(os.path.join(path, "part-*.parquet")):
+                os.remove(part)
+        # Every batch gets a complete file, so a crash never leaves a half-written footer
+        self._run = time.strftime('%Y%m%d-%H%M%S')
+        self._part = 0
+    
+    def write(self, records: List[Dict[str, Any]]):
+        rows = [dict(record, roles=json.dumps(record["roles"])) for record in records]
+        table = self._pa.Table.from_pylist(rows)
+        self._part += 1
+        target = os.path.join(self.path, f"part-{self._run}-{self._part:06d}.parquet")
+        self._pq.write_table(table, f"{target}.tmp")
+        os.replace(f"{target}.tmp", target)
+    
+    def close(self):
+        pass
+
+def score_batch(extracted: List[Tuple[str, Optional[str], Optional[str]]], skill_extractor, skill_matcher,
+                scoring: str, top_roles: int, nlp_processes: int, mode: str = "balanced") -> List[Dict[str, Any]]:
+    """Extract skills for a batch of texts and rank every role for each document"""
+    texts = [text or "" for _, text, _ in extracted]
+    all_skills = skill_extractor.extract_skills_batch(texts, n_process=nlp_processes, mode=mode)
+    
+    records = []
+    for (doc_id, text, error), skills in zip(extracted, all_skills):
+        if error:
+            # Nothing was read, so ranking roles against no skills would only list zeros
+            scores = {}
+        elif scoring == "weighted":
+            # Years stated in the resume ("5 years of Python") count towards each role's min_years
+            scores = skill_matcher.score_roles_weighted(skills, skill_extractor.extract_skill_years(text or ""))
+        else:
+            scores = {
+                role_id: skill_matcher.match_skills(skills, role_id)["overall_match_percentage"]
+                for role_id in skill_matcher.job_roles
+            }
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        records.append({
+            "id": doc_id,
+            "skills": skills,
+            "text_length": len(text) if text else 0,
+            "roles": [{"role": role_id, "match_percentage": score} for role_id, score in ranked[:top_roles]],
+            "error": error
+        })
+    return records
+
+def run_batch(args) -> int:
+    """Score every resume in the input and write results in streaming fashion"""
+    # Imported here so `--help` stays fast and workers don't load SpaCy
+    from skill_extractor import SkillExtractor
+    from skill_matcher import SkillMatcher
+    
+    skill_extractor = SkillExtractor()
+    skill_matcher = SkillMatcher()
+    top_roles = args.top_roles or len(skill_matcher.job_roles)
+    
+    checkpoint = Checkpoint(args.checkpoint or f"{args.output.rstrip(os.sep)}.checkpoint")
+    resume = bool(checkpoint.done)
+    writer = ParquetWriter(args.output, resume) if args.format == "parquet" else JsonlWriter(args.output, resume)
+    if checkpoint.done:
+        print(f"Resuming: {len(checkpoint.done)} documents already processed", file=sys.stderr)
+    
+    processed = 0
+    started = time.time()
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            for batch in iter_batches(iter_documents(args.input), args.batch_size, checkpoint.done):
+                chunksize = max(1, len(batch) // (args.workers * 4))
+                extracted = list(pool.map(extract_document, batch, chunksize=chunksize))
+                records = score_batch(extracted, skill_extractor, skill_matcher,
+                                      args.scoring, top_roles, args.nlp_processes, args.mode)
+                writer.write(records)
+                checkpoint.add([record["id"] for record in records])
+                
+                processed += len(records)
+                rate = processed / max(time.time() - started, 1e-9)
+                print(f"Processed {processed} documents ({rate:.1f}/s)", file=sys.stderr)
+    finally:
+        writer.close()
+        checkpoint.close()
+    
+    print(f"Done: {processed} documents scored in {time.time() - started:.1f}s", file=sys.stderr)
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser"""
+    parser = argparse.ArgumentParser(prog="python -m skill_recommender", description="Skill Recommender tools")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    
+    batch = subcommands.add_parser("batch", help="score a directory or tarball of resumes against all roles")
+    batch.add_argument("input", help="directory or tar archive (.tar, .tar.gz, ...) of PDF/TXT/DOCX resumes")
+    batch.add_argument("--output", required=True, help="JSONL file, or directory for --format parquet")
+    batch.add_argument("--format", choices=["jsonl", "parquet"], default="jsonl")
+    batch.add_argument("--checkpoint", help="checkpoint file (default: <output>.checkpoint)")
+    batch.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="text extraction processes")
+    batch.add_argument("--batch-size", type=int, default=256, help="documents per batch and checkpoint")
+    batch.add_argument("--nlp-processes", type=int, default=1, help="processes for SpaCy nlp.pipe")
+    batch.add_argument("--scoring", choices=["standard", "weighted"], default="standard")
+    batch.add_argument("--mode", choices=["fast", "balanced", "thorough"], default="balanced",
+                       help="skill extraction mode (thorough adds whole-resume NER and fuzzy matching)")
+    batch.add_argument("--top-roles", type=int, default=0, help="roles to keep per resume (default: all)")
+    batch.set_defaults(handler=run_batch)
+    
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for python -m skill_recommender"""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
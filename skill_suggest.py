@@ -0,0 +1,184 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+class SkillSuggester:
+    """
+    Prefix autocomplete over skill names and aliases
+    
+    Every label is indexed from its start and from the start of each later
+    word ("learn" finds "machine learning"), in one sorted array. A query finds
+    its range of keys with two binary searches. Small ranges are ranked
+    directly; for prefixes that match more than SCAN_LIMIT keys the best keys
+    are precomputed, so no query walks a large part of the vocabulary.
+    
+    Skills rank by popularity: a weight per role that requires or prefers the
+    skill, plus the number of processed resumes it was found in. Resume counts
+    are folded into the rankings at most every REFRESH_SECONDS, by a
+    background thread, while queries keep using the previous rankings.
+    """
+    
+    # Ranges up to this many keys are ranked at query time
+    SCAN_LIMIT = 64
+    # Most suggestions a query may ask for
+    MAX_RESULTS = 20
+    # Keys kept per precomputed prefix, leaving room for aliases of the same skill
+    PRECOMPUTED = 4 * MAX_RESULTS
+    REFRESH_SECONDS = 30.0
+    
+    REQUIRED_WEIGHT = 2.0
+    PREFERRED_WEIGHT = 1.0
+    
+    def __init__(self, labels: Iterable[Tuple[str, str]], role_counts: Optional[Dict[str, float]] = None,
+                 resume_counts: Optional[Dict[str, int]] = None):
+        """Initialize the index from (label, skill) pairs; every skill should also appear as its own label"""
+        skill_ids: Dict[str, int] = {}
+        entries = set()
+        for label, skill in labels:
+            label = " ".join(label.lower().split())
+            if not label:
+                continue
+            skill_id = skill_ids.setdefault(skill, len(skill_ids))
+            words = label.split(" ")
+            offset = 0
+            for word in words:
+                entries.add((label[offset:], label, skill_id))
+                offset += len(word) + 1
+        
+        self.skills = list(skill_ids)
+        self.skill_ids = skill_ids
+        ordered = sorted(entries)
+        self.keys = [key for key, _, _ in ordered]
+        self.labels = [label for _, label, _ in ordered]
+        self.targets = np.array([skill_id for _, _, skill_id in ordered], dtype=np.int32)
+        self.label_lengths = np.array([len(label) for label in self.labels], dtype=np.int32)
+        label_order = {label: i for i, label in enumerate(sorted(set(self.labels)))}
+        self.label_order = np.array([label_order[label] for label in self.labels], dtype=np.int32)
+        
+        self.role_popularity = np.zeros(len(self.skills), dtype=np.float64)
+        for skill, count in (role_counts or {}).items():
+            if skill in skill_ids:
+                self.role_popularity[skill_ids[skill]] = count
+        self.resume_counts = np.zeros(len(self.skills), dtype=np.float64)
+        for skill, count in (resume_counts or {}).items():
+            if skill in skill_ids:
+                self.resume_counts[skill_ids[skill]] = count
+        
+        self._lock = threading.Lock()
+        self._stale = False
+        self._refreshing = False
+        self._refreshed_at = 0.0
+        self._rank = np.zeros(0, dtype=np.int64)
+        self._top: Dict[str, np.ndarray] = {}
+        self.refresh()
+    
+    @classmethod
+    def from_sources(cls, skill_extractor, skill_matcher,
+                     resume_counts: Optional[Dict[str, int]] = None) -> "SkillSuggester":
+        """Build over extractor keywords, taxonomy names and aliases, and role skills, weighted by role use"""
+        labels = [(skill, skill) for skill in skill_extractor.skill_keywords]
+        taxonomy = skill_extractor.taxonomy
+        if taxonomy is not None:
+            labels.extend((name, name) for name in taxonomy.names)
+            labels.extend((alias, taxonomy.names[skill_id]) for alias, skill_id in taxonomy.aliases.items())
+        
+        role_counts = {
+            skill: sum(cls.REQUIRED_WEIGHT if role["requirement"] == "required" else cls.PREFERRED_WEIGHT for role in roles)
+            for skill, roles in skill_matcher.skill_roles.items()
+        }
+        labels.extend((skill, skill) for skill in role_counts)
+        return cls(labels, role_counts, resume_counts)
+    
+    def record(self, skills: Iterable[str]):
+        """Count the skills found in one processed resume"""
+        with self._lock:
+            for skill in set(skills):
+                skill_id = self.skill_ids.get(skill)
+                if skill_id is not None:
+                    self.resume_counts[skill_id] += 1
+                    self._stale = True
+    
+    def resume_count_map(self) -> Dict[str, int]:
+        """Resume counts by skill, to carry over into a rebuilt index"""
+        return {self.skills[i]: int(self.resume_counts[i]) for i in np.flatnonzero(self.resume_counts)}
+    
+    def refresh(self):
+        """Re-rank all keys by current popularity and precompute every prefix matching more than SCAN_LIMIT keys"""
+        with self._lock:
+            popularity = (self.role_popularity + self.resume_counts)[self.targets]
+            self._stale = False
+        # Position of each key in the global ranking: popularity, then shorter label, then alphabetical
+        rank = np.empty(len(self.keys), dtype=np.int64)
+        rank[np.lexsort((self.label_order, self.label_lengths, -popularity))] = np.arange(len(self.keys))
+        
+        top: Dict[str, np.ndarray] = {}
+        ranges = [("", 0, len(self.keys))]
+        while ranges:
+            prefix, lo, hi = ranges.pop()
+            if hi - lo <= self.SCAN_LIMIT:
+                continue
+            top[prefix] = self._best(rank, lo, hi, self.PRECOMPUTED)
+            
+            # Split the range by the next character
+            depth = len(prefix) + 1
+            i = lo
+            while i < hi:
+                if len(self.keys[i]) < depth:
+                    i += 1
+                    continue
+                child = self.keys[i][:depth]
+                end = bisect.bisect_left(self.keys, child + "\U0010ffff", i, hi)
+                ranges.append((child, i, end))
+                i = end
+        
+        self._rank, self._top = rank, top
+        self._refreshed_at = time.monotonic()
+    
+    def _background_refresh(self):
+        """Run refresh, allowing the next one to start afterwards"""
+        try:
+            self.refresh()
+        finally:
+            self._refreshing = False
+    
+    @staticmethod
+    def _best(rank: np.ndarray, lo: int, hi: int, count: int) -> np.ndarray:
+        """Indexes of the count best-ranked keys in [lo, hi), best first"""
+        ranks = rank[lo:hi]
+        if hi - lo > count:
+            keep = np.argpartition(ranks, count - 1)[:count]
+            return lo + keep[np.argsort(ranks[keep])]
+        return lo + np.argsort(ranks)
+    
+    def suggest(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Up to limit skills whose name or alias has a word starting with query, most popular first"""
+        limit = max(1, min(limit, self.MAX_RESULTS))
+        if self._stale and not self._refreshing and time.monotonic() - self._refreshed_at >= self.REFRESH_SECONDS:
+            self._refreshing = True
+            threading.Thread(target=self._background_refresh, daemon=True).start()
+        
+        prefix = " ".join(query.lower().split())
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, prefix + "\U0010ffff", lo)
+        # Every prefix with a large range is precomputed; the others are ranked here
+        ranked = self._top.get(prefix) if hi - lo > self.SCAN_LIMIT else None
+        if ranked is None:
+            ranked = self._best(self._rank, lo, hi, self.PRECOMPUTED)
+        
+        suggestions = []
+        seen = set()
+        for index in ranked:
+            skill_id = int(self.targets[index])
+            if skill_id in seen:
+                continue
+            seen.add(skill_id)
+            suggestions.append({
+                "skill": self.skills[skill_id],
+                "matched": self.labels[index],
+                "popularity": int(self.role_popularity[skill_id] + self.resume_counts[skill_id])
+            })
+            if len(suggestions) == limit:
+                break
+        return suggestions
@@ -0,0 +1,169 @@
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Tokens keep the punctuation that is part of skill names (c++, c#, node.js, ci/cd); hyphens
+# and underscores separate tokens, so "scikit-learn" and "scikit learn" normalize alike
+TOKEN_PATTERN = re.compile(r'[a-z0-9+#]+(?:[./][a-z0-9+#]+)*')
+
+def normalize_label(label: str) -> str:
+    """Normalize a skill label or alias to space-separated lowercase tokens"""
+    return " ".join(TOKEN_PATTERN.findall(label.lower()))
+
+class SkillTaxonomy:
+    """
+    Compact in-memory skill taxonomy (ESCO / O*NET sized)
+    
+    Skills are interned as integer ids indexing parallel lists of names and
+    external ids. Every label and synonym is normalized into a single alias
+    table mapping to skill ids, and categories form a hierarchy stored as
+    parent-id arrays. Text is matched by looking up token n-grams in the alias
+    table, so extraction cost depends on the text length and the longest alias,
+    not on the number of skills.
+    """
+    
+    def __init__(self):
+        """Initialize an empty taxonomy"""
+        self.names: List[str] = []
+        self.external_ids: List[str] = []
+        self.skill_categories = array('i')
+        self.category_names: List[str] = []
+        self.category_parents = array('i')
+        self.category_index: Dict[str, int] = {}
+        self.aliases: Dict[str, int] = {}
+        self.max_alias_tokens = 0
+        self.max_alias_length = 0
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    @classmethod
+    def load(cls, path: str) -> "SkillTaxonomy":
+        """Load a taxonomy from a .json, .jsonl or .csv file"""
+        taxonomy = cls()
+        extension = os.path.splitext(path)[1].lower()
+        if extension == '.csv':
+            taxonomy._load_csv(path)
+        elif extension == '.jsonl':
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        taxonomy._add_record(json.loads(line))
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for category in data.get('categories', []):
+                taxonomy.add_category(category['id'], category.get('name', category['id']), category.get('parent'))
+            for record in data.get('skills', []):
+                taxonomy._add_record(record)
+        return taxonomy
+    
+    def _load_csv(self, path: str):
+        """
+        Load skills from CSV, accepting ESCO column names (conceptUri,
+        preferredLabel, altLabels, broaderUri) or id, name, aliases, category
+        """
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                aliases = row.get('altLabels') or row.get('aliases') or ''
+                self.add_skill(
+                    row.get('preferredLabel') or row.get('name') or '',
+                    aliases=[alias for alias in re.split(r'[\n|]', aliases) if alias.strip()],
+                    category=row.get('broaderUri') or row.get('category') or None,
+                    external_id=row.get('conceptUri') or row.get('id') or None
+                )
+    
+    def _add_record(self, record: Dict):
+        """Add one skill record from JSON"""
+        self.add_skill(
+            record['name'],
+            aliases=record.get('aliases', []),
+            category=record.get('category'),
+            external_id=record.get('id')
+        )
+    
+    def add_category(self, category_id: str, name: Optional[str] = None, parent: Optional[str] = None) -> int:
+        """Add a category (or update its name and parent) and return its internal id"""
+        index = self.category_index.get(category_id)
+        if index is None:
+            index = len(self.category_names)
+            self.category_index[category_id] = index
+            self.category_names.append(name or category_id)
+            self.category_parents.append(-1)
+        elif name:
+            self.category_names[index] = name
+        if parent:
+            self.category_parents[index] = self.add_category(parent)
+        return index
+    
+    def add_skill(self, name: str, aliases: Iterable[str] = (), category: Optional[str] = None,
+                  external_id: Optional[str] = None) -> int:
+        """Add a skill with its synonyms and return its internal id"""
+        skill_id = len(self.names)
+        self.names.append(sys.intern(name.strip().lower()))
+        self.external_ids.append(external_id or "")
+        self.skill_categories.append(self.add_category(category) if category else -1)
+        
+        for label in [name, *aliases]:
+            self._add_alias(label, skill_id)
+        return skill_id
+    
+    def _add_alias(self, label: str, skill_id: int):
+        """Register a normalized label in the alias table"""
+        normalized = normalize_label(label)
+        if not normalized:
+            return
+        # The first skill to claim an alias keeps it
+        self.aliases.setdefault(sys.intern(normalized), skill_id)
+        self.max_alias_tokens = max(self.max_alias_tokens, normalized.count(' ') + 1)
+        self.max_alias_length = max(self.max_alias_length, len(normalized))
+    
+    def content_digest(self) -> str:
+        """Hash of every name, alias and category, which changes whenever any of them is edited"""
+        digest = hashlib.sha256()
+        for name, category in zip(self.names, self.skill_categories):
+            digest.update(f"{name}\0{category}\n".encode("utf-8"))
+        for alias, skill_id in self.aliases.items():
+            digest.update(f"{alias}\0{skill_id}\n".encode("utf-8"))
+        for name, parent in zip(self.category_names, self.category_parents):
+            digest.update(f"{name}\0{parent}\n".encode("utf-8"))
+        return digest.hexdigest()
+    
+    def lookup(self, label: str) -> Optional[int]:
+        """Find the skill id for a label or synonym"""
+        return self.aliases.get(normalize_label(label))
+    
+    def find_spans(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """Yield (start, end, skill id) for every alias occurrence in text"""
+        tokens = [(match.start(), match.end(), match.group()) for match in TOKEN_PATTERN.finditer(text.lower())]
+        aliases = self.aliases
+        max_tokens = self.max_alias_tokens
+        
+        for i in range(len(tokens)):
+            key = tokens[i][2]
+            for j in range(i, min(i + max_tokens, len(tokens))):
+                if j > i:
+                    key = f"{key} {tokens[j][2]}"
+                skill_id = aliases.get(key)
+                if skill_id is not None:
+                    yield tokens[i][0], tokens[j][1], skill_id
+    
+    def find_in_text(self, text: str) -> Set[int]:
+        """Set of skill ids mentioned in text"""
+        return {skill_id for _, _, skill_id in self.find_spans(text)}
+    
+    def category_path(self, skill_id: int) -> List[str]:
+        """Category names from the skill's category up to the root"""
+        path = []
+        category = self.skill_categories[skill_id]
+        seen = set()
+        while category != -1 and category not in seen:
+            seen.add(category)
+            path.append(self.category_names[category])
+            category = self.category_parents[category]
+        return path
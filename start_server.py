@@ -1,14 +1,103 @@
 #!/usr/bin/env python3
 """
 Startup script for the Skill Recommender API
+
+    python start_server.py                 # development server with auto-reload
+    python start_server.py --prod          # pre-fork production server, one worker per CPU
 """
 
+import argparse
+import gc
 import uvicorn
 import os
 import sys
 
+def default_worker_count() -> int:
+    """Number of workers to run, from WEB_CONCURRENCY or the CPUs available to this process"""
+    if os.environ.get("WEB_CONCURRENCY"):
+        return max(1, int(os.environ["WEB_CONCURRENCY"]))
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return max(1, os.cpu_count() or 1)
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Start the Skill Recommender API")
+    parser.add_argument("--prod", action="store_true", help="run the multi-worker production server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=default_worker_count(),
+                        help="worker processes in production mode (default: CPU count)")
+    parser.add_argument("--max-requests", type=int, default=10000,
+                        help="recycle a worker after this many requests to cap memory growth (0 disables)")
+    parser.add_argument("--max-requests-jitter", type=int, default=1000,
+                        help="random extra requests per worker so workers do not all recycle at once")
+    parser.add_argument("--graceful-timeout", type=int, default=30,
+                        help="seconds a worker gets to finish in-flight requests on restart")
+    return parser.parse_args()
+
+def run_production(args):
+    """
+    Run a pre-fork server: the app, SpaCy model and knowledge base are loaded
+    once in the master process and shared copy-on-write with forked workers.
+    
+    Send SIGHUP to the master for a graceful rolling restart of workers.
+    """
+    # Tells each worker how many siblings share the CPUs, which sizes its PDF page pool
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        # gunicorn is Unix-only; fall back to uvicorn's own process manager
+        print("⚠️  gunicorn not available, falling back to uvicorn workers (no shared preload).")
+        uvicorn.run(
+            "main:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            limit_max_requests=args.max_requests or None,
+            timeout_graceful_shutdown=args.graceful_timeout,
+            log_level="info"
+        )
+        return
+    
+    class PreforkServer(BaseApplication):
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+        
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            # Runs once in the master because preload_app is set
+            import main
+            # Load the SpaCy model here too, so workers share it instead of each loading it
+            main.skill_extractor.warm_up()
+            # Move everything loaded so far out of the collector's reach, so
+            # collections in workers do not touch (and copy) the shared pages
+            gc.collect()
+            gc.freeze()
+            return main.app
+    
+    options = {
+        "bind": f"{args.host}:{args.port}",
+        "workers": args.workers,
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": True,
+        "max_requests": args.max_requests,
+        "max_requests_jitter": args.max_requests_jitter if args.max_requests else 0,
+        "graceful_timeout": args.graceful_timeout,
+        "loglevel": "info"
+    }
+    PreforkServer(options).run()
+
 def main():
     """Start the FastAPI server"""
+    args = parse_args()
+    
     print("🚀 Starting Skill Recommender API...")
     print("=" * 50)
     
@@ -33,10 +122,12 @@ def main():
         print()
     
     # Configuration
-    host = "0.0.0.0"
-    port = 8000
-    reload = True
+    host = args.host
+    port = args.port
+    reload = not args.prod
     
+    if args.prod:
+        print(f"🏭 Production mode: {args.workers} workers, recycled every ~{args.max_requests} requests")
     print(f"📍 Server will be available at: http://localhost:{port}")
     print(f"📚 API Documentation: http://localhost:{port}/docs")
     print(f"📖 ReDoc Documentation: http://localhost:{port}/redoc")
@@ -45,6 +136,9 @@ def main():
     print("=" * 50)
     
     try:
+        if args.prod:
+            run_production(args)
+            return
         uvicorn.run(
             "main:app",
             host=host,
@@ -6,6 +6,9 @@ Test script for the Skill Recommender API
 import requests
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from skill_extractor import SkillExtractor
 
 # API base URL
 BASE_URL = "http://localhost:8000"
@@ -115,6 +118,330 @@ def test_resume_upload():
         print("   Create a test_resume.txt, test_resume.pdf, or test_resume.docx file to test this feature.")
     print()
 
+def test_weighted_skill_matching():
+    """Test weighted skill matching with years of experience"""
+    print("Testing weighted skill matching...")
+    
+    data = {
+        "user_skills": ["python", "sql", "spark", "git"],
+        "target_role": "data_engineer",
+        "scoring": "weighted",
+        "skill_years": json.dumps({"python": 1, "sql": 4})
+    }
+    
+    response = requests.post(f"{BASE_URL}/match-skills", data=data)
+    negative = requests.post(f"{BASE_URL}/match-skills", data=dict(data, skill_years=json.dumps({"python": -5})))
+    if response.status_code == 200 and negative.status_code == 400:
+        print("✅ Weighted skill matching passed")
+        result = response.json()
+        print(f"Weighted match percentage: {result['match_percentages']['weighted']}%")
+        print(f"Experience gaps: {result['experience_gaps']}")
+    else:
+        print(f"❌ Weighted skill matching failed: {response.status_code}, negative years: {negative.status_code}")
+        print(f"Response: {response.text}")
+    print()
+
+
+def test_job_roles_conditional_get():
+    """Test ETag and conditional GET on catalog endpoints"""
+    print("Testing conditional GET on catalog endpoints...")
+    
+    for endpoint in ["/job-roles", "/roadmap-skills"]:
+        response = requests.get(f"{BASE_URL}{endpoint}")
+        etag = response.headers.get("ETag")
+        if response.status_code != 200 or not etag:
+            print(f"❌ {endpoint} returned no ETag: {response.status_code}")
+            continue
+        
+        cached = requests.get(f"{BASE_URL}{endpoint}", headers={"If-None-Match": etag})
+        if cached.status_code == 304:
+            print(f"✅ {endpoint} conditional GET passed (ETag {etag})")
+        else:
+            print(f"❌ {endpoint} conditional GET failed: {cached.status_code}")
+    print()
+
+
+def test_semantic_skill_matching():
+    """Test semantic skill matching of unknown skill names"""
+    print("Testing semantic skill matching...")
+    
+    data = {
+        "user_skills": ["PyTorch Lightning", "Machine-Learning", "git", "k8s"],
+        "target_role": "machine_learning_engineer",
+        "semantic": "true"
+    }
+    
+    response = requests.post(f"{BASE_URL}/match-skills", data=data)
+    if response.status_code == 200 and response.json()["resolved_skills"].get("k8s") == "kubernetes":
+        print("✅ Semantic skill matching passed")
+        result = response.json()
+        print(f"Resolved skills: {result['resolved_skills']}")
+        print(f"Overall match percentage: {result['overall_match_percentage']}%")
+    else:
+        print(f"❌ Semantic skill matching failed: {response.status_code}")
+        print(f"Response: {response.text}")
+    print()
+
+
+def test_role_transitions():
+    """Test nearest roles and role transitions"""
+    print("Testing role transitions...")
+    
+    data = {
+        "user_skills": ["python", "sql", "pandas", "numpy", "machine learning", "git"],
+        "top_k": 3
+    }
+    
+    response = requests.post(f"{BASE_URL}/role-transitions", data=data)
+    if response.status_code == 200:
+        print("✅ Role transitions passed")
+        result = response.json()
+        print(f"Closest role: {result['current_role']}")
+        for transition in result['transitions'][:3]:
+            print(f"  {transition['from']} -> {transition['to']}: {transition['gap_size']} required skills to learn")
+    else:
+        print(f"❌ Role transitions failed: {response.status_code}")
+        print(f"Response: {response.text}")
+    print()
+
+
+def test_learning_plan():
+    """Test learning plan optimization within a time budget"""
+    print("Testing learning plan...")
+    
+    data = {
+        "user_skills": ["python", "sql", "git"],
+        "target_role": "data_engineer",
+        "budget_weeks": 24
+    }
+    
+    response = requests.post(f"{BASE_URL}/learning-plan", data=data)
+    if response.status_code == 200:
+        print("✅ Learning plan passed")
+        result = response.json()
+        print(f"Match: {result['current_match_percentage']}% -> {result['projected_match_percentage']}% "
+              f"in {result['planned_weeks']} weeks")
+        for step in result['plan']:
+            print(f"  {step['order']}. {step['skill']} ({step['level']}) weeks {step['start_week']}-{step['end_week']}")
+    else:
+        print(f"❌ Learning plan failed: {response.status_code}")
+        print(f"Response: {response.text}")
+    print()
+
+
+def test_request_coalescing():
+    """Test that identical concurrent requests are coalesced and counted"""
+    print("Testing request coalescing...")
+    
+    data = {"skill": "python"}
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        responses = list(pool.map(lambda _: requests.post(f"{BASE_URL}/generate-roadmap", data=data), range(8)))
+    
+    response = requests.get(f"{BASE_URL}/metrics")
+    if all(r.status_code == 200 for r in responses) and response.status_code == 200:
+        print("✅ Request coalescing passed")
+        stats = response.json()["coalescing"]["generate_roadmap"]
+        print(f"Roadmap calls: {stats['calls']}, executions: {stats['executions']}, coalesced: {stats['coalesced']}")
+    else:
+        print(f"❌ Request coalescing failed: {[r.status_code for r in responses]}, metrics {response.status_code}")
+    print()
+
+
+def test_shared_result_cache():
+    """Test that repeated requests are served from the shared result cache"""
+    print("Testing shared result cache...")
+    
+    data = {"user_skills": ["python", "sql"], "target_role": "data_scientist"}
+    first = requests.post(f"{BASE_URL}/match-skills", data=data)
+    second = requests.post(f"{BASE_URL}/match-skills", data=data)
+    
+    response = requests.get(f"{BASE_URL}/metrics")
+    stats = response.json().get("result_cache") if response.status_code == 200 else None
+    if first.status_code == 200 and first.json() == second.json() and stats and stats["hits"] > 0:
+        print("✅ Shared result cache passed")
+        print(f"Hits: {stats['hits']}, misses: {stats['misses']}, entries: {stats['entries']}")
+    else:
+        print(f"❌ Shared result cache failed: {first.status_code}, {second.status_code}, {stats}")
+    print()
+
+def test_resume_upload_ner_sections():
+    """Test choosing the resume sections NER reads"""
+    print("Testing resume upload with NER sections...")
+    
+    content = b"Jane Smith\nLondon\n\nSKILLS\nPython, Docker, SQL\n\nEDUCATION\nBSc Mathematics\n"
+    files = {'file': ('sections.txt', content, 'text/plain')}
+    response = requests.post(f"{BASE_URL}/upload-resume", files=files, data={"ner_sections": "skills,experience"})
+    invalid = requests.post(f"{BASE_URL}/upload-resume", files=files, data={"ner_sections": "hobbits"})
+    
+    if response.status_code == 200 and "python" in response.json()["extracted_skills"] and invalid.status_code == 400:
+        print("✅ Resume upload with NER sections passed")
+        print(f"Extracted skills: {response.json()['extracted_skills']}")
+    else:
+        print(f"❌ Resume upload with NER sections failed: {response.status_code}, {invalid.status_code}")
+    print()
+
+def test_resume_upload_modes():
+    """Test fast and thorough extraction modes and the deadline"""
+    print("Testing resume upload modes...")
+    
+    content = b"SKILLS\nPython, Docker, kubernets\n\nEXPERIENCE\n5 years of python with postgresql\n"
+    files = {'file': ('modes.txt', content, 'text/plain')}
+    fast = requests.post(f"{BASE_URL}/upload-resume", files=files, data={"mode": "fast"})
+    thorough = requests.post(f"{BASE_URL}/upload-resume", files=files, data={"mode": "thorough", "deadline_ms": "5000"})
+    invalid = requests.post(f"{BASE_URL}/upload-resume", files=files, data={"mode": "instant"})
+    bad_deadlines = [
+        requests.post(f"{BASE_URL}/upload-resume", files=files, data={"deadline_ms": value}).status_code
+        for value in ("nan", "inf", "0")
+    ]
+    
+    if (fast.status_code == 200 and thorough.status_code == 200 and invalid.status_code == 400
+            and bad_deadlines == [400, 400, 400]
+            and "kubernetes" in thorough.json()["extracted_skills"] and not thorough.json()["partial"]):
+        print("✅ Resume upload modes passed")
+        print(f"Fast: {fast.json()['extracted_skills']}")
+        print(f"Thorough: {thorough.json()['extracted_skills']}")
+    else:
+        print(f"❌ Resume upload modes failed: {fast.status_code}, {thorough.status_code}, {invalid.status_code}, {bad_deadlines}")
+    print()
+
+def test_skill_suggestions():
+    """Test skill autocomplete"""
+    print("Testing skill suggestions...")
+    
+    response = requests.get(f"{BASE_URL}/skills/suggest", params={"q": "pyth", "limit": 5})
+    
+    if response.status_code == 200 and response.json()["suggestions"]:
+        print("✅ Skill suggestions passed")
+        print(f"Suggestions: {[item['skill'] for item in response.json()['suggestions']]}")
+    else:
+        print(f"❌ Skill suggestions failed: {response.status_code}")
+    print()
+
+def test_skill_gains():
+    """Test ranking missing skills by match gain across all roles"""
+    print("Testing skill gains...")
+    
+    data = {"user_skills": ["python", "sql", "git"], "top_k": 5}
+    response = requests.post(f"{BASE_URL}/skill-gains", data=data)
+    
+    if response.status_code == 200 and response.json()["skills"]:
+        print("✅ Skill gains passed")
+        top = response.json()["skills"][0]
+        print(f"Top skill: {top['skill']} (+{top['total_gain']} across {top['roles_improved']} roles)")
+    else:
+        print(f"❌ Skill gains failed: {response.status_code}")
+    print()
+
+def test_skill_reverse_index():
+    """Test looking up the roles and resources for a skill"""
+    print("Testing skill roles and resources...")
+    
+    roles = requests.get(f"{BASE_URL}/skills/python/roles")
+    resources = requests.get(f"{BASE_URL}/skills/docker/resources")
+    # Skill names may contain a slash, sent as is or encoded
+    slashed = [requests.get(f"{BASE_URL}/skills/{name}/roles") for name in ("ci/cd", "ci%2Fcd")]
+    
+    if (roles.status_code == 200 and roles.json()["roles"] and resources.status_code == 200 and resources.json()["resources"]
+            and all(r.status_code == 200 and r.json()["skill"] == "ci/cd" and r.json()["roles"] for r in slashed)):
+        print("✅ Skill roles and resources passed")
+        print(f"Roles needing python: {[role['role'] for role in roles.json()['roles']]}")
+        print(f"Resources covering docker: {len(resources.json()['resources'])}")
+    else:
+        print(f"❌ Skill roles and resources failed: {roles.status_code}, {resources.status_code}, {[r.status_code for r in slashed]}")
+    print()
+
+def test_skill_analytics():
+    """Test that match results feed the weekly skill analytics"""
+    print("Testing skill analytics...")
+    
+    data = {"user_skills": ["python", "sql"], "target_role": "data_engineer"}
+    requests.post(f"{BASE_URL}/match-skills", data=data, headers={"X-User-Id": "analytics-test"})
+    response = requests.get(f"{BASE_URL}/analytics", params={"role": "data_engineer", "top_k": 5})
+    
+    if response.status_code == 200 and response.json()["missing_by_role"].get("data_engineer", {}).get("top_skills"):
+        result = response.json()
+        print("✅ Skill analytics passed")
+        print(f"Week: {result['week']}")
+        print(f"Most missing for data_engineer: {result['missing_by_role']['data_engineer']['top_skills']}")
+    else:
+        print(f"❌ Skill analytics failed: {response.status_code}")
+    print()
+
+def test_skill_cooccurrence():
+    """Test recommendations learned from skills that appear together in resumes"""
+    print("Testing skill co-occurrence...")
+    
+    content = b"SKILLS\nPython, Kubernetes, Terraform, Docker\n"
+    for name in ("cooccurrence-a.txt", "cooccurrence-b.txt"):
+        requests.post(f"{BASE_URL}/upload-resume", files={'file': (name, content, 'text/plain')})
+    
+    # Uploads are folded into the model in the background about once a second
+    for _ in range(6):
+        time.sleep(0.5)
+        response = requests.post(f"{BASE_URL}/skills/also-know", data={"user_skills": ["python", "kubernetes"], "top_k": 5})
+        recommended = [item["skill"] for item in response.json().get("recommendations", [])] if response.status_code == 200 else []
+        if "terraform" in recommended:
+            break
+    
+    if response.status_code == 200 and "terraform" in recommended and "python" not in recommended:
+        print("✅ Skill co-occurrence passed")
+        print(f"People with python and kubernetes also know: {recommended}")
+    else:
+        print(f"❌ Skill co-occurrence failed: {response.status_code}, {recommended}")
+    print()
+
+def test_skill_extraction_stream():
+    """Test streaming extraction across chunk boundaries"""
+    print("Testing streaming skill extraction...")
+    
+    # "machine learning" and "python" are split across chunks, then repeated
+    chunks = ["Built models with machine le", "arning in Pyth", "on. More python and machine learning work."]
+    skills = list(SkillExtractor().extract_skills_stream(chunks))
+    
+    if "machine learning" in skills and "python" in skills and len(skills) == len(set(skills)):
+        print("✅ Streaming skill extraction passed")
+        print(f"Streamed skills: {skills}")
+    else:
+        print(f"❌ Streaming skill extraction failed: {skills}")
+    print()
+
+def test_resume_upload_detailed():
+    """Test detailed extraction with years of experience"""
+    print("Testing detailed resume upload...")
+    
+    content = b"I have 5 years of Python experience.\n3 years of docker\nBuilt APIs with FastAPI\n"
+    files = {'file': ('detailed.txt', content, 'text/plain')}
+    response = requests.post(f"{BASE_URL}/upload-resume", files=files, data={"detailed": "true"})
+    
+    details = {detail["skill"]: detail for detail in response.json().get("skill_details", [])} if response.status_code == 200 else {}
+    if (details.get("python", {}).get("years_experience") == 5 and details.get("docker", {}).get("years_experience") == 3
+            and response.json()["skill_years"] == {"python": 5, "docker": 3}):
+        print("✅ Detailed resume upload passed")
+        print(f"Years of experience: {({skill: detail['years_experience'] for skill, detail in details.items()})}")
+    else:
+        print(f"❌ Detailed resume upload failed: {response.status_code}, {details}")
+    print()
+
+def test_resume_upload_encodings():
+    """Test format sniffing: non-UTF-8 text, text mentioning %PDF-, and binary data named .txt"""
+    print("Testing resume upload encodings...")
+    
+    latin = "Résumé\nCompétences: Python, Docker, SQL\n".encode("cp1252")
+    mention = b"Skills: Python. Wrote a parser for %PDF-1.7 files.\n"
+    png = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + bytes(64)
+    latin_response = requests.post(f"{BASE_URL}/upload-resume", files={'file': ('latin.txt', latin, 'text/plain')})
+    mention_response = requests.post(f"{BASE_URL}/upload-resume", files={'file': ('mention.txt', mention, 'text/plain')})
+    png_response = requests.post(f"{BASE_URL}/upload-resume", files={'file': ('resume.txt', png, 'text/plain')})
+    
+    if (latin_response.status_code == 200 and "docker" in latin_response.json()["extracted_skills"]
+            and mention_response.status_code == 200 and mention_response.json()["format"] == "txt"
+            and png_response.status_code == 400):
+        print("✅ Resume upload encodings passed")
+        print(f"Windows-1252 resume skills: {latin_response.json()['extracted_skills']}")
+    else:
+        print(f"❌ Resume upload encodings failed: {latin_response.status_code}, {mention_response.status_code}, {png_response.status_code}")
+    print()
+
 def create_test_resume():
     """Create a test resume file for testing"""
     test_resume_content = """
@@ -153,9 +480,26 @@ def main():
     # Run tests
     test_health_check()
     test_get_job_roles()
+    test_job_roles_conditional_get()
     test_skill_matching()
+    test_weighted_skill_matching()
+    test_semantic_skill_matching()
+    test_role_transitions()
+    test_skill_gains()
     test_roadmap_generation()
+    test_learning_plan()
+    test_request_coalescing()
+    test_shared_result_cache()
     test_resume_upload()
+    test_resume_upload_detailed()
+    test_resume_upload_encodings()
+    test_resume_upload_ner_sections()
+    test_resume_upload_modes()
+    test_skill_extraction_stream()
+    test_skill_suggestions()
+    test_skill_reverse_index()
+    test_skill_analytics()
+    test_skill_cooccurrence()
     
     print("🎉 All tests completed!")
     print("\nTo run the API server:")
@@ -0,0 +1,414 @@
+import codecs
+import hashlib
+import io
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import zipfile
+import xml.etree.ElementTree as ElementTree
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Tuple
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.txt', '.docx')
+
+# Byte-order marks, longest first so UTF-32 LE is not mistaken for UTF-16 LE
+BOM_ENCODINGS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# sniff_format result for content that is recognizably binary but not a supported format
+UNSUPPORTED = 'unsupported'
+
+# Shortest text worth running charset detection on
+MIN_DETECTION_BYTES = 128
+
+# WordprocessingML element tags used by the streaming DOCX extractor
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+WORD_TEXT = WORD_NAMESPACE + 't'
+WORD_TAB = WORD_NAMESPACE + 'tab'
+WORD_BREAKS = (WORD_NAMESPACE + 'br', WORD_NAMESPACE + 'cr')
+WORD_PARAGRAPH = WORD_NAMESPACE + 'p'
+# Paragraph properties, whose w:tabs/w:tab elements define tab stops rather than tab characters
+WORD_PARAGRAPH_PROPERTIES = WORD_NAMESPACE + 'pPr'
+WORD_TABLE_ROW = WORD_NAMESPACE + 'tr'
+
+# PDFs with at least this many pages have their pages extracted in a process pool
+PARALLEL_PAGE_THRESHOLD = 40
+
+_page_pool = None
+_page_pool_lock = threading.Lock()
+# (path, reader) of the document a page pool process last parsed
+_pool_document = None
+
+def is_supported_file(filename: str) -> bool:
+    """Check whether a file name has a supported resume extension"""
+    return filename.lower().endswith(SUPPORTED_EXTENSIONS)
+
+def sniff_format(content: bytes) -> Optional[str]:
+    """Detect 'pdf', 'docx' or 'txt' from the leading bytes, UNSUPPORTED for other binary data, or None if empty"""
+    head = content[:1024]
+    if not head:
+        return None
+    
+    # Only leading whitespace may precede the header; text that merely mentions "%PDF-" stays text
+    if head.lstrip().startswith(b'%PDF-'):
+        return 'pdf'
+    
+    if head.startswith(b'PK\x03\x04'):
+        try:
+            with zipfile.ZipFile(io.BytesIO(content)) as archive:
+                if 'word/document.xml' in archive.namelist():
+                    return 'docx'
+        except zipfile.BadZipFile:
+            pass
+        return UNSUPPORTED
+    
+    if any(head.startswith(bom) for bom, _ in BOM_ENCODINGS):
+        return 'txt'
+    
+    # NUL bytes mean binary data, unless the text is BOM-less UTF-16
+    if b'\x00' in head and _guess_utf16(head) is None:
+        return UNSUPPORTED
+    return 'txt'
+
+def _guess_utf16(sample: bytes) -> Optional[str]:
+    """Guess BOM-less UTF-16 from NUL bytes alternating with ASCII"""
+    if len(sample) < 4:
+        return None
+    even_nuls = sample[0::2].count(0)
+    odd_nuls = sample[1::2].count(0)
+    half = len(sample) // 2
+    if odd_nuls > half * 0.7 and even_nuls < half * 0.1:
+        return 'utf-16-le'
+    if even_nuls > half * 0.7 and odd_nuls < half * 0.1:
+        return 'utf-16-be'
+    return None
+
+def decode_text(content: bytes) -> str:
+    """
+    Decode plain-text bytes of unknown encoding
+    
+    Tries a BOM, then BOM-less UTF-16 (which is also valid UTF-8 when it is
+    mostly ASCII), then UTF-8 (the common case), then charset detection when charset_normalizer is installed, and finally
+    Windows-1252 with replacement characters so decoding never fails.
+    """
+    for bom, encoding in BOM_ENCODINGS:
+        if content.startswith(bom):
+            return content.decode(encoding, errors='replace')
+    
+    utf16 = _guess_utf16(content[:4096])
+    if utf16:
+        return content.decode(utf16, errors='replace')
+    
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+    
+    # Detection is unreliable on a few words, where Windows-1252 is the better bet
+    if len(content) >= MIN_DETECTION_BYTES:
+        try:
+            from charset_normalizer import from_bytes
+            best = from_bytes(content).best()
+            if best is not None:
+                return str(best)
+        except ImportError:
+            pass
+    
+    return content.decode('cp1252', errors='replace')
+
+def default_page_workers() -> int:
+    """
+    Page extraction processes for this server process
+    
+    PDF_PAGE_WORKERS sets it directly. Otherwise the CPUs are split between
+    the WEB_CONCURRENCY web workers, so all of their pools together use
+    about one process per CPU; one means pages are read in this process.
+    """
+    if os.environ.get("PDF_PAGE_WORKERS"):
+        return max(1, int(os.environ["PDF_PAGE_WORKERS"]))
+    web_workers = max(1, int(os.environ.get("WEB_CONCURRENCY") or 1))
+    return max(1, (os.cpu_count() or 1) // web_workers)
+
+def _get_page_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Get the shared process pool for page extraction, creating it on first use"""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            # Spawned, not forked: the web worker already runs threads, which a fork would copy mid-flight
+            _page_pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        return _page_pool
+
+def _reset_page_pool():
+    """Drop a pool whose processes died, so the next document starts a fresh one"""
+    global _page_pool
+    with _page_pool_lock:
+        _page_pool = None
+
+def _extract_page_range(path: str, start: int, end: int) -> str:
+    """Extract the text of pages [start, end) of the PDF at path in a worker process"""
+    global _pool_document
+    # Each pool process parses a document once, however many of its ranges it gets
+    if _pool_document is None or _pool_document[0] != path:
+        import PyPDF2
+        with open(path, 'rb') as f:
+            _pool_document = (path, PyPDF2.PdfReader(io.BytesIO(f.read())))
+    pdf_reader = _pool_document[1]
+    return "".join(pdf_reader.pages[i].extract_text() + "\n" for i in range(start, end))
+
+def extract_text_from_pdf(content: bytes, max_chars: Optional[int] = None, time_budget: Optional[float] = None,
+                          parallel_threshold: int = PARALLEL_PAGE_THRESHOLD,
+                          max_workers: Optional[int] = None) -> Tuple[str, bool]:
+    """
+    Extract text from PDF content, returning the text and whether time_budget cut it short
+    
+    Documents with at least parallel_threshold pages are split into page ranges
+    extracted in a process pool; results are joined in page order. Extraction
+    stops early, keeping the pages read so far, once max_chars of text have
+    been collected or time_budget seconds have passed. Only the time budget
+    depends on load, so only that cut is reported.
+    """
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+    
+    def out_of_time() -> bool:
+        return deadline is not None and time.monotonic() >= deadline
+    
+    try:
+        # Imported on first use so importing this module stays cheap
+        import PyPDF2
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+        page_count = len(pdf_reader.pages)
+        workers = max_workers or default_page_workers()
+        parts: List[str] = []
+        collected = 0
+        
+        if page_count < parallel_threshold or workers < 2:
+            for number, page in enumerate(pdf_reader.pages, 1):
+                parts.append(page.extract_text() + "\n")
+                collected += len(parts[-1])
+                if max_chars is not None and collected >= max_chars:
+                    break
+                if out_of_time():
+                    return "".join(parts), number < page_count
+            return "".join(parts), False
+        
+        # Several ranges per worker balance uneven pages and let early stopping skip work
+        range_size = max(1, -(-page_count // (workers * 4)))
+        pool = _get_page_pool(workers)
+        # Pool processes read the document from a file rather than each task carrying a copy
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+            f.write(content)
+        futures = []
+        timed_out = False
+        try:
+            futures = [
+                pool.submit(_extract_page_range, f.name, start, min(start + range_size, page_count))
+                for start in range(0, page_count, range_size)
+            ]
+            for number, future in enumerate(futures, 1):
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                parts.append(future.result(timeout=remaining))
+                collected += len(parts[-1])
+                if max_chars is not None and collected >= max_chars:
+                    break
+                if out_of_time():
+                    timed_out = number < len(futures)
+                    break
+        except FutureTimeoutError:
+            timed_out = True
+        except BrokenProcessPool:
+            _reset_page_pool()
+            raise
+        finally:
+            for future in futures:
+                future.cancel()
+            try:
+                os.remove(f.name)
+            except OSError:
+                pass
+        return "".join(parts), timed_out
+    except Exception as e:
+        raise ValueError(f"Error reading PDF: {str(e)}")
+
+def extract_text_from_docx(content: bytes) -> str:
+    """Extract text from DOCX content, including tables"""
+    try:
+        return extract_text_from_docx_xml(content)
+    except Exception:
+        # Fall back to the full python-docx object model
+        pass
+    
+    try:
+        from docx import Document
+        doc = Document(io.BytesIO(content))
+        parts = [paragraph.text + "\n" for paragraph in doc.paragraphs]
+        for table in doc.tables:
+            for row in table.rows:
+                parts.extend(cell.text + "\n" for cell in row.cells)
+        return "".join(parts)
+    except Exception as e:
+        raise ValueError(f"Error reading DOCX: {str(e)}")
+
+def extract_text_from_docx_xml(content: bytes) -> str:
+    """
+    Extract paragraph and table-cell text by streaming word/document.xml
+    
+    Parses the XML incrementally and clears each paragraph once its text is
+    collected, without building python-docx's object model. Table cells are
+    paragraphs too, so their text comes out in document order.
+    """
+    parts: List[str] = []
+    in_properties = 0
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        with archive.open('word/document.xml') as document_xml:
+            for event, element in ElementTree.iterparse(document_xml, events=('start', 'end')):
+                tag = element.tag
+                if tag == WORD_PARAGRAPH_PROPERTIES:
+                    in_properties += 1 if event == 'start' else -1
+                    continue
+                if event == 'start':
+                    continue
+                if tag == WORD_TEXT:
+                    if element.text:
+                        parts.append(element.text)
+                elif tag == WORD_TAB:
+                    if not in_properties:
+                        parts.append("\t")
+                elif tag in WORD_BREAKS:
+                    parts.append("\n")
+                elif tag == WORD_PARAGRAPH:
+                    parts.append("\n")
+                    element.clear()
+                elif tag == WORD_TABLE_ROW:
+                    element.clear()
+    return "".join(parts)
+
+def detect_format(filename: str, content: bytes) -> Optional[str]:
+    """Detect the file format from its content, falling back to the file extension; None if unsupported"""
+    detected = sniff_format(content)
+    if detected == UNSUPPORTED:
+        # Binary data is not a resume whatever the file is called
+        return None
+    if detected is not None:
+        return detected
+    name = (filename or "").lower()
+    for extension in SUPPORTED_EXTENSIONS:
+        if name.endswith(extension):
+            return extension[1:]
+    return None
+
+def extract_text(filename: str, content: bytes, **pdf_options) -> Tuple[str, bool]:
+    """Extract text from a PDF, TXT or DOCX file, detecting the format from its bytes; returns (text, timed out)"""
+    file_format = detect_format(filename, content)
+    if file_format == 'pdf':
+        return extract_text_from_pdf(content, **pdf_options)
+    elif file_format == 'docx':
+        return extract_text_from_docx(content), False
+    elif file_format == 'txt':
+        return decode_text(content), False
+    raise ValueError("Only PDF, TXT, and DOCX files are supported")
+
+class TextCache:
+    """
+    Cache of extracted plain text keyed by a hash of the file content
+    
+    Kept separate from any skill results, so when the skill vocabulary changes
+    extraction can re-run on cached text without parsing the PDF/DOCX again.
+    Holds up to max_chars of text in memory (least recently used first out)
+    and, with a cache directory, also persists text on disk for other workers
+    and restarts.
+    """
+    
+    def __init__(self, max_chars: int = 50_000_000, cache_dir: Optional[str] = None):
+        """Initialize an empty cache"""
+        self.max_chars = max_chars
+        self.cache_dir = cache_dir
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def content_key(content: bytes) -> str:
+        """Hash of the raw file bytes"""
+        return hashlib.sha256(content).hexdigest()
+    
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.txt")
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get cached text for a content hash"""
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                return text
+        
+        if self.cache_dir:
+            try:
+                with open(self._disk_path(key), 'r', encoding='utf-8') as f:
+                    text = f.read()
+                self._remember(key, text)
+                return text
+            except OSError:
+                pass
+        return None
+    
+    def put(self, key: str, text: str):
+        """Store extracted text for a content hash"""
+        self._remember(key, text)
+        if self.cache_dir:
+            path = self._disk_path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(tmp_path, path)
+            except OSError:
+                pass
+    
+    def _remember(self, key: str, text: str):
+        """Add text to the in-memory LRU, evicting old entries over the size bound"""
+        if len(text) > self.max_chars:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = text
+            self._size += len(text)
+            while self._size > self.max_chars:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+    
+    def get_or_extract(self, filename: str, content: bytes, **pdf_options) -> Tuple[str, bool]:
+        """
+        Get text for file content from the cache, extracting it on a miss; returns (text, partial)
+        
+        Text cut short by the PDF time budget is returned as partial and not
+        cached, since a later upload may well have time to read it all.
+        """
+        key = self.content_key(content)
+        if pdf_options:
+            # Early-stopped extraction is not the full text, so it gets its own entry
+            key += ":" + ",".join(f"{name}={value}" for name, value in sorted(pdf_options.items()))
+        text = self.get(key)
+        if text is not None:
+            self.hits += 1
+            return text, False
+        
+        self.misses += 1
+        text, partial = extract_text(filename, content, **pdf_options)
+        if not partial:
+            self.put(key, text)
+        return text, partial